@@ -24,6 +24,35 @@ from docs_translator.translator.core import Translator, TranslationResult
 console = Console()
 
 
+def _clear_cache(cache_dir: Path) -> bool:
+    """Delete the translation cache, keeping the jobs of batch runs not yet collected.
+
+    The job store lives in the cache directory, but only holds the IDs
+    needed to fetch results the provider has already been paid for.
+
+    Returns:
+        True if there was a cache to clear
+    """
+    from docs_translator.translator.batchjob import BatchJobStore
+
+    if not cache_dir.exists():
+        return False
+    for path in cache_dir.iterdir():
+        if path.name == BatchJobStore.FILENAME:
+            continue
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+    pending = BatchJobStore(str(cache_dir)).load()
+    if pending:
+        console.print(
+            f"[dim]Kept {len(pending)} batch job(s) not yet collected; "
+            "run 'docs-translator batch collect' to fetch them[/dim]"
+        )
+    return True
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="docs-translator")
 def cli():
@@ -71,6 +100,9 @@ def config_show():
     api_key = cfg.get_api_key()
     if api_key:
         masked = api_key[:4] + "..." + api_key[-4:] if len(api_key) > 8 else "***"
+        key_count = len(cfg.get_active_provider().get_api_keys(cfg.active_provider))
+        if key_count > 1:
+            masked += f" (+{key_count - 1} more)"
         provider_table.add_row("API Key", f"[green]{masked}[/green]")
     else:
         provider_table.add_row("API Key", "[red]Not configured[/red]")
@@ -83,6 +115,18 @@ def config_show():
     console.print(provider_table)
     console.print()
 
+    # Provider pool
+    if cfg.provider_pool:
+        pool_table = Table(title="Provider Pool", box=None)
+        pool_table.add_column("Provider", style="cyan")
+        pool_table.add_column("Model")
+        pool_table.add_column("Weight")
+        for member in cfg.provider_pool:
+            model = member.model or cfg.get_model(member.provider)
+            pool_table.add_row(member.provider, model, f"{member.weight:g}")
+        console.print(pool_table)
+        console.print()
+
     # Translation settings
     trans_table = Table(title="Translation Settings", box=None)
     trans_table.add_column("Setting", style="cyan")
@@ -164,7 +208,9 @@ def config_remove_term(term: str):
 @config.command("cache")
 @click.option("--clear", is_flag=True, help="Clear the translation cache")
 @click.option("--show", is_flag=True, help="Show cache statistics")
-def config_cache(clear: bool, show: bool):
+@click.option("--evict", is_flag=True, help="Apply the configured eviction policy")
+@click.option("--evict-model", multiple=True, help="Evict all entries produced by a model")
+def config_cache(clear: bool, show: bool, evict: bool, evict_model: tuple):
     """Manage translation cache.
     
     Examples:
@@ -174,13 +220,35 @@ def config_cache(clear: bool, show: bool):
         
         # Clear cache
         docs-translator config cache --clear
+
+        # Drop entries from a retired model
+        docs-translator config cache --evict-model gpt-3.5-turbo
     """
     cache_dir = Path.cwd() / ".translation_cache"
-    
+
+    if evict or evict_model:
+        from dataclasses import replace
+        from docs_translator.translator.core import TranslationMemory
+
+        cfg = TranslatorConfig.load()
+        policy = replace(
+            cfg.cache_eviction,
+            evict_models=list(cfg.cache_eviction.evict_models) + list(evict_model),
+        )
+        memory = TranslationMemory(cfg.cache_dir, backend=cfg.cache_backend)
+        removed = memory.evict(policy)
+        memory.backend.close()
+        console.print(f"[green]Evicted {removed} cache entries[/green]")
+        return
+
     if show or (not clear and not show):
         # Show cache stats
         if cache_dir.exists():
-            cache_files = list(cache_dir.glob("*.json"))
+            from docs_translator.translator.storage import BACKENDS
+
+            # Memory files of every backend, plus the JSON manifest and batch jobs
+            suffixes = {".json"}.union(*(b.FILE_SUFFIXES for b in BACKENDS.values()))
+            cache_files = [f for f in cache_dir.iterdir() if f.suffix in suffixes]
             total_size = sum(f.stat().st_size for f in cache_files)
             
             table = Table(title="Cache Statistics", box=None)
@@ -198,8 +266,7 @@ def config_cache(clear: bool, show: bool):
             console.print("[dim]No cache directory found[/dim]")
     
     if clear:
-        if cache_dir.exists():
-            shutil.rmtree(cache_dir)
+        if _clear_cache(cache_dir):
             console.print("[green]Cache cleared successfully[/green]")
             info("Translation cache cleared")
         else:
@@ -313,11 +380,25 @@ def config_set_key(provider: Optional[str]):
 @click.option("--target", "-t", required=True, help="Target language code (e.g., en)")
 @click.option("--recursive", "-r", is_flag=True, help="Process subdirectories")
 @click.option("--dry-run", is_flag=True, help="Preview without translating")
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Translate files in full, even if their output is up to date or partly reusable",
+)
 @click.option("--no-cache", is_flag=True, help="Disable translation cache")
 @click.option("--clear-cache", is_flag=True, help="Clear cache before translating")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--provider", type=click.Choice(["gemini", "openai", "claude"]), help="Override provider")
 @click.option("--model", help="Override model")
+@click.option("--concurrency", type=click.IntRange(min=1),
+              help="Parallel API requests (starting value if adaptive)")
+@click.option("--batch-size", type=click.IntRange(min=1),
+              help="Segments per API request (1 = no batching)")
+@click.option("--jobs", "-j", type=click.IntRange(min=1),
+              help="Worker processes for parsing, cache lookups and output in directory runs")
+@click.option("--batch-job", is_flag=True,
+              help="Submit cache misses as a provider batch job; "
+                   "collect later with 'batch collect'")
 def translate(
     file_path: Optional[str],
     dir_path: Optional[str],
@@ -326,11 +407,16 @@ def translate(
     target: str,
     recursive: bool,
     dry_run: bool,
+    force: bool,
     no_cache: bool,
     clear_cache: bool,
     verbose: bool,
     provider: Optional[str],
     model: Optional[str],
+    concurrency: Optional[int],
+    batch_size: Optional[int],
+    jobs: Optional[int],
+    batch_job: bool,
 ):
     """Translate Markdown documentation.
 
@@ -347,10 +433,24 @@ def translate(
 
         # Preview without translating
         docs-translator translate --file doc.md --target en --dry-run
+
+        # Re-translate a directory even where nothing changed
+        docs-translator translate --dir docs/ --target en --recursive --force
+
+        # Large tree: parse and reassemble on 8 processes
+        docs-translator translate --dir docs/ --target en --recursive --jobs 8
+
+        # Submit as an offline batch job (cheaper, results within 24h)
+        docs-translator translate --dir docs/ --target en --recursive --batch-job
     """
     if not file_path and not dir_path:
         console.print("[red]Error: Please specify --file or --dir[/red]")
         sys.exit(1)
+    if batch_job and (dry_run or no_cache):
+        console.print(
+            "[red]Error: --batch-job cannot be combined with --dry-run or --no-cache[/red]"
+        )
+        sys.exit(1)
 
     # Configure logging
     if verbose:
@@ -359,23 +459,33 @@ def translate(
 
     # Clear cache if requested
     if clear_cache:
-        cache_dir = Path.cwd() / ".translation_cache"
-        if cache_dir.exists():
-            shutil.rmtree(cache_dir)
+        if _clear_cache(Path.cwd() / ".translation_cache"):
             console.print("[yellow]Cache cleared[/yellow]")
             info("Translation cache cleared")
 
     # Load config
     cfg = TranslatorConfig.load()
 
-    # Apply overrides
+    # Apply overrides; an explicit provider or model replaces the pool
     if provider:
         cfg.switch_provider(provider)
     if model:
         cfg.set_model(model)
+    if provider or model or batch_job:
+        cfg.provider_pool = []
+    if concurrency:
+        cfg.concurrency = concurrency
+    if batch_size:
+        cfg.batch_size = batch_size
+    if jobs:
+        cfg.jobs = jobs
 
     # Check API key
-    if not dry_run and not cfg.get_api_key():
+    pool_has_key = any(
+        cfg.get_provider_config(member.provider).get_api_key(member.provider)
+        for member in cfg.provider_pool
+    )
+    if not dry_run and not cfg.get_api_key() and not pool_has_key:
         console.print("[red]Error: No API key configured.[/red]")
         console.print("Run [cyan]docs-translator configure[/cyan] to set up.")
         sys.exit(1)
@@ -383,7 +493,16 @@ def translate(
     # Create translator
     translator = Translator(config=cfg, use_cache=not no_cache)
 
-    if file_path:
+    if batch_job:
+        _submit_batch_job(
+            translator=translator,
+            input_path=file_path or dir_path,
+            output_path=output,
+            source_lang=source,
+            target_lang=target,
+            recursive=recursive,
+        )
+    elif file_path:
         # Single file translation
         _translate_file(
             translator=translator,
@@ -392,6 +511,7 @@ def translate(
             source_lang=source,
             target_lang=target,
             dry_run=dry_run,
+            force=force,
         )
     else:
         # Directory translation
@@ -403,6 +523,7 @@ def translate(
             target_lang=target,
             recursive=recursive,
             dry_run=dry_run,
+            force=force,
         )
 
 
@@ -413,6 +534,7 @@ def _translate_file(
     source_lang: Optional[str],
     target_lang: str,
     dry_run: bool,
+    force: bool,
 ):
     """Translate a single file with progress display."""
     console.print()
@@ -444,6 +566,7 @@ def _translate_file(
             target_lang=target_lang,
             dry_run=dry_run,
             progress_callback=update_progress if not dry_run else None,
+            force=force,
         )
 
         progress.update(task, completed=100)
@@ -459,6 +582,7 @@ def _translate_directory(
     target_lang: str,
     recursive: bool,
     dry_run: bool,
+    force: bool,
 ):
     """Translate a directory of files."""
     console.print()
@@ -480,11 +604,114 @@ def _translate_directory(
         recursive=recursive,
         dry_run=dry_run,
         show_progress=True,
+        force=force,
     )
 
     _show_batch_results(results, dry_run)
 
 
+def _submit_batch_job(
+    translator: Translator,
+    input_path: str,
+    output_path: Optional[str],
+    source_lang: Optional[str],
+    target_lang: str,
+    recursive: bool,
+):
+    """Submit cache misses as batch jobs and report their IDs."""
+    console.print()
+    try:
+        jobs = translator.submit_batch_job(
+            input_path=input_path,
+            output_path=output_path,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            recursive=recursive,
+        )
+    except Exception as e:
+        console.print(f"[red]Batch submission failed: {e}[/red]")
+        sys.exit(1)
+
+    if not jobs:
+        console.print(
+            "[green]Everything is already cached.[/green] "
+            "Run [cyan]docs-translator batch collect[/cyan] to render the output."
+        )
+        return
+
+    for job in jobs:
+        console.print(f"[cyan]Submitted:[/cyan] {job.job_id} ({len(job.requests)} requests)")
+    console.print()
+    console.print("Run [cyan]docs-translator batch collect[/cyan] once the jobs have finished.")
+
+
+@cli.group()
+def batch():
+    """Manage offline batch jobs."""
+    pass
+
+
+@batch.command("status")
+def batch_status():
+    """Show submitted batch jobs that have not been collected."""
+    from docs_translator.translator.batchjob import BatchJobStore
+
+    cfg = TranslatorConfig.load()
+    jobs = BatchJobStore(cfg.cache_dir).load()
+    if not jobs:
+        console.print("[dim]No pending batch jobs[/dim]")
+        return
+
+    table = Table(title="Pending Batch Jobs", box=None)
+    table.add_column("Job", style="cyan")
+    table.add_column("Provider")
+    table.add_column("Requests", justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Submitted")
+    for job in jobs:
+        table.add_row(
+            job.job_id,
+            job.provider,
+            str(len(job.requests)),
+            str(len(job.files)),
+            job.created_at[:19],
+        )
+    console.print(table)
+
+
+@batch.command("collect")
+@click.option("--wait", is_flag=True, help="Poll until every job has finished")
+@click.option("--poll-interval", type=click.FloatRange(min=1), default=60.0, show_default=True,
+              help="Seconds between polls with --wait")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+def batch_collect(wait: bool, poll_interval: float, verbose: bool):
+    """Fetch finished batch jobs into the cache and write the output files.
+
+    Examples:
+
+        # Collect whatever has finished
+        docs-translator batch collect
+
+        # Block until all jobs are done (e.g. in a nightly pipeline)
+        docs-translator batch collect --wait --poll-interval 300
+    """
+    if verbose:
+        configure_logging(level="DEBUG", verbose=True)
+
+    cfg = TranslatorConfig.load()
+    translator = Translator(config=cfg)
+    try:
+        results = translator.collect_batch_jobs(wait=wait, poll_interval=poll_interval)
+    except Exception as e:
+        console.print(f"[red]Batch collection failed: {e}[/red]")
+        sys.exit(1)
+
+    if results:
+        _show_batch_results(results, dry_run=False)
+    else:
+        console.print("[dim]No finished batch jobs to collect[/dim]")
+
+
 def _show_result(result: TranslationResult, dry_run: bool):
     """Display translation result."""
     console.print()
@@ -507,12 +734,19 @@ def _show_result(result: TranslationResult, dry_run: bool):
     table.add_column("Value", justify="right")
 
     table.add_row("Total blocks", str(result.total_blocks))
+    if result.reused_blocks:
+        table.add_row("Unchanged (kept from output)", str(result.reused_blocks))
     if dry_run:
         table.add_row("Would translate", str(result.translated_blocks))
         table.add_row("Cached (skip API)", str(result.cached_blocks))
     else:
         table.add_row("Translated", str(result.translated_blocks))
         table.add_row("From cache", str(result.cached_blocks))
+        table.add_row("Concurrency window", _format_window(result))
+        if result.cached_input_tokens:
+            table.add_row("Cached input tokens", _format_cached_tokens(result))
+        if result.hedged_requests:
+            table.add_row("Hedged requests", _format_hedges(result))
     table.add_row("Skipped", str(result.skipped_blocks))
     table.add_row("Duration", f"{result.duration_seconds:.2f}s")
 
@@ -520,6 +754,29 @@ def _show_result(result: TranslationResult, dry_run: bool):
     console.print()
 
 
+def _format_window(result: TranslationResult) -> str:
+    """Final window and what made it shrink, e.g. '4 (3 rate limits, 1 latency spike)'."""
+    causes = []
+    counts = ((result.throttles, "rate limit"), (result.latency_spikes, "latency spike"))
+    for count, label in counts:
+        if count:
+            causes.append(f"{count} {label}" + ("s" if count > 1 else ""))
+    if not causes:
+        return str(result.concurrency_window)
+    return f"{result.concurrency_window} ({', '.join(causes)})"
+
+
+def _format_cached_tokens(result: TranslationResult) -> str:
+    """Cached share of the input tokens, e.g. '12,000 / 20,000 (60%)'."""
+    share = result.cached_input_tokens / result.input_tokens * 100
+    return f"{result.cached_input_tokens:,} / {result.input_tokens:,} ({share:.0f}%)"
+
+
+def _format_hedges(result: TranslationResult) -> str:
+    """Duplicated requests and how many of them answered first, e.g. '12 (9 faster)'."""
+    return f"{result.hedged_requests} ({result.hedge_wins} faster)"
+
+
 def _show_batch_results(results: list[TranslationResult], dry_run: bool):
     """Display batch translation results."""
     console.print()
@@ -542,12 +799,27 @@ def _show_batch_results(results: list[TranslationResult], dry_run: bool):
     total_blocks = sum(r.total_blocks for r in results)
     total_translated = sum(r.translated_blocks for r in results)
     total_cached = sum(r.cached_blocks for r in results)
-    total_duration = sum(r.duration_seconds for r in results)
+    # Files are translated together; each duration runs from the start of the run
+    total_duration = max((r.duration_seconds for r in results), default=0.0)
 
+    up_to_date = sum(1 for r in results if r.up_to_date)
     table.add_row("Files processed", str(len(results)))
+    if up_to_date:
+        table.add_row("Up to date (skipped)", str(up_to_date))
     table.add_row("Total blocks", str(total_blocks))
+    total_reused = sum(r.reused_blocks for r in results)
+    if total_reused:
+        table.add_row("Unchanged (kept from output)", str(total_reused))
     table.add_row("Translated", str(total_translated))
     table.add_row("From cache", str(total_cached))
+    if not dry_run and results:
+        # The file finished last carries the totals for the run
+        last = max(results, key=lambda r: r.duration_seconds)
+        table.add_row("Concurrency window", _format_window(last))
+        if last.cached_input_tokens:
+            table.add_row("Cached input tokens", _format_cached_tokens(last))
+        if last.hedged_requests:
+            table.add_row("Hedged requests", _format_hedges(last))
     table.add_row("Total duration", f"{total_duration:.2f}s")
 
     console.print(table)
@@ -1,6 +1,22 @@
 """Configuration management package."""
 
-from docs_translator.config.manager import TranslatorConfig, ProviderConfig
+from docs_translator.config.manager import (
+    EvictionPolicy,
+    HedgeSettings,
+    HttpSettings,
+    PoolMember,
+    ProviderConfig,
+    TranslatorConfig,
+)
 from docs_translator.config.models import ModelInfo, ModelRegistry
 
-__all__ = ["TranslatorConfig", "ProviderConfig", "ModelInfo", "ModelRegistry"]
+__all__ = [
+    "TranslatorConfig",
+    "ProviderConfig",
+    "EvictionPolicy",
+    "HttpSettings",
+    "HedgeSettings",
+    "PoolMember",
+    "ModelInfo",
+    "ModelRegistry",
+]
@@ -4,7 +4,7 @@ import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -24,6 +24,41 @@ DEFAULT_MODELS = {
 }
 
 
+def _split_keys(value: str) -> List[str]:
+    """Split a list of API keys separated by commas or newlines, dropping duplicates."""
+    keys = [key.strip() for key in value.replace("\n", ",").split(",")]
+    return list(dict.fromkeys(key for key in keys if key))
+
+
+@dataclass
+class HedgeSettings:
+    """Duplicate requests that are slower than usual to cut tail latency."""
+
+    enabled: bool = False
+    quantile: float = 0.95  # Latency quantile after which a duplicate is sent
+    max_extra: float = 0.05  # Cap on duplicates, as a share of requests
+    min_samples: int = 20  # Requests observed per model before hedging starts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for YAML serialization."""
+        return {
+            "enabled": self.enabled,
+            "quantile": self.quantile,
+            "max_extra": self.max_extra,
+            "min_samples": self.min_samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HedgeSettings":
+        """Create from dictionary."""
+        return cls(
+            enabled=data.get("enabled", False),
+            quantile=data.get("quantile", 0.95),
+            max_extra=data.get("max_extra", 0.05),
+            min_samples=data.get("min_samples", 20),
+        )
+
+
 @dataclass
 class ProviderConfig:
     """Configuration for a single API provider."""
@@ -32,30 +67,51 @@ class ProviderConfig:
     api_key_env: str = ""
     model: str = ""
     validated_at: Optional[str] = None
+    rpm_limit: Optional[int] = None  # Per API key; None = registry default, 0 = unlimited
+    tpm_limit: Optional[int] = None
+    base_url: Optional[str] = None  # API endpoint override (proxy, local test server)
+    hedging: Optional[HedgeSettings] = None  # None = the global hedging settings
 
     def get_api_key(self, provider_name: str) -> Optional[str]:
-        """Retrieve API key based on configured source."""
+        """Retrieve API key based on configured source (the first one if several)."""
+        keys = self.get_api_keys(provider_name)
+        return keys[0] if keys else None
+
+    def get_api_keys(self, provider_name: str) -> List[str]:
+        """Retrieve all API keys based on configured source.
+
+        Several keys, e.g. from projects with separate quotas, are given as
+        a comma-separated environment variable, one key per line in the key
+        file, or numbered keyring entries (``<provider>``, ``<provider>:2``, ...).
+        """
         # Priority 1: Environment variable (always check first for CI/CD)
         env_var = self._get_env_var_name(provider_name)
         if os.getenv(env_var):
-            return os.getenv(env_var)
+            return _split_keys(os.getenv(env_var))
 
         # Priority 2: Configured source
         if self.api_key_source == "env" and self.api_key_env:
-            return os.getenv(self.api_key_env)
+            return _split_keys(os.getenv(self.api_key_env, ""))
 
         elif self.api_key_source == "keyring" and KEYRING_AVAILABLE:
+            keys = []
             try:
-                return keyring.get_password("docs-translator", provider_name)
+                while True:
+                    entry = provider_name if not keys else f"{provider_name}:{len(keys) + 1}"
+                    key = keyring.get_password("docs-translator", entry)
+                    if not key:
+                        break
+                    keys.append(key)
             except Exception:
                 pass
+            return keys
 
         elif self.api_key_source == "file":
             key_file = Path.home() / ".docs-translator" / f"{provider_name}.key"
             if key_file.exists():
-                return key_file.read_text().strip()
+                return _split_keys(key_file.read_text())
 
-        return None
+        return []
 
     def save_api_key(
         self, provider_name: str, api_key: str, source: str = "keyring"
@@ -135,6 +191,10 @@ class ProviderConfig:
             "api_key_env": self.api_key_env,
             "model": self.model,
             "validated_at": self.validated_at,
+            "rpm_limit": self.rpm_limit,
+            "tpm_limit": self.tpm_limit,
+            "base_url": self.base_url,
+            "hedging": self.hedging.to_dict() if self.hedging else None,
         }
 
     @classmethod
@@ -145,6 +205,103 @@ class ProviderConfig:
             api_key_env=data.get("api_key_env", ""),
             model=data.get("model", ""),
             validated_at=data.get("validated_at"),
+            rpm_limit=data.get("rpm_limit"),
+            tpm_limit=data.get("tpm_limit"),
+            base_url=data.get("base_url"),
+            hedging=HedgeSettings.from_dict(data["hedging"]) if data.get("hedging") else None,
+        )
+
+
+@dataclass
+class PoolMember:
+    """One provider and model in a load-balanced provider pool."""
+
+    provider: str
+    model: str = ""  # Empty = the provider's configured model
+    weight: float = 1.0  # Relative share of requests
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for YAML serialization."""
+        return {"provider": self.provider, "model": self.model, "weight": self.weight}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PoolMember":
+        """Create from dictionary."""
+        return cls(
+            provider=data["provider"],
+            model=data.get("model", ""),
+            weight=data.get("weight", 1.0),
+        )
+
+
+@dataclass
+class EvictionPolicy:
+    """Bounds for the translation memory. Zero or empty means unlimited."""
+
+    max_entries: int = 0
+    max_bytes: int = 0
+    ttl_days: float = 0.0
+    evict_models: List[str] = field(default_factory=list)
+    strategy: str = "lru"  # lru (least recently hit) | lfu (fewest hits)
+
+    def is_active(self) -> bool:
+        """Check if any bound is configured."""
+        return bool(self.max_entries or self.max_bytes or self.ttl_days or self.evict_models)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for YAML serialization."""
+        return {
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_days": self.ttl_days,
+            "evict_models": self.evict_models,
+            "strategy": self.strategy,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EvictionPolicy":
+        """Create from dictionary."""
+        return cls(
+            max_entries=data.get("max_entries", 0),
+            max_bytes=data.get("max_bytes", 0),
+            ttl_days=data.get("ttl_days", 0.0),
+            evict_models=data.get("evict_models", []),
+            strategy=data.get("strategy", "lru"),
+        )
+
+
+@dataclass
+class HttpSettings:
+    """Shared HTTP connection pool used by the provider SDKs."""
+
+    max_connections: int = 32  # Keep at or above max_concurrency
+    max_keepalive_connections: int = 32
+    keepalive_expiry: float = 30.0  # Seconds an idle connection is kept open
+    connect_timeout: float = 10.0
+    read_timeout: float = 120.0  # Per request, including generation time
+    http2: bool = True  # Used when the h2 package is installed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for YAML serialization."""
+        return {
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
+            "http2": self.http2,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HttpSettings":
+        """Create from dictionary."""
+        return cls(
+            max_connections=data.get("max_connections", 32),
+            max_keepalive_connections=data.get("max_keepalive_connections", 32),
+            keepalive_expiry=data.get("keepalive_expiry", 30.0),
+            connect_timeout=data.get("connect_timeout", 10.0),
+            read_timeout=data.get("read_timeout", 120.0),
+            http2=data.get("http2", True),
         )
 
 
@@ -155,15 +312,31 @@ class TranslatorConfig:
     version: str = "1.0"
     active_provider: str = "gemini"
     providers: Dict[str, ProviderConfig] = field(default_factory=dict)
+    provider_pool: List[PoolMember] = field(default_factory=list)  # Empty = active provider only
     translation_style: str = "literal"
+    segmentation: str = "none"  # none | sentence
+    masking: bool = True  # Replace code, URLs, IDs and preserve terms with placeholders
     temperature: float = 0.3
     max_tokens: int = 4096
+    concurrency: int = 4  # Parallel requests (initial window if adaptive)
+    max_concurrency: int = 16  # Upper bound of the adaptive window
+    adaptive_concurrency: bool = True  # AIMD window driven by 429s and latency
+    batch_size: int = 1  # Segments per request (1 = no batching)
+    jobs: int = 1  # Worker processes for parsing, lookups and assembly in directory runs
+    prompt_caching: bool = True  # Provider-side caching of the system prompt
+    prompt_cache_ttl: int = 300  # Seconds Gemini keeps cached content
+    http: HttpSettings = field(default_factory=HttpSettings)
+    hedging: HedgeSettings = field(default_factory=HedgeSettings)
     default_source_lang: str = "vi"
     default_target_lang: str = "en"
     preserve_terms: List[str] = field(default_factory=list)
     input_dir: str = "docs"
     output_dir: str = "docs/translated"
     cache_dir: str = ".translation_cache"
+    cache_backend: str = "sqlite"  # sqlite | journal | json
+    cache_eviction: EvictionPolicy = field(default_factory=EvictionPolicy)
+    fuzzy_threshold: float = 0.0  # 0 disables fuzzy matching
+    fuzzy_reuse_threshold: float = 1.0  # Reuse a fuzzy match without an API call
     config_path: Optional[Path] = None
 
     # Configuration file search locations
@@ -250,20 +423,37 @@ class TranslatorConfig:
         translation = data.get("translation", {})
         languages = data.get("languages", {})
         directories = data.get("directories", {})
+        memory = data.get("translation_memory", {})
 
         return cls(
             version=data.get("version", "1.0"),
             active_provider=providers_data.get("active", "gemini"),
             providers=providers,
+            provider_pool=[PoolMember.from_dict(m) for m in providers_data.get("pool", [])],
             translation_style=translation.get("style", "literal"),
+            segmentation=translation.get("segmentation", "none"),
+            masking=translation.get("masking", True),
             temperature=translation.get("temperature", 0.3),
             max_tokens=translation.get("max_tokens", 4096),
+            concurrency=translation.get("concurrency", 4),
+            max_concurrency=translation.get("max_concurrency", 16),
+            adaptive_concurrency=translation.get("adaptive_concurrency", True),
+            batch_size=translation.get("batch_size", 1),
+            jobs=translation.get("jobs", 1),
+            prompt_caching=translation.get("prompt_caching", True),
+            prompt_cache_ttl=translation.get("prompt_cache_ttl", 300),
+            http=HttpSettings.from_dict(data.get("http", {})),
+            hedging=HedgeSettings.from_dict(data.get("hedging", {})),
             default_source_lang=languages.get("default_source", "vi"),
             default_target_lang=languages.get("default_target", "en"),
             preserve_terms=data.get("preserve_terms", cls.DEFAULT_PRESERVE_TERMS.copy()),
             input_dir=directories.get("input", "docs"),
             output_dir=directories.get("output", "docs/translated"),
             cache_dir=directories.get("cache", ".translation_cache"),
+            cache_backend=memory.get("backend", "sqlite"),
+            cache_eviction=EvictionPolicy.from_dict(memory),
+            fuzzy_threshold=memory.get("fuzzy_threshold", 0.0),
+            fuzzy_reuse_threshold=memory.get("fuzzy_reuse_threshold", 1.0),
         )
 
     def save(self, path: Optional[Path] = None):
@@ -291,15 +481,27 @@ class TranslatorConfig:
         providers_dict = {"active": self.active_provider}
         for name, config in self.providers.items():
             providers_dict[name] = config.to_dict()
+        providers_dict["pool"] = [member.to_dict() for member in self.provider_pool]
 
         return {
             "version": self.version,
             "providers": providers_dict,
             "translation": {
                 "style": self.translation_style,
+                "segmentation": self.segmentation,
+                "masking": self.masking,
                 "temperature": self.temperature,
                 "max_tokens": self.max_tokens,
+                "concurrency": self.concurrency,
+                "max_concurrency": self.max_concurrency,
+                "adaptive_concurrency": self.adaptive_concurrency,
+                "batch_size": self.batch_size,
+                "jobs": self.jobs,
+                "prompt_caching": self.prompt_caching,
+                "prompt_cache_ttl": self.prompt_cache_ttl,
             },
+            "http": self.http.to_dict(),
+            "hedging": self.hedging.to_dict(),
             "languages": {
                 "default_source": self.default_source_lang,
                 "default_target": self.default_target_lang,
@@ -310,6 +512,12 @@ class TranslatorConfig:
                 "output": self.output_dir,
                 "cache": self.cache_dir,
             },
+            "translation_memory": {
+                "backend": self.cache_backend,
+                **self.cache_eviction.to_dict(),
+                "fuzzy_threshold": self.fuzzy_threshold,
+                "fuzzy_reuse_threshold": self.fuzzy_reuse_threshold,
+            },
         }
 
     def get_active_provider(self) -> ProviderConfig:
@@ -331,15 +539,41 @@ class TranslatorConfig:
         provider = self.get_active_provider()
         return provider.get_api_key(self.active_provider)
 
-    def get_model(self) -> str:
-        """Get model for active provider."""
-        provider = self.get_active_provider()
+    def get_model(self, provider_name: Optional[str] = None) -> str:
+        """Get model for a provider (default: the active provider)."""
+        provider_name = provider_name or self.active_provider
+        provider = self.get_provider_config(provider_name)
         if provider.model:
             return provider.model
         # Return default model for provider
         from docs_translator.config.models import ModelRegistry
 
-        return ModelRegistry.get_default_model(self.active_provider)
+        return ModelRegistry.get_default_model(provider_name)
+
+    def get_hedging(self, provider_name: Optional[str] = None) -> HedgeSettings:
+        """Get hedging settings for a provider: its own if set, else the global ones."""
+        provider_name = provider_name or self.active_provider
+        return self.get_provider_config(provider_name).hedging or self.hedging
+
+    def get_rate_limits(
+        self, provider_name: Optional[str] = None, model: Optional[str] = None
+    ) -> Tuple[int, int]:
+        """Get (requests per minute, tokens per minute) for a provider and model.
+
+        Defaults to the active provider and its model. Limits set in the
+        provider config win; otherwise the model's registry defaults apply.
+        0 means unlimited.
+        """
+        from docs_translator.config.models import ModelRegistry
+
+        provider_name = provider_name or self.active_provider
+        provider = self.get_provider_config(provider_name)
+        rpm, tpm = ModelRegistry.get_rate_limits(model or self.get_model(provider_name))
+        if provider.rpm_limit is not None:
+            rpm = provider.rpm_limit
+        if provider.tpm_limit is not None:
+            tpm = provider.tpm_limit
+        return rpm, tpm
 
     def switch_provider(self, provider_name: str):
         """Switch to a different API provider."""
@@ -1,7 +1,7 @@
 """Model registry with metadata for all supported LLM models."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -18,6 +18,8 @@ class ModelInfo:
     best_for: str
     recommended: bool = False
     supports_system_instruction: bool = True
+    rpm_limit: int = 0  # Default requests per minute (0 = unlimited)
+    tpm_limit: int = 0  # Default tokens per minute (0 = unlimited)
 
 
 class ModelRegistry:
@@ -35,6 +37,8 @@ class ModelRegistry:
             context_window=1000000,
             best_for="Large batches, drafts, cost-sensitive",
             recommended=True,
+            rpm_limit=2000,
+            tpm_limit=4000000,
         ),
         "gemini-2.5-flash": ModelInfo(
             id="gemini-2.5-flash",
@@ -45,6 +49,8 @@ class ModelRegistry:
             output_cost_per_1m=0.60,
             context_window=1000000,
             best_for="Best quality/cost ratio",
+            rpm_limit=1000,
+            tpm_limit=1000000,
         ),
         "gemini-2.5-pro": ModelInfo(
             id="gemini-2.5-pro",
@@ -55,6 +61,8 @@ class ModelRegistry:
             output_cost_per_1m=5.00,
             context_window=1000000,
             best_for="Production releases, complex documents",
+            rpm_limit=150,
+            tpm_limit=2000000,
         ),
         "gemini-2.0-flash-lite": ModelInfo(
             id="gemini-2.0-flash-lite",
@@ -65,6 +73,8 @@ class ModelRegistry:
             output_cost_per_1m=0.20,
             context_window=1000000,
             best_for="High volume, simple translations",
+            rpm_limit=4000,
+            tpm_limit=4000000,
         ),
         # OpenAI
         "gpt-4o": ModelInfo(
@@ -77,6 +87,8 @@ class ModelRegistry:
             context_window=128000,
             best_for="High-stakes documents",
             recommended=True,
+            rpm_limit=500,
+            tpm_limit=30000,
         ),
         "gpt-4o-mini": ModelInfo(
             id="gpt-4o-mini",
@@ -87,6 +99,8 @@ class ModelRegistry:
             output_cost_per_1m=0.60,
             context_window=128000,
             best_for="Cost-efficient batches",
+            rpm_limit=500,
+            tpm_limit=200000,
         ),
         "gpt-4-turbo": ModelInfo(
             id="gpt-4-turbo",
@@ -97,6 +111,8 @@ class ModelRegistry:
             output_cost_per_1m=30.00,
             context_window=128000,
             best_for="Critical documents",
+            rpm_limit=500,
+            tpm_limit=30000,
         ),
         "gpt-3.5-turbo": ModelInfo(
             id="gpt-3.5-turbo",
@@ -107,6 +123,8 @@ class ModelRegistry:
             output_cost_per_1m=1.50,
             context_window=16385,
             best_for="Simple translations",
+            rpm_limit=3500,
+            tpm_limit=200000,
         ),
         # Anthropic Claude
         "claude-3-5-sonnet-20241022": ModelInfo(
@@ -119,6 +137,8 @@ class ModelRegistry:
             context_window=200000,
             best_for="Nuanced translations",
             recommended=True,
+            rpm_limit=50,
+            tpm_limit=40000,
         ),
         "claude-3-opus-20240229": ModelInfo(
             id="claude-3-opus-20240229",
@@ -129,6 +149,8 @@ class ModelRegistry:
             output_cost_per_1m=75.00,
             context_window=200000,
             best_for="Mission-critical documents",
+            rpm_limit=50,
+            tpm_limit=20000,
         ),
         "claude-3-haiku-20240307": ModelInfo(
             id="claude-3-haiku-20240307",
@@ -139,6 +161,8 @@ class ModelRegistry:
             output_cost_per_1m=1.25,
             context_window=200000,
             best_for="High-volume, simple translations",
+            rpm_limit=50,
+            tpm_limit=50000,
         ),
     }
 
@@ -147,6 +171,16 @@ class ModelRegistry:
         """Get enriched model information."""
         return cls.KNOWN_MODELS.get(model_id)
 
+    @classmethod
+    def get_rate_limits(cls, model_id: str) -> Tuple[int, int]:
+        """Get default (requests per minute, tokens per minute) for a model.
+
+        Defaults are the lowest paid tier of each provider; raise them in
+        the config file if your account allows more.
+        """
+        info = cls.get_model_info(model_id)
+        return (info.rpm_limit, info.tpm_limit) if info else (0, 0)
+
     @classmethod
     def get_provider_models(cls, provider: str) -> List[ModelInfo]:
         """Get all models for a provider."""
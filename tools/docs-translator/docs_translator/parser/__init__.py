@@ -1,6 +1,7 @@
 """Markdown parser package."""
 
 from docs_translator.parser.markdown_parser import MarkdownParser
+from docs_translator.parser.segmenter import SentenceSegmenter
 from docs_translator.parser.tokens import TranslationUnit, TranslationAction
 
-__all__ = ["MarkdownParser", "TranslationUnit", "TranslationAction"]
+__all__ = ["MarkdownParser", "SentenceSegmenter", "TranslationUnit", "TranslationAction"]
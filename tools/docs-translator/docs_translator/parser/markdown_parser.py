@@ -1,5 +1,6 @@
 """Markdown parser with structure preservation."""
 
+import itertools
 import re
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -7,6 +8,7 @@ from typing import List, Optional, Tuple
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
 
+from docs_translator.parser.segmenter import SentenceSegmenter
 from docs_translator.parser.tokens import (
     DocumentBlock,
     ParsedDocument,
@@ -30,10 +32,35 @@ class MarkdownParser:
     # Code inline pattern (already handled by markdown-it, but for text processing)
     INLINE_CODE_PATTERN = r"`[^`]+`"
 
-    def __init__(self, preserve_terms: Optional[List[str]] = None):
-        """Initialize parser with optional preserve terms."""
+    # Block type of each top-level markdown-it token that becomes a block
+    BLOCK_TYPES = {
+        "heading_open": "heading",
+        "paragraph_open": "paragraph",
+        "fence": "fence",
+        "code_block": "code_block",
+        "bullet_list_open": "list",
+        "ordered_list_open": "list",
+        "blockquote_open": "blockquote",
+        "table_open": "table",
+        "hr": "hr",
+        "html_block": "html",
+    }
+
+    def __init__(
+        self,
+        preserve_terms: Optional[List[str]] = None,
+        segmenter: Optional[SentenceSegmenter] = None,
+    ):
+        """Initialize parser with optional preserve terms.
+
+        Args:
+            preserve_terms: Terms that must never be translated
+            segmenter: If set, translatable text is split into one unit per sentence
+        """
         self.preserve_terms = preserve_terms or []
+        self.segmenter = segmenter
         self.md = MarkdownIt("commonmark", {"html": True})
+        self._segment_groups = itertools.count()
 
     def parse_file(self, file_path: str) -> ParsedDocument:
         """Parse a Markdown file into a structured document."""
@@ -67,6 +94,21 @@ class MarkdownParser:
         doc.update_statistics()
         return doc
 
+    def split_blocks(self, content: str) -> List[Tuple[str, str]]:
+        """Split Markdown into the blocks ``parse_content`` would find, without parsing them.
+
+        Used to line a translated file up with the blocks of its source.
+
+        Returns:
+            (block type, raw content) of each block, in order
+        """
+        lines = content.split("\n")
+        return [
+            (self.BLOCK_TYPES[token.type], "\n".join(lines[token.map[0] : token.map[1]]))
+            for token in self.md.parse(content)
+            if token.level == 0 and token.type in self.BLOCK_TYPES and token.map
+        ]
+
     def _process_tokens(
         self, tokens: List[Token], original_content: str
     ) -> List[DocumentBlock]:
@@ -390,15 +432,34 @@ class MarkdownParser:
             )
             return units
 
-        # For most content, create a single translation unit
-        # The translator will handle inline code preservation
-        units.append(
-            TranslationUnit(
-                content=text,
-                action=TranslationAction.TRANSLATE,
-                context=context,
+        sentences = self.segmenter.split(text) if self.segmenter else [(text, "")]
+
+        if len(sentences) == 1:
+            # For most content, create a single translation unit
+            # The translator will handle inline code preservation
+            units.append(
+                TranslationUnit(
+                    content=text,
+                    action=TranslationAction.TRANSLATE,
+                    context=context,
+                )
+            )
+            return units
+
+        # One unit per sentence; the group and separator let the translator
+        # stitch the sentences back into a single piece of text
+        group = next(self._segment_groups)
+        for sentence, separator in sentences:
+            skip = self._should_skip_entirely(sentence)
+            units.append(
+                TranslationUnit(
+                    content=sentence,
+                    action=TranslationAction.SKIP if skip else TranslationAction.TRANSLATE,
+                    context=context,
+                    preserve_reason="all_code_or_preserved" if skip else None,
+                    metadata={"segment_group": group, "separator": separator},
+                )
             )
-        )
 
         return units
 
@@ -0,0 +1,124 @@
+"""Sentence segmentation for translation units."""
+
+import re
+from typing import List, Tuple
+
+
+class SentenceSegmenter:
+    """Split text into sentences so edits only invalidate one sentence.
+
+    Rules are chosen per boundary from the script around it:
+
+    - Latin scripts (English, Vietnamese, ...): ``.``, ``!``, ``?`` or ``…``
+      followed by whitespace and an uppercase letter, digit or opening
+      quote/bracket. Known abbreviations are not boundaries.
+    - CJK: full-width ``。！？`` (plus closing brackets), with or without
+      following whitespace.
+    - Thai: no sentence punctuation is used; a space between two Thai
+      characters ends a sentence.
+
+    Boundaries inside inline code, URLs, links, emphasis and HTML tags are
+    never used, so every sentence keeps its Markdown balanced.
+    """
+
+    # Spans that must never be split
+    PROTECTED_PATTERNS = [
+        r"`[^`]+`",  # Inline code
+        r"!?\[[^\]]*\]\([^)]*\)",  # Links and images
+        r"https?://[^\s\)\]\"'>]*[^\s\)\]\"'>.,;:!?]",  # URLs, minus trailing punctuation
+        r"\*\*[^*]+\*\*",  # Bold
+        r"__[^_]+__",
+        r"(?<![*\w])\*[^*\n]+\*(?![*\w])",  # Italic
+        r"<[^>]+>",  # Inline HTML
+    ]
+
+    ABBREVIATIONS = {
+        "e.g", "i.e", "etc", "vs", "mr", "mrs", "ms", "dr", "prof", "no", "fig",
+        "approx", "dept", "inc", "ltd", "jr", "sr", "st", "v.v", "tp", "ths", "ts",
+    }
+
+    LATIN_BOUNDARY = re.compile(
+        r"[.!?…]+[\"'”’)\]]*(\s+)"  # Terminal punctuation, closing quotes, whitespace
+        r"(?=[\"'“‘(\[*_]*[^\s\"'“‘(\[*_])"  # followed by the start of a sentence
+    )
+    CJK_BOUNDARY = re.compile(r"[。！？]+[」』）】\"”’]*(\s*)")
+    THAI_BOUNDARY = re.compile(r"(?<=[\u0e00-\u0e7f])(\s+)(?=[\u0e00-\u0e7f])")
+
+    _CJK_CHAR = re.compile(r"[\u3000-\u30ff\u3400-\u9fff\uf900-\ufaff\uff00-\uffef]")
+    _WORD_BEFORE = re.compile(r"([\w.]+)[.!?…]*[\"'”’)\]]*\s*$")
+
+    def __init__(self):
+        self._protected = re.compile("|".join(f"(?:{p})" for p in self.PROTECTED_PATTERNS))
+
+    def split(self, text: str) -> List[Tuple[str, str]]:
+        """Split text into sentences.
+
+        Args:
+            text: Text of one translation unit
+
+        Returns:
+            List of (sentence, separator) pairs. Concatenating every sentence
+            followed by its separator reproduces ``text`` exactly.
+        """
+        protected = [m.span() for m in self._protected.finditer(text)]
+
+        def is_protected(pos: int) -> bool:
+            return any(start < pos < end for start, end in protected)
+
+        boundaries = []  # (sentence end, separator end)
+        for match in self.LATIN_BOUNDARY.finditer(text):
+            sep_start, sep_end = match.span(1)
+            if is_protected(sep_start) or self._is_abbreviation(text[: match.start(1)]):
+                continue
+            next_char = text[sep_end:].lstrip("\"'“‘([*_")[:1]
+            if next_char.isalpha() and not next_char.isupper() and not self._is_unicased(next_char):
+                continue
+            boundaries.append((sep_start, sep_end))
+
+        for pattern in (self.CJK_BOUNDARY, self.THAI_BOUNDARY):
+            for match in pattern.finditer(text):
+                sep_start, sep_end = match.span(1)
+                if sep_end < len(text) and not is_protected(sep_start):
+                    boundaries.append((sep_start, sep_end))
+
+        sentences = []
+        cursor = 0
+        for sep_start, sep_end in sorted(set(boundaries)):
+            if sep_start <= cursor:
+                continue
+            sentences.append((text[cursor:sep_start], text[sep_start:sep_end]))
+            cursor = sep_end
+        sentences.append((text[cursor:], ""))
+        return [(s, sep) for s, sep in sentences if s.strip()] or [(text, "")]
+
+    def _is_abbreviation(self, before: str) -> bool:
+        """Check if the text before a boundary ends with a known abbreviation."""
+        match = self._WORD_BEFORE.search(before)
+        if not match:
+            return False
+        word = match.group(1).lower().rstrip(".")
+        # Single letters are initials ("J. Smith") or list markers ("a.")
+        return word in self.ABBREVIATIONS or len(word) == 1
+
+    @staticmethod
+    def _is_unicased(char: str) -> bool:
+        """Scripts without letter case (Korean, CJK, ...) can start a sentence."""
+        return char.upper() == char.lower()
+
+    @classmethod
+    def join(cls, left: str, separator: str, right: str) -> str:
+        """Join two translated sentences, adapting the original separator.
+
+        Separators come from the source text, so they are adjusted when the
+        target script differs: CJK source sentences are often not separated
+        by spaces, while CJK target sentences should not be.
+        """
+        if not left or not right:
+            return left + separator + right
+        left_cjk = bool(cls._CJK_CHAR.match(left[-1]))
+        right_cjk = bool(cls._CJK_CHAR.match(right[0]))
+        if separator == "" and not (left_cjk and right_cjk):
+            separator = " "
+        elif separator.strip(" \t") == "" and left_cjk and right_cjk:
+            separator = ""
+        return left + separator + right
@@ -76,7 +76,12 @@ class DocumentBlock:
 
 @dataclass
 class ParsedDocument:
-    """A fully parsed document ready for translation."""
+    """A fully parsed document ready for translation.
+
+    Plain data all the way down, so it can be pickled to and from worker
+    processes. Units are shared between ``blocks`` and any unit lists pickled
+    along with the document, so pickle them in one object.
+    """
 
     # Original file path
     source_path: str
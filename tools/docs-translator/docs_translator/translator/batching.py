@@ -0,0 +1,72 @@
+"""Packing of many short segments into one ID-tagged translation request."""
+
+import json
+import re
+from typing import Dict, List, NamedTuple
+
+from docs_translator.translator.masking import MaskedText
+from docs_translator.translator.prompts import PromptBuilder
+
+
+_JSON_ARRAY = re.compile(r"\[.*\]", re.DOTALL)
+
+
+class Segment(NamedTuple):
+    """One cache miss waiting to be translated."""
+
+    masked: MaskedText  # Canonical masked text, sent to the provider
+    text: str  # Original text, used if masking has to be bypassed
+    context: str
+
+
+def build_batch_prompt(segments: List[Segment]) -> str:
+    """Build the user prompt for a batch; segment IDs are 1-based positions."""
+    return PromptBuilder.build_batch_prompt(
+        [
+            {"id": i, "context": segment.context, "text": segment.masked.text}
+            for i, segment in enumerate(segments, 1)
+        ]
+    )
+
+
+def parse_batch_response(response: str, count: int) -> Dict[int, str]:
+    """Split a batch response back into per-segment translations.
+
+    Tolerates code fences and prose around the array. Entries with unknown
+    or duplicate IDs, or without a string "text", are dropped, so the
+    caller can retry exactly the segments that are missing.
+
+    Args:
+        response: Raw model output
+        count: Number of segments in the batch
+
+    Returns:
+        Mapping of segment ID (1-based) to translated text
+    """
+    match = _JSON_ARRAY.search(response)
+    if not match:
+        return {}
+    try:
+        items = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    translations: Dict[int, str] = {}
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("text"), str):
+            continue
+        try:
+            segment_id = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if not 1 <= segment_id <= count:
+            continue
+        if segment_id in seen:
+            translations.pop(segment_id, None)  # Ambiguous: retry individually
+            continue
+        seen.add(segment_id)
+        translations[segment_id] = item["text"].strip()
+    return translations
@@ -0,0 +1,356 @@
+"""Offline translation through the providers' batch APIs.
+
+Cache misses are submitted as one asynchronous batch job instead of live
+requests. Batch APIs are billed at a discount and have their own quota,
+at the cost of results arriving within hours rather than seconds. Jobs
+are persisted next to the translation memory so they can be collected
+by a later process.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from docs_translator.logging import debug
+from docs_translator.translator.providers import (
+    BaseProvider,
+    ClaudeProvider,
+    GeminiProvider,
+    OpenAIProvider,
+    TranslationError,
+)
+from docs_translator.translator.transport import get_http_client
+
+# Normalised job states
+PENDING = "pending"
+COMPLETED = "completed"  # Results (possibly partial) are available
+FAILED = "failed"
+
+
+@dataclass
+class BatchRequest:
+    """One cache miss sent as part of a batch job."""
+
+    custom_id: str
+    text: str  # Canonical masked text: the translation memory key
+    context: str
+    prompt: str = ""  # User prompt; not persisted
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"custom_id": self.custom_id, "text": self.text, "context": self.context}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchRequest":
+        """Create from dictionary."""
+        return cls(custom_id=data["custom_id"], text=data["text"], context=data["context"])
+
+
+@dataclass
+class BatchJob:
+    """A submitted batch job and what to do with its results."""
+
+    job_id: str
+    provider: str
+    model: str
+    source_lang: str
+    target_lang: str
+    requests: List[BatchRequest] = field(default_factory=list)
+    files: List[Tuple[str, str]] = field(default_factory=list)  # (input, output) to render
+    group: str = ""  # Jobs split from one submission; files render when all are in
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "job_id": self.job_id,
+            "provider": self.provider,
+            "model": self.model,
+            "source_lang": self.source_lang,
+            "target_lang": self.target_lang,
+            "group": self.group,
+            "created_at": self.created_at,
+            "files": [list(paths) for paths in self.files],
+            "requests": [request.to_dict() for request in self.requests],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchJob":
+        """Create from dictionary."""
+        return cls(
+            job_id=data["job_id"],
+            provider=data["provider"],
+            model=data["model"],
+            source_lang=data["source_lang"],
+            target_lang=data["target_lang"],
+            group=data.get("group", data["job_id"]),
+            created_at=data.get("created_at", ""),
+            files=[tuple(paths) for paths in data.get("files", [])],
+            requests=[BatchRequest.from_dict(r) for r in data.get("requests", [])],
+        )
+
+
+class BatchJobStore:
+    """Submitted jobs that have not been collected yet, in a JSON file."""
+
+    FILENAME = "batch_jobs.json"
+
+    def __init__(self, cache_dir: str = ".translation_cache"):
+        self.path = Path(cache_dir) / self.FILENAME
+
+    def load(self) -> List[BatchJob]:
+        """Load all pending jobs."""
+        if not self.path.exists():
+            return []
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        return [BatchJob.from_dict(job) for job in data.get("jobs", [])]
+
+    def add(self, job: BatchJob):
+        """Record a newly submitted job."""
+        self._write(self.load() + [job])
+
+    def remove(self, job_id: str):
+        """Forget a job once it is collected or has failed."""
+        self._write([job for job in self.load() if job.job_id != job_id])
+
+    def _write(self, jobs: List[BatchJob]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        data = {"jobs": [job.to_dict() for job in jobs]}
+        tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+class BatchBackend(ABC):
+    """Submit, poll and fetch a batch job through one provider's batch API.
+
+    Requests are built with the provider's own request format, so batch
+    translations are identical to live ones.
+    """
+
+    MAX_REQUESTS = 10000  # Per job; larger submissions are split
+
+    def __init__(self, provider: BaseProvider):
+        self.provider = provider
+
+    @abstractmethod
+    def submit(self, requests: List[BatchRequest], system_prompt: str) -> str:
+        """Create a batch job.
+
+        Returns:
+            The provider's job ID
+        """
+        pass
+
+    @abstractmethod
+    def status(self, job_id: str) -> str:
+        """Get the normalised job state: PENDING, COMPLETED or FAILED."""
+        pass
+
+    @abstractmethod
+    def results(self, job_id: str) -> Dict[str, str]:
+        """Fetch the translations of a completed job.
+
+        Returns:
+            Translated text by custom ID, for the requests that succeeded
+        """
+        pass
+
+    def _call(self, method, *args, **kwargs):
+        """Call the API, mapping SDK errors to translation errors."""
+        try:
+            return method(*args, **kwargs)
+        except Exception as e:
+            raise self.provider._convert_error(e)
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API: a JSONL file of chat completion requests."""
+
+    MAX_REQUESTS = 50000
+    STATES = {"completed": COMPLETED, "expired": COMPLETED, "failed": FAILED, "cancelled": FAILED}
+
+    def submit(self, requests: List[BatchRequest], system_prompt: str) -> str:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self.provider._request(request.prompt, system_prompt),
+                },
+                ensure_ascii=False,
+            )
+            for request in requests
+        ]
+        client = self.provider.client
+        batch_file = self._call(
+            client.files.create,
+            file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self._call(
+            client.batches.create,
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def status(self, job_id: str) -> str:
+        # Expired jobs still return the requests that finished in time
+        batch = self._call(self.provider.client.batches.retrieve, job_id)
+        return self.STATES.get(batch.status, PENDING)
+
+    def results(self, job_id: str) -> Dict[str, str]:
+        client = self.provider.client
+        batch = self._call(client.batches.retrieve, job_id)
+        if not batch.output_file_id:
+            return {}
+        content = self._call(client.files.content, batch.output_file_id)
+        translations: Dict[str, str] = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            choices = (response.get("body") or {}).get("choices") or []
+            if response.get("status_code") == 200 and choices:
+                translations[record["custom_id"]] = choices[0]["message"]["content"].strip()
+        return translations
+
+
+class ClaudeBatchBackend(BatchBackend):
+    """Anthropic Message Batches API."""
+
+    MAX_REQUESTS = 100000
+
+    def submit(self, requests: List[BatchRequest], system_prompt: str) -> str:
+        batch = self._call(
+            self.provider.client.messages.batches.create,
+            requests=[
+                {
+                    "custom_id": request.custom_id,
+                    "params": self.provider._request(request.prompt, system_prompt),
+                }
+                for request in requests
+            ],
+        )
+        return batch.id
+
+    def status(self, job_id: str) -> str:
+        batch = self._call(self.provider.client.messages.batches.retrieve, job_id)
+        return COMPLETED if batch.processing_status == "ended" else PENDING
+
+    def results(self, job_id: str) -> Dict[str, str]:
+        translations: Dict[str, str] = {}
+        for entry in self._call(self.provider.client.messages.batches.results, job_id):
+            if entry.result.type == "succeeded" and entry.result.message.content:
+                translations[entry.custom_id] = entry.result.message.content[0].text.strip()
+        return translations
+
+
+class GeminiBatchBackend(BatchBackend):
+    """Gemini Batch Mode, over REST with inline requests."""
+
+    MAX_REQUESTS = 2000  # Inline requests are capped at 20 MB per job
+    DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com"
+    STATES = {
+        "BATCH_STATE_SUCCEEDED": COMPLETED,
+        "BATCH_STATE_FAILED": FAILED,
+        "BATCH_STATE_CANCELLED": FAILED,
+        # As with OpenAI, whatever finished before expiry is collected
+        "BATCH_STATE_EXPIRED": COMPLETED,
+    }
+
+    def _url(self, path: str) -> str:
+        base_url = (self.provider.base_url or self.DEFAULT_BASE_URL).rstrip("/")
+        return f"{base_url}/v1beta/{path}"
+
+    def _http(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        client = get_http_client(self.provider.http)
+        response = self._call(
+            client.request,
+            method,
+            self._url(path),
+            headers={"x-goog-api-key": self.provider.api_key},
+            **kwargs,
+        )
+        self._call(response.raise_for_status)
+        return response.json()
+
+    def submit(self, requests: List[BatchRequest], system_prompt: str) -> str:
+        model = self.provider.model.removeprefix("models/")
+        body = {
+            "batch": {
+                "display_name": "docs-translator",
+                "input_config": {
+                    "requests": {
+                        "requests": [
+                            {
+                                "request": {
+                                    "contents": [
+                                        {"role": "user", "parts": [{"text": request.prompt}]}
+                                    ],
+                                    "system_instruction": {"parts": [{"text": system_prompt}]},
+                                    "generation_config": {
+                                        "temperature": self.provider.temperature,
+                                        "max_output_tokens": self.provider.max_tokens,
+                                    },
+                                },
+                                "metadata": {"key": request.custom_id},
+                            }
+                            for request in requests
+                        ]
+                    }
+                },
+            }
+        }
+        operation = self._http("POST", f"models/{model}:batchGenerateContent", json=body)
+        return operation["name"]
+
+    def _get(self, job_id: str) -> Dict[str, Any]:
+        return self._http("GET", job_id)
+
+    @staticmethod
+    def _state(batch: Dict[str, Any]) -> Optional[str]:
+        # Returned either as a long-running operation or as the batch itself
+        return (batch.get("metadata") or {}).get("state") or batch.get("state")
+
+    def status(self, job_id: str) -> str:
+        return self.STATES.get(self._state(self._get(job_id)), PENDING)
+
+    def results(self, job_id: str) -> Dict[str, str]:
+        batch = self._get(job_id)
+        output = batch.get("response") or batch.get("output") or {}
+        inlined = (output.get("inlinedResponses") or {}).get("inlinedResponses") or []
+        translations: Dict[str, str] = {}
+        for item in inlined:
+            key = (item.get("metadata") or {}).get("key")
+            candidates = (item.get("response") or {}).get("candidates") or []
+            parts = (candidates[0].get("content") or {}).get("parts") if candidates else None
+            if key and parts:
+                translations[key] = "".join(part.get("text", "") for part in parts).strip()
+        return translations
+
+
+def create_batch_backend(provider: BaseProvider) -> BatchBackend:
+    """Factory function to create the batch backend for a provider.
+
+    Raises:
+        TranslationError: If the provider has no batch API support
+    """
+    backends = {
+        GeminiProvider: GeminiBatchBackend,
+        OpenAIProvider: OpenAIBatchBackend,
+        ClaudeProvider: ClaudeBatchBackend,
+    }
+    for provider_class, backend_class in backends.items():
+        if isinstance(provider, provider_class):
+            debug(f"Using {backend_class.__name__}")
+            return backend_class(provider)
+    raise TranslationError(f"No batch API support for {provider.__class__.__name__}")
@@ -0,0 +1,293 @@
+"""Load balancing and failover across several providers."""
+
+import itertools
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import List, NamedTuple, Optional, Tuple
+
+from docs_translator.logging import debug, info, warning
+from docs_translator.translator.providers import (
+    BaseProvider,
+    RateLimitError,
+    TokenUsage,
+    TransientError,
+    TranslationError,
+)
+
+# Model that served the latest request in this thread or task. Lets the
+# caller record which pool member produced a translation.
+served_model: ContextVar[Optional[str]] = ContextVar("served_model", default=None)
+
+
+class CircuitBreaker:
+    """Take a backend out of rotation after repeated failures.
+
+    Closed: requests flow. After ``FAILURE_THRESHOLD`` consecutive
+    failures the breaker opens for a cooldown, then lets one probe request
+    through (half-open). A successful probe closes it; a failed one opens
+    it again with twice the cooldown.
+
+    Only transient errors (5xx, timeouts, connection errors) are failures.
+    Rate limit errors pause the backend for the time the server asked for
+    instead, and a request the backend refused (4xx) shows that it is up.
+    """
+
+    FAILURE_THRESHOLD = 3
+    COOLDOWN = 30.0  # Seconds, doubled after each failed probe
+    MAX_COOLDOWN = 300.0
+    RATE_LIMIT_PAUSE = 10.0  # Seconds, when a 429 carries no Retry-After
+
+    def __init__(self, name: str):
+        self.name = name
+        self._failures = 0
+        self._cooldown = self.COOLDOWN
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the backend is out of rotation."""
+        return self._opened_at is not None
+
+    def retry_in(self) -> float:
+        """Seconds until the next request may be sent (0 if available now)."""
+        with self._lock:
+            now = time.monotonic()
+            ready_at = self._paused_until
+            if self._opened_at is not None:
+                ready_at = max(ready_at, self._opened_at + self._cooldown)
+            return max(0.0, ready_at - now)
+
+    def available(self) -> bool:
+        """Check, without side effects, whether a request could be sent."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return False
+            return self._opened_at is None or (
+                not self._probing and now >= self._opened_at + self._cooldown
+            )
+
+    def allow(self) -> bool:
+        """Claim permission to send a request; claims the probe when half-open."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return False
+            if self._opened_at is None:
+                return True
+            if self._probing or now < self._opened_at + self._cooldown:
+                return False
+            self._probing = True
+            return True
+
+    def pause(self, seconds: Optional[float] = None):
+        """Hold requests back after a rate limit error, without counting a failure."""
+        seconds = seconds or self.RATE_LIMIT_PAUSE
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # A rate-limited probe says nothing about recovery; allow another
+            self._probing = False
+        debug(f"{self.name} rate limited; paused for {seconds:.0f}s")
+
+    def record_success(self):
+        """Feed back a successful request; closes the breaker."""
+        with self._lock:
+            if self._opened_at is not None:
+                info(f"{self.name} recovered; back in rotation")
+            self._failures = 0
+            self._cooldown = self.COOLDOWN
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        """Feed back a failed request."""
+        with self._lock:
+            self._failures += 1
+            if self._probing:
+                self._cooldown = min(self.MAX_COOLDOWN, self._cooldown * 2)
+            elif self._opened_at is not None or self._failures < self.FAILURE_THRESHOLD:
+                return
+            self._probing = False
+            self._opened_at = time.monotonic()
+            warning(f"{self.name} failing; out of rotation for {self._cooldown:.0f}s")
+
+
+class PoolEntry(NamedTuple):
+    """A backend of the composite provider."""
+
+    provider: BaseProvider
+    weight: float
+    breaker: CircuitBreaker
+
+
+class CompositeProvider(BaseProvider):
+    """Spread requests over several providers and models.
+
+    Each request goes to a backend picked at random in proportion to its
+    weight, among those whose rate limiter has quota right now; backends
+    that would have to wait come after them, soonest first. If a backend
+    fails transiently, the request fails over to the next one at once.
+    Backends that keep failing are taken out of rotation by their circuit
+    breaker. Any other error, such as a request the backend rejected, is
+    raised as is: the next backend would reject it too.
+
+    Backends keep their own rate limiters and share one ``usage`` counter.
+    """
+
+    NAME = "Pool"
+
+    def __init__(self, backends: List[Tuple[BaseProvider, float]], max_tokens: int = 4096):
+        """Initialize composite provider.
+
+        Args:
+            backends: (provider, weight) pairs
+            max_tokens: Maximum tokens for response
+        """
+        super().__init__(
+            api_key="",
+            model="+".join(provider.model for provider, _ in backends),
+            max_tokens=max_tokens,
+        )
+        self.entries = [
+            PoolEntry(provider, weight, CircuitBreaker(self._entry_name(provider)))
+            for provider, weight in backends
+        ]
+        self._share_usage(TokenUsage())
+
+    def _init_client(self):
+        """Backends create their own clients."""
+        pass
+
+    @staticmethod
+    def _entry_name(provider: BaseProvider) -> str:
+        return f"{provider.NAME}/{provider.model}"
+
+    def _share_usage(self, usage: TokenUsage):
+        """Count the tokens of every backend, nested pools included, in ``usage``."""
+        self.usage = usage
+        for entry in self.entries:
+            if isinstance(entry.provider, CompositeProvider):
+                entry.provider._share_usage(usage)
+            else:
+                entry.provider.usage = usage
+
+    def wait_time(self, tokens: int) -> float:
+        """Seconds until some backend would accept a request of ``tokens`` tokens."""
+        waits = [
+            entry.provider.wait_time(tokens) for entry in self.entries if entry.breaker.available()
+        ]
+        if waits:
+            return min(waits)
+        return min(entry.breaker.retry_in() for entry in self.entries)
+
+    def _partition(self, tokens: int) -> Tuple[List[PoolEntry], List[PoolEntry]]:
+        """Split available backends into those with quota now and the rest, soonest first."""
+        ready: List[PoolEntry] = []
+        waiting: List[Tuple[float, PoolEntry]] = []
+        for entry in self.entries:
+            if not entry.breaker.available():
+                continue
+            wait = entry.provider.wait_time(tokens)
+            if wait > 0:
+                waiting.append((wait, entry))
+            else:
+                ready.append(entry)
+        waiting.sort(key=lambda item: (item[0], -item[1].weight))
+        return ready, [entry for _, entry in waiting]
+
+    def _order(self, tokens: int) -> List[PoolEntry]:
+        """Backends to try for one request, in order."""
+        ready, waiting = self._partition(tokens)
+        # Weighted shuffle: sort by random() ** (1 / weight), descending
+        ready.sort(key=lambda entry: random.random() ** (1 / max(entry.weight, 1e-6)), reverse=True)
+        return ready + waiting
+
+    def _unavailable(self) -> TransientError:
+        """Error for when every breaker is open; retried once the first may probe."""
+        retry_after = min(entry.breaker.retry_in() for entry in self.entries)
+        return TransientError("All providers are out of rotation", retry_after=retry_after)
+
+    def translate(self, text: str, system_prompt: str) -> str:
+        """Translate with the first backend that succeeds."""
+        last_error: Optional[TransientError] = None
+        for entry in self._order(self._request_tokens(text, system_prompt)):
+            if not entry.breaker.allow():
+                continue
+            try:
+                translated = entry.provider.translate(text, system_prompt)
+            except TransientError as e:
+                last_error = self._failed(entry, e)
+                continue
+            except TranslationError:
+                entry.breaker.record_success()  # It answered; the request was refused
+                raise
+            entry.breaker.record_success()
+            served_model.set(entry.provider.model)
+            return translated
+        raise last_error or self._unavailable()
+
+    async def atranslate(self, text: str, system_prompt: str) -> str:
+        """Async variant of ``translate``."""
+        last_error: Optional[TransientError] = None
+        for entry in self._order(self._request_tokens(text, system_prompt)):
+            if not entry.breaker.allow():
+                continue
+            try:
+                translated = await entry.provider.atranslate(text, system_prompt)
+            except TransientError as e:
+                last_error = self._failed(entry, e)
+                continue
+            except TranslationError:
+                entry.breaker.record_success()  # It answered; the request was refused
+                raise
+            entry.breaker.record_success()
+            served_model.set(entry.provider.model)
+            return translated
+        raise last_error or self._unavailable()
+
+    @staticmethod
+    def _failed(entry: PoolEntry, error: TransientError) -> TransientError:
+        if isinstance(error, RateLimitError):
+            entry.breaker.pause(error.retry_after)
+        else:
+            entry.breaker.record_failure()
+        debug(f"{entry.breaker.name} failed ({error}); trying the next backend")
+        return error
+
+
+class KeyPool(CompositeProvider):
+    """One provider and model used with several API keys.
+
+    Each key has its own rate limiter and circuit breaker, so throughput
+    adds up across keys. Requests go round-robin over the keys with quota
+    right now, then to the key that frees up soonest. A key that gets a 429
+    sits out for the time the server asked for.
+    """
+
+    def __init__(self, providers: List[BaseProvider], max_tokens: int = 4096):
+        """Initialize key pool.
+
+        Args:
+            providers: The same provider and model, one instance per key
+            max_tokens: Maximum tokens for response
+        """
+        super().__init__([(provider, 1.0) for provider in providers], max_tokens=max_tokens)
+        self.NAME = providers[0].NAME
+        self.model = providers[0].model
+        self._turn = itertools.count()
+
+    @staticmethod
+    def _entry_name(provider: BaseProvider) -> str:
+        return f"{provider.NAME}/{provider.model} key ...{provider.api_key[-4:]}"
+
+    def _order(self, tokens: int) -> List[PoolEntry]:
+        ready, waiting = self._partition(tokens)
+        if ready:
+            start = next(self._turn) % len(ready)
+            ready = ready[start:] + ready[:start]
+        return ready + waiting
@@ -0,0 +1,167 @@
+"""Adaptive limit on in-flight translation requests."""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional, Tuple
+
+from docs_translator.logging import debug, info
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease window of in-flight requests.
+
+    The window grows by about one request per window's worth of successful
+    requests while latency stays flat, and is cut by ``DECREASE`` on a rate
+    limit error or a latency spike. At most one cut is applied per window,
+    since requests already in flight when the first error arrives tend to
+    fail too.
+
+    Latency is normalised by request size, so a large batch is not mistaken
+    for a spike. With ``adaptive=False`` the window stays at ``initial``.
+    """
+
+    DECREASE = 0.5  # Window multiplier on a 429 or latency spike
+    SPIKE_RATIO = 2.0  # Normalised latency over baseline that counts as a spike
+    LATENCY_TOKENS = 250  # Tokens that cost about as much latency as the round trip
+    BASELINE_ALPHA = 0.1  # Smoothing of the latency baseline
+    WARMUP = 5  # Requests before latency spikes are acted on
+    MIN_SPIKE_LATENCY = 0.5  # Seconds; faster requests never count as spikes
+
+    def __init__(self, initial: int, maximum: int = 16, minimum: int = 1, adaptive: bool = True):
+        """Initialize controller.
+
+        Args:
+            initial: Starting window (and the fixed window if not adaptive)
+            maximum: Upper bound of the window
+            minimum: Lower bound of the window
+            adaptive: Whether to adjust the window from feedback
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum, initial)
+        self.adaptive = adaptive
+        self._window = float(max(self.minimum, initial))
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._samples = 0
+        self._since_decrease = 0
+        self._last_cut_window = 0  # Window when last cut; that many requests may still fail
+        self._throttles = 0
+        self._spikes = 0
+        self._condition = threading.Condition()
+        self._async_condition: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Condition]] = None
+
+    @property
+    def window(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._window)
+
+    @contextmanager
+    def slot(self):
+        """Hold one in-flight slot, blocking the thread until one is free."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.window)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    @asynccontextmanager
+    async def aslot(self):
+        """Hold one in-flight slot, waiting on the event loop until one is free."""
+        condition = self._get_async_condition()
+        async with condition:
+            while not self._try_enter():
+                await condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+            async with condition:
+                condition.notify_all()
+
+    def _try_enter(self) -> bool:
+        with self._condition:
+            if self._in_flight < self.window:
+                self._in_flight += 1
+                return True
+            return False
+
+    def _get_async_condition(self) -> asyncio.Condition:
+        """Condition bound to the running loop (one per loop)."""
+        loop = asyncio.get_running_loop()
+        if self._async_condition is None or self._async_condition[0] is not loop:
+            self._async_condition = (loop, asyncio.Condition())
+        return self._async_condition[1]
+
+    def record_success(self, latency: float, tokens: int = 0):
+        """Feed back a successful request.
+
+        Args:
+            latency: Seconds the request took
+            tokens: Estimated request size in tokens
+        """
+        if not self.adaptive:
+            return
+        normalized = latency / (1 + tokens / self.LATENCY_TOKENS)
+        with self._condition:
+            self._samples += 1
+            self._since_decrease += 1
+            if self._baseline is None:
+                self._baseline = normalized
+            elif (
+                self._samples > self.WARMUP
+                and latency > self.MIN_SPIKE_LATENCY
+                and normalized > self._baseline * self.SPIKE_RATIO
+            ):
+                self._spikes += 1
+                self._decrease(f"latency spike ({latency:.1f}s)")
+                return
+            else:
+                self._baseline += self.BASELINE_ALPHA * (normalized - self._baseline)
+            self._resize(self._window + 1 / self._window, "growing")
+
+    def record_throttle(self):
+        """Feed back a rate limit error."""
+        if not self.adaptive:
+            return
+        with self._condition:
+            self._throttles += 1
+            self._since_decrease += 1
+            self._decrease("rate limited")
+
+    def _decrease(self, reason: str):
+        # One cut per window: later errors are from requests sent before it
+        if self._since_decrease < self._last_cut_window:
+            return
+        self._since_decrease = 0
+        self._last_cut_window = self.window
+        self._resize(self._window * self.DECREASE, reason)
+
+    def _resize(self, window: float, reason: str):
+        old = self.window
+        self._window = min(float(self.maximum), max(float(self.minimum), window))
+        if self.window != old:
+            message = f"Concurrency window {old} -> {self.window} ({reason})"
+            if self.window < old:
+                info(message)
+            else:
+                debug(message)
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get controller statistics."""
+        with self._condition:
+            return {
+                "window": self.window,
+                "in_flight": self._in_flight,
+                "requests": self._samples,
+                "throttles": self._throttles,
+                "latency_spikes": self._spikes,
+                "baseline_latency": round(self._baseline or 0.0, 3),
+            }
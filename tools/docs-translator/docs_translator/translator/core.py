@@ -1,24 +1,76 @@
 """Core translator implementation."""
 
+import asyncio
+import difflib
 import hashlib
 import json
-from dataclasses import dataclass, field
-from datetime import datetime
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from functools import partial
+from typing import Dict, List, Optional, Callable, Tuple, Union
 
 from tqdm import tqdm
 
-from docs_translator.config.manager import TranslatorConfig
+from docs_translator.config.manager import EvictionPolicy, TranslatorConfig
+from docs_translator.logging import debug, info, verbose, warning
 from docs_translator.parser.markdown_parser import MarkdownParser
+from docs_translator.parser.segmenter import SentenceSegmenter
 from docs_translator.parser.tokens import (
     DocumentBlock,
     ParsedDocument,
     TranslationAction,
     TranslationUnit,
 )
-from docs_translator.translator.providers import BaseProvider, create_provider
+from docs_translator.translator import workers
+from docs_translator.translator.batchjob import (
+    COMPLETED,
+    PENDING,
+    BatchBackend,
+    BatchJob,
+    BatchJobStore,
+    BatchRequest,
+    create_batch_backend,
+)
+from docs_translator.translator.batching import (
+    Segment,
+    build_batch_prompt,
+    parse_batch_response,
+)
+from docs_translator.translator.composite import CompositeProvider, KeyPool, served_model
+from docs_translator.translator.dispatcher import Dispatcher
+from docs_translator.translator.fuzzy import FuzzyIndex, FuzzyMatch
+from docs_translator.translator.hedging import Hedger
+from docs_translator.translator.manifest import BuildManifest, block_hash
+from docs_translator.translator.masking import (
+    MaskedText,
+    MaskingError,
+    PlaceholderMasker,
+    canonicalize,
+    relayout,
+)
+from docs_translator.translator.packer import RequestPacker, estimate_tokens, join_pieces
+from docs_translator.translator.pipeline import PipelineMonitor, Stage
+from docs_translator.translator.providers import (
+    BaseProvider,
+    RateLimitError,
+    TransientError,
+    create_provider,
+)
+from docs_translator.translator.ratelimit import RateLimiter, get_rate_limiter, start_timer
 from docs_translator.translator.prompts import PromptBuilder
+from docs_translator.translator.storage import (
+    EntryUsage,
+    HitUpdates,
+    MemoryBackend,
+    TranslationMemoryEntry,
+    create_backend,
+)
 
 
 @dataclass
@@ -32,61 +84,129 @@ class TranslationResult:
     translated_blocks: int = 0
     cached_blocks: int = 0
     skipped_blocks: int = 0
+    reused_blocks: int = 0  # Unchanged since the last build; copied from the existing output
     error: Optional[str] = None
     duration_seconds: float = 0.0
     estimated_cost: float = 0.0
-
-
-@dataclass
-class TranslationMemoryEntry:
-    """Entry in translation memory."""
-
-    source_hash: str
-    source_text: str
-    target_text: str
-    source_lang: str
-    target_lang: str
-    context: str
-    timestamp: str
-    model: str
+    concurrency_window: int = 0  # In-flight request window when the file finished
+    throttles: int = 0  # Rate limit errors seen by the window controller, so far in this run
+    latency_spikes: int = 0  # Latency spikes seen by the window controller, so far in this run
+    input_tokens: int = 0  # Prompt tokens billed so far in this run
+    cached_input_tokens: int = 0  # Of which served from the provider's prompt cache
+    hedged_requests: int = 0  # Requests duplicated because they were slow, so far in this run
+    hedge_wins: int = 0  # Of which the duplicate answered first
+    up_to_date: bool = False  # Skipped: source and settings unchanged since the last build
+    # (block type, block hash) of each source block written, for the build manifest
+    block_hashes: List[Tuple[str, str]] = field(default_factory=list)
 
 
 class TranslationMemory:
-    """Translation memory for caching translations."""
+    """Translation memory for caching translations.
+
+    New entries are buffered in memory and written to the storage backend
+    in one batch on ``save()``, unless the backend is write-through (the
+    journal), in which case every ``set()`` is handed over immediately.
+    Hits are counted per entry so an ``EvictionPolicy`` can keep hot segments.
+    """
 
-    def __init__(self, cache_dir: str = ".translation_cache"):
+    def __init__(
+        self,
+        cache_dir: str = ".translation_cache",
+        backend: str = "sqlite",
+        policy: Optional[EvictionPolicy] = None,
+        read_only: bool = False,
+    ):
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "translation_memory.json"
-        self.memory: Dict[str, TranslationMemoryEntry] = {}
-        self._load()
+        self.backend: MemoryBackend = create_backend(backend, cache_dir, read_only)
+        self.policy = policy or EvictionPolicy()
+        self._pending: Dict[str, TranslationMemoryEntry] = {}
+        self._hit_updates: HitUpdates = {}
+        self._fuzzy_index: Optional[FuzzyIndex] = None  # Built on first fuzzy lookup
+        self._lock = threading.RLock()  # Translation workers share one memory
+        self._grown = False  # Entries added since the eviction policy last ran
 
         # Statistics
         self.hits = 0
         self.misses = 0
-
-    def _load(self):
-        """Load memory from disk."""
-        if self.cache_file.exists():
-            try:
-                data = json.loads(self.cache_file.read_text(encoding="utf-8"))
-                for key, entry_data in data.get("memory", {}).items():
-                    self.memory[key] = TranslationMemoryEntry(**entry_data)
-            except (json.JSONDecodeError, TypeError):
-                self.memory = {}
+        self.fuzzy_hits = 0
 
     def save(self):
-        """Save memory to disk."""
-        data = {
-            "version": "1.0",
-            "memory": {key: entry.__dict__ for key, entry in self.memory.items()},
-            "stats": {
-                "total_entries": len(self.memory),
-                "hits": self.hits,
-                "misses": self.misses,
-            },
-        }
-        self.cache_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        """Flush pending entries to the storage backend."""
+        with self._lock:
+            if self._pending:
+                self.backend.put_many(self._pending.values())
+                self._pending.clear()
+            if self._hit_updates:
+                self.backend.record_hits(self._hit_updates)
+                self._hit_updates = {}
+            self.backend.flush()
+
+    def evict(self, policy: Optional[EvictionPolicy] = None) -> int:
+        """Remove entries that fall outside the eviction policy.
+
+        Entries from evicted models and entries older than the TTL are
+        always removed. If the remaining memory still exceeds
+        ``max_entries`` or ``max_bytes``, the coldest entries go first:
+        least recently hit for ``lru``, fewest hits for ``lfu``.
+
+        Returns:
+            Number of entries removed
+        """
+        policy = policy or self.policy
+        if not policy.is_active():
+            return 0
+        self.save()
+
+        expiry = None
+        if policy.ttl_days:
+            expiry = (datetime.now() - timedelta(days=policy.ttl_days)).isoformat()
+
+        victims = []
+        survivors: List[EntryUsage] = []
+        for usage in self.backend.iter_usage():
+            if usage.model in policy.evict_models or (expiry and usage.timestamp < expiry):
+                victims.append(usage.key)
+            else:
+                survivors.append(usage)
+
+        if policy.max_entries or policy.max_bytes:
+            if policy.strategy == "lfu":
+                survivors.sort(key=lambda u: (u.hits, u.last_hit or u.timestamp))
+            else:
+                survivors.sort(key=lambda u: u.last_hit or u.timestamp)
+
+            count = len(survivors)
+            total_bytes = sum(u.size for u in survivors)
+            for usage in survivors:
+                if (not policy.max_entries or count <= policy.max_entries) and (
+                    not policy.max_bytes or total_bytes <= policy.max_bytes
+                ):
+                    break
+                victims.append(usage.key)
+                count -= 1
+                total_bytes -= usage.size
+
+        removed = self.backend.delete_many(victims) if victims else 0
+        self.backend.flush()
+        if removed:
+            info(f"Evicted {removed} entries from translation memory")
+        return removed
+
+    def evict_if_grown(self) -> int:
+        """Save, then apply the eviction policy if entries were added since it last ran.
+
+        Called when a run finishes rather than when the memory is opened, so
+        runs that only read it (dry runs, batch status, worker processes)
+        never pay for the scan.
+
+        Returns:
+            Number of entries removed
+        """
+        self.save()
+        if not self._grown:
+            return 0
+        self._grown = False
+        return self.evict()
 
     def _compute_hash(
         self, text: str, source_lang: str, target_lang: str, context: str
@@ -96,15 +216,25 @@ class TranslationMemory:
         return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
 
     def get(
-        self, text: str, source_lang: str, target_lang: str, context: str
+        self, text: str, source_lang: str, target_lang: str, context: str, record: bool = True
     ) -> Optional[str]:
-        """Get cached translation."""
-        key = self._compute_hash(text, source_lang, target_lang, context)
-        if key in self.memory:
-            self.hits += 1
-            return self.memory[key].target_text
-        self.misses += 1
-        return None
+        """Get cached translation.
+
+        ``record`` counts the lookup in the hit and miss statistics; turn it
+        off to check for an entry written earlier in the same request.
+        """
+        with self._lock:
+            key = self._compute_hash(text, source_lang, target_lang, context)
+            entry = self._pending.get(key) or self.backend.get(key)
+            if not record:
+                return entry.target_text if entry else None
+            if entry:
+                self.hits += 1
+                count, _ = self._hit_updates.get(key, (0, ""))
+                self._hit_updates[key] = (count + 1, datetime.now().isoformat())
+                return entry.target_text
+            self.misses += 1
+            return None
 
     def set(
         self,
@@ -116,17 +246,146 @@ class TranslationMemory:
         model: str,
     ):
         """Store translation in cache."""
-        key = self._compute_hash(text, source_lang, target_lang, context)
-        self.memory[key] = TranslationMemoryEntry(
-            source_hash=key,
-            source_text=text,
-            target_text=translation,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            context=context,
-            timestamp=datetime.now().isoformat(),
-            model=model,
-        )
+        with self._lock:
+            key = self._compute_hash(text, source_lang, target_lang, context)
+            entry = TranslationMemoryEntry(
+                source_hash=key,
+                source_text=text,
+                target_text=translation,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                context=context,
+                timestamp=datetime.now().isoformat(),
+                model=model,
+            )
+            self._add(entry)
+
+    def _add(self, entry: TranslationMemoryEntry):
+        if self.backend.write_through:
+            self.backend.put_many([entry])
+        else:
+            self._pending[entry.source_hash] = entry
+        self._grown = True
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.add(
+                entry.source_hash, entry.source_text, f"{entry.source_lang}|{entry.target_lang}"
+            )
+
+    def migrate(
+        self,
+        old_text: str,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: str,
+        convert: Callable[[str], Optional[str]],
+    ) -> Optional[str]:
+        """Copy an entry stored under an older form of its key to the current one.
+
+        Memories written before masking and whitespace normalisation are
+        keyed by the raw source text. Called after ``get`` missed ``text``;
+        if an entry exists under ``old_text``, its translation is stored
+        under ``text`` and the lookup counts as a hit instead of a miss.
+        The old entry is left for the eviction policy. A read-only memory
+        only returns the translation.
+
+        Args:
+            old_text: Source text as it was keyed before
+            text: Source text as it is keyed now
+            source_lang: Source language code
+            target_lang: Target language code
+            context: Context type
+            convert: Turns the stored translation into the form stored under
+                ``text``, or returns None if it cannot
+
+        Returns:
+            The stored translation, as it was stored, or None if there is
+            none to migrate
+        """
+        with self._lock:
+            old_key = self._compute_hash(old_text, source_lang, target_lang, context)
+            entry = self._pending.get(old_key) or self.backend.get(old_key)
+            if not entry:
+                return None
+            converted = convert(entry.target_text)
+            if converted is None:
+                return None
+            self.misses -= 1
+            self.hits += 1
+            if not self.backend.read_only:
+                self._add(
+                    replace(
+                        entry,
+                        source_hash=self._compute_hash(text, source_lang, target_lang, context),
+                        source_text=text,
+                        target_text=converted,
+                    )
+                )
+            return entry.target_text
+
+    def take_hits(self) -> Tuple[int, int, HitUpdates]:
+        """Hand over the lookups counted since the last call.
+
+        Used by worker processes, whose read-only memory cannot record hits.
+
+        Returns:
+            Hits, misses and per-entry hit updates
+        """
+        with self._lock:
+            taken = (self.hits, self.misses, self._hit_updates)
+            self.hits = self.misses = 0
+            self._hit_updates = {}
+        return taken
+
+    def add_hits(self, hits: int, misses: int, updates: HitUpdates):
+        """Count lookups made by a worker process, as returned by ``take_hits``."""
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            for key, (count, last_hit) in updates.items():
+                previous, previous_hit = self._hit_updates.get(key, (0, ""))
+                self._hit_updates[key] = (previous + count, max(previous_hit, last_hit))
+
+    def get_fuzzy(
+        self, text: str, source_lang: str, target_lang: str, threshold: float
+    ) -> Optional[FuzzyMatch]:
+        """Find the most similar cached segment for the same language pair.
+
+        Args:
+            text: Source text that missed the exact cache
+            source_lang: Source language code
+            target_lang: Target language code
+            threshold: Minimum similarity (0.0 - 1.0) to accept
+
+        Returns:
+            Best match at or above threshold, or None
+        """
+        with self._lock:
+            if self._fuzzy_index is None:
+                self._build_fuzzy_index()
+
+            best: Optional[FuzzyMatch] = None
+            for key in self._fuzzy_index.candidates(text, f"{source_lang}|{target_lang}"):
+                entry = self._pending.get(key) or self.backend.get(key)
+                if not entry:
+                    continue
+                similarity = FuzzyIndex.similarity(text, entry.source_text)
+                if similarity >= threshold and (best is None or similarity > best.similarity):
+                    best = FuzzyMatch(key, entry.source_text, entry.target_text, similarity)
+
+            if best:
+                self.fuzzy_hits += 1
+            return best
+
+    def _build_fuzzy_index(self):
+        """Index all stored source segments for fuzzy lookup."""
+        self._fuzzy_index = FuzzyIndex()
+        entries = list(self.backend.iter_entries()) + list(self._pending.values())
+        for entry in entries:
+            self._fuzzy_index.add(
+                entry.source_hash, entry.source_text, f"{entry.source_lang}|{entry.target_lang}"
+            )
+        debug(f"Built fuzzy index over {self._fuzzy_index.size} segments")
 
     def get_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
@@ -135,8 +394,9 @@ class TranslationMemory:
         return {
             "hits": self.hits,
             "misses": self.misses,
-            "total_entries": len(self.memory),
+            "total_entries": self.backend.count() + len(self._pending),
             "hit_rate": hit_rate,
+            "fuzzy_hits": self.fuzzy_hits,
         }
 
 
@@ -155,32 +415,138 @@ class Translator:
             use_cache: Whether to use translation memory cache.
         """
         self.config = config or TranslatorConfig.load()
-        self.parser = MarkdownParser(preserve_terms=self.config.preserve_terms)
+        self.parser = MarkdownParser(
+            preserve_terms=self.config.preserve_terms,
+            segmenter=SentenceSegmenter() if self.config.segmentation == "sentence" else None,
+        )
         self.provider: Optional[BaseProvider] = None
+        self.masker: Optional[PlaceholderMasker] = None
+        self.dispatcher = Dispatcher(
+            concurrency=self.config.concurrency,
+            max_concurrency=self.config.max_concurrency,
+            adaptive=self.config.adaptive_concurrency,
+        )
+        # A pool spans providers, so it uses the global hedging settings
+        self.hedger = Hedger(
+            self.config.hedging
+            if self.config.provider_pool
+            else self.config.get_hedging(self.config.active_provider),
+            max_workers=2 * self.dispatcher.concurrency,
+        )
+        self.packer = RequestPacker.for_model(
+            self.config.get_model(), self.config.max_tokens, self.config.batch_size
+        )
         self.use_cache = use_cache
+
+        if self.config.masking:
+            self.masker = PlaceholderMasker(self.config.preserve_terms)
         self.memory: Optional[TranslationMemory] = None
+        self._manifest: Optional[BuildManifest] = None
+        self._fingerprints: Dict[Tuple[str, str], str] = {}
 
         if use_cache:
-            self.memory = TranslationMemory(self.config.cache_dir)
+            self.memory = TranslationMemory(
+                self.config.cache_dir,
+                backend=self.config.cache_backend,
+                policy=self.config.cache_eviction,
+            )
+
+    @property
+    def manifest(self) -> BuildManifest:
+        """Build manifest of the cache directory, loaded on first use."""
+        if self._manifest is None:
+            self._manifest = BuildManifest(self.config.cache_dir)
+        return self._manifest
 
     def _ensure_provider(self):
         """Ensure provider is initialized."""
         if self.provider is None:
-            api_key = self.config.get_api_key()
-            if not api_key:
-                raise ValueError(
-                    f"No API key found for {self.config.active_provider}. "
-                    f"Run 'docs-translator configure' to set up."
+            if self.config.provider_pool:
+                self.provider = self._create_pool()
+            else:
+                self.provider = self._create_limited_provider(
+                    self.config.active_provider, self.config.get_model()
                 )
 
-            self.provider = create_provider(
-                provider_name=self.config.active_provider,
-                api_key=api_key,
-                model=self.config.get_model(),
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
+    def _create_pool(self) -> CompositeProvider:
+        """Create a load-balanced provider from the configured pool.
+
+        Members without an API key are left out.
+        """
+        backends = []
+        for member in self.config.provider_pool:
+            model = member.model or self.config.get_model(member.provider)
+            try:
+                provider = self._create_limited_provider(member.provider, model)
+                backends.append((provider, member.weight))
+            except ValueError as e:
+                warning(f"Leaving {member.provider}/{model} out of the pool: {e}")
+        if not backends:
+            raise ValueError("No provider in the pool has an API key")
+        debug(f"Provider pool: {', '.join(provider.model for provider, _ in backends)}")
+        return CompositeProvider(backends, max_tokens=self.config.max_tokens)
+
+    def _create_limited_provider(self, provider_name: str, model: str) -> BaseProvider:
+        """Create a provider with the shared rate limiter for its model.
+
+        With several API keys, each key gets a provider and rate limiter of
+        its own, pooled behind a ``KeyPool``.
+        """
+        rpm, tpm = self.config.get_rate_limits(provider_name, model)
+        api_keys = self.config.get_provider_config(provider_name).get_api_keys(provider_name)
+        if len(api_keys) <= 1:
+            return self._create_provider(
+                provider_name,
+                model,
+                rate_limiter=get_rate_limiter(provider_name, model, rpm, tpm),
+            )
+
+        debug(f"Using {len(api_keys)} API keys for {provider_name}/{model}")
+        return KeyPool(
+            [
+                self._create_provider(
+                    provider_name,
+                    model,
+                    rate_limiter=get_rate_limiter(provider_name, model, rpm, tpm, api_key),
+                    api_key=api_key,
+                )
+                for api_key in api_keys
+            ],
+            max_tokens=self.config.max_tokens,
+        )
+
+    def _create_provider(
+        self,
+        provider_name: str,
+        model: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        api_key: Optional[str] = None,
+    ) -> BaseProvider:
+        """Create a provider from its configuration.
+
+        ``api_key`` defaults to the provider's first configured key.
+        """
+        provider_config = self.config.get_provider_config(provider_name)
+        api_key = api_key or provider_config.get_api_key(provider_name)
+        if not api_key:
+            raise ValueError(
+                f"No API key found for {provider_name}. "
+                f"Run 'docs-translator configure' to set up."
             )
 
+        return create_provider(
+            provider_name=provider_name,
+            api_key=api_key,
+            model=model,
+            temperature=self.config.temperature,
+            max_tokens=self.config.max_tokens,
+            rate_limiter=rate_limiter,
+            http=self.config.http,
+            prompt_caching=self.config.prompt_caching,
+            cache_ttl=self.config.prompt_cache_ttl,
+            base_url=provider_config.base_url,
+        )
+
     def translate_text(
         self,
         text: str,
@@ -204,36 +570,492 @@ class Translator:
         source = source_lang or self.config.default_source_lang
         target = target_lang or self.config.default_target_lang
 
-        # Check cache
+        masked, cached = self._lookup(text, source, target, context)
+        if cached is None:
+            task = partial(self._translate_miss, masked, text, source, target, context)
+            cached = self.dispatcher.run([task])[0]
+        return relayout(cached, text)
+
+    async def atranslate_text(
+        self,
+        text: str,
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+        context: str = "paragraph",
+    ) -> str:
+        """Translate a single piece of text without blocking the event loop.
+
+        Concurrent calls share the translator's concurrency window.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            context: Context type for translation
+
+        Returns:
+            Translated text
+        """
+        self._ensure_provider()
+
+        source = source_lang or self.config.default_source_lang
+        target = target_lang or self.config.default_target_lang
+
+        masked, cached = self._lookup(text, source, target, context)
+        if cached is None:
+            task = partial(self._atranslate_miss, masked, text, source, target, context)
+            cached = (await self.dispatcher.arun([task]))[0]
+        return relayout(cached, text)
+
+    def _lookup(
+        self, text: str, source: str, target: str, context: str
+    ) -> Tuple[MaskedText, Optional[str]]:
+        """Look up a text in translation memory.
+
+        Returns:
+            The canonical masked text (the cache key) and the restored cached
+            translation, or None on a miss
+        """
+        masked = self._canonicalize(text)
         if self.memory:
-            cached = self.memory.get(text, source, target, context)
+            cached = self.memory.get(masked.text, source, target, context)
             if cached:
-                return cached
+                return masked, self._restore(cached, masked)
+            if masked.text != text:
+                # Entry from before keys were masked and canonical
+                def convert(translation: str) -> Optional[str]:
+                    remasked = self._remask(translation, masked)
+                    return canonicalize(remasked) if remasked is not None else None
+
+                cached = self.memory.migrate(text, masked.text, source, target, context, convert)
+                if cached:
+                    return masked, cached
+        return masked, None
+
+    def _translate_miss(
+        self, masked: MaskedText, text: str, source: str, target: str, context: str
+    ) -> str:
+        """Translate a text that missed the exact cache, and cache the result.
+
+        Safe to call from worker threads.
+        """
+        match, translated = self._prepare_miss(masked, text, source, target)
+        if translated is None:
+            translated = self._request_translation(
+                masked, text, self._system_prompt(source, target), context, match
+            )
+            self._store(masked, translated, source, target, context, self._served_model())
+        else:
+            self._store(masked, translated, source, target, context)
+        return translated
+
+    async def _atranslate_miss(
+        self, masked: MaskedText, text: str, source: str, target: str, context: str
+    ) -> str:
+        """Async variant of ``_translate_miss``."""
+        match, translated = self._prepare_miss(masked, text, source, target)
+        if translated is None:
+            translated = await self._arequest_translation(
+                masked, text, self._system_prompt(source, target), context, match
+            )
+            self._store(masked, translated, source, target, context, self._served_model())
+        else:
+            self._store(masked, translated, source, target, context)
+        return translated
+
+    def _prepare_miss(
+        self, masked: MaskedText, text: str, source: str, target: str
+    ) -> Tuple[Optional[FuzzyMatch], Optional[str]]:
+        """Look for a fuzzy match.
+
+        Returns:
+            The fuzzy match (if any) and a translation reused from that
+            match, or None if a request is needed
+        """
+        # Near-duplicate of a cached segment: reuse it outright or ask for an update
+        match = None
+        if self.memory and self.config.fuzzy_threshold:
+            match = self.memory.get_fuzzy(
+                masked.text, source, target, self.config.fuzzy_threshold
+            )
 
-        # Build prompt and translate
-        system_prompt = PromptBuilder.build_system_prompt(
+        translated = None
+        if match and match.similarity >= self.config.fuzzy_reuse_threshold:
+            debug(f"Reusing fuzzy match ({match.similarity:.0%}) for: {text[:50]}")
+            translated = self._restore(match.target_text, masked)
+        elif match:
+            debug(f"Updating fuzzy match ({match.similarity:.0%}) for: {text[:50]}")
+        return match, translated
+
+    def _store(
+        self,
+        masked: MaskedText,
+        translated: str,
+        source: str,
+        target: str,
+        context: str,
+        model: Optional[str] = None,
+    ):
+        """Cache a translation under its canonical masked key.
+
+        ``model`` is the model that produced it; defaults to the configured one.
+        """
+        if not self.memory:
+            return
+        cache_text = self._remask(translated, masked)
+        if cache_text is not None:
+            self.memory.set(
+                text=masked.text,
+                translation=cache_text,
+                source_lang=source,
+                target_lang=target,
+                context=context,
+                model=model or self.config.get_model(),
+            )
+
+    def _served_model(self) -> Optional[str]:
+        """Model of the pool member that served the last request in this thread or task."""
+        if isinstance(self.provider, CompositeProvider):
+            return served_model.get()
+        return None
+
+    def _translate_batch(self, segments: List[Segment], source: str, target: str) -> List[str]:
+        """Translate several misses in one ID-tagged request, and cache them.
+
+        Segments with a fuzzy match get their own update request. Segments
+        missing from the response, or whose placeholders did not survive,
+        are retried one by one. Each translation is cached as soon as it
+        arrives; if a follow-up fails transiently and the dispatcher reruns
+        the batch, the segments already cached are not requested again.
+
+        Returns:
+            Translations in the order of ``segments``
+        """
+        if len(segments) == 1:
+            segment = segments[0]
+            return [
+                self._translate_miss(
+                    segment.masked, segment.text, source, target, segment.context
+                )
+            ]
+
+        translations, prompts = self._prepare_batch(segments, source, target)
+        batched = [i for i, match in prompts.items() if match is None]
+        if len(batched) > 1:
+            response = self._send(
+                build_batch_prompt([segments[i] for i in batched]),
+                self._system_prompt(source, target),
+            )
+            model = self._served_model()
+            for index, translated in self._accept_batch(response, segments, batched).items():
+                translations[index] = translated
+                # Cached before the follow-ups, so a retry after one fails reuses it
+                segment = segments[index]
+                self._store(segment.masked, translated, source, target, segment.context, model)
+
+        for index, match in prompts.items():
+            if translations[index] is None:
+                segment = segments[index]
+                translations[index] = self._request_translation(
+                    segment.masked,
+                    segment.text,
+                    self._system_prompt(source, target),
+                    segment.context,
+                    match,
+                )
+                self._store(
+                    segment.masked,
+                    translations[index],
+                    source,
+                    target,
+                    segment.context,
+                    self._served_model(),
+                )
+        return translations
+
+    async def _atranslate_batch(
+        self, segments: List[Segment], source: str, target: str
+    ) -> List[str]:
+        """Async variant of ``_translate_batch``."""
+        if len(segments) == 1:
+            segment = segments[0]
+            return [
+                await self._atranslate_miss(
+                    segment.masked, segment.text, source, target, segment.context
+                )
+            ]
+
+        translations, prompts = self._prepare_batch(segments, source, target)
+        batched = [i for i, match in prompts.items() if match is None]
+        if len(batched) > 1:
+            response = await self._asend(
+                build_batch_prompt([segments[i] for i in batched]),
+                self._system_prompt(source, target),
+            )
+            model = self._served_model()
+            for index, translated in self._accept_batch(response, segments, batched).items():
+                translations[index] = translated
+                # Cached before the follow-ups, so a retry after one fails reuses it
+                segment = segments[index]
+                self._store(segment.masked, translated, source, target, segment.context, model)
+
+        for index, match in prompts.items():
+            if translations[index] is None:
+                segment = segments[index]
+                translations[index] = await self._arequest_translation(
+                    segment.masked,
+                    segment.text,
+                    self._system_prompt(source, target),
+                    segment.context,
+                    match,
+                )
+                self._store(
+                    segment.masked,
+                    translations[index],
+                    source,
+                    target,
+                    segment.context,
+                    self._served_model(),
+                )
+        return translations
+
+    def _prepare_batch(
+        self, segments: List[Segment], source: str, target: str
+    ) -> Tuple[List[Optional[str]], Dict[int, Optional[FuzzyMatch]]]:
+        """Resolve cached and fuzzy reuse for each segment of a batch.
+
+        A segment is only in the memory here if an earlier attempt at this
+        batch cached it.
+
+        Returns:
+            Translations reused from the memory or fuzzy matches (None where
+            a request is needed), and the fuzzy match of each segment that
+            needs a request
+        """
+        translations: List[Optional[str]] = []
+        prompts: Dict[int, Optional[FuzzyMatch]] = {}
+        for index, segment in enumerate(segments):
+            if self.memory:
+                cached = self.memory.get(
+                    segment.masked.text, source, target, segment.context, record=False
+                )
+                if cached:
+                    translations.append(self._restore(cached, segment.masked))
+                    continue
+            match, translated = self._prepare_miss(segment.masked, segment.text, source, target)
+            translations.append(translated)
+            if translated is None:
+                prompts[index] = match
+            else:
+                self._store(segment.masked, translated, source, target, segment.context)
+        return translations, prompts
+
+    def _system_prompt(self, source: str, target: str) -> str:
+        """System prompt shared by every request for this language pair.
+
+        It does not vary with the unit's context, so the provider can serve
+        it from its prompt cache.
+        """
+        return PromptBuilder.build_system_prompt(
             source_lang=source,
             target_lang=target,
             preserve_terms=self.config.preserve_terms,
             style=self.config.translation_style,
-            context=context,
         )
 
-        translated = self.provider.translate(text, system_prompt)
+    def _fingerprint(self, source: str, target: str) -> str:
+        """Hash of the settings that shape a translation, for the build manifest.
 
-        # Cache result
-        if self.memory:
-            self.memory.set(
-                text=text,
-                translation=translated,
-                source_lang=source,
-                target_lang=target,
-                context=context,
-                model=self.config.get_model(),
+        Covers the models, the rendered system prompt (template, style,
+        preserve terms and languages), the user, update and batch prompt
+        templates, temperature, batch size, segmentation and masking.
+        """
+        if (source, target) in self._fingerprints:
+            return self._fingerprints[source, target]
+        if self.config.provider_pool:
+            models = [
+                f"{member.provider}/{member.model or self.config.get_model(member.provider)}"
+                for member in self.config.provider_pool
+            ]
+        else:
+            models = [f"{self.config.active_provider}/{self.config.get_model()}"]
+        settings = {
+            "models": models,
+            "system_prompt": self._system_prompt(source, target),
+            # Rendered with placeholders, so a change to any template shows up
+            "user_prompt": PromptBuilder.build_user_prompt("{text}", "{context}"),
+            "update_prompt": PromptBuilder.build_update_prompt(
+                "{text}", "{previous_source}", "{previous_translation}", "{context}"
+            ),
+            "batch_prompt": PromptBuilder.build_batch_prompt(
+                [{"id": 1, "context": "{context}", "text": "{text}"}]
+            ),
+            "temperature": self.config.temperature,
+            "batch_size": self.config.batch_size,
+            "segmentation": self.config.segmentation,
+            "masking": self.config.masking,
+            "source": source,
+            "target": target,
+        }
+        encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+        fingerprint = hashlib.sha256(encoded).hexdigest()
+        self._fingerprints[source, target] = fingerprint
+        return fingerprint
+
+    def _accept_batch(
+        self, response: str, segments: List[Segment], batched: List[int]
+    ) -> Dict[int, str]:
+        """Match a batch response back to segments and restore their spans.
+
+        Returns:
+            Translations keyed by segment index, for the segments that parsed
+        """
+        parsed = parse_batch_response(response, len(batched))
+        accepted: Dict[int, str] = {}
+        for segment_id, index in enumerate(batched, 1):
+            translated = parsed.get(segment_id)
+            if translated:
+                translated = self._restore(translated, segments[index].masked)
+            if translated:
+                accepted[index] = translated
+
+        retried = len(batched) - len(accepted)
+        debug(f"Batch of {len(batched)} segments, {retried} to retry individually")
+        if retried == len(batched):
+            warning(f"Could not parse batch response; retrying {retried} segments individually")
+        return accepted
+
+    def _canonicalize(self, text: str) -> MaskedText:
+        """Mask protected spans and normalise whitespace.
+
+        The result is both the cache key and the text sent to the provider,
+        so re-wrapped paragraphs, trailing spaces and edits inside masked
+        spans all map to the same translation memory entry.
+        """
+        masked = self.masker.mask(text) if self.masker else MaskedText(text)
+        masked.text = canonicalize(masked.text)
+        return masked
+
+    def _restore(self, translation: str, masked: MaskedText) -> Optional[str]:
+        """Re-insert the original spans into a masked translation."""
+        if not self.masker:
+            return translation
+        try:
+            return self.masker.unmask(translation, masked)
+        except MaskingError:
+            return None
+
+    def _remask(self, translation: str, masked: MaskedText) -> Optional[str]:
+        """Turn a final translation back into its cacheable masked form."""
+        if not self.masker or not masked.spans:
+            return translation
+        remasked = self.masker.mask(translation, list(masked.spans))
+        if len(remasked.spans) != len(masked.spans) or remasked.placeholders != masked.placeholders:
+            return None
+        return remasked.text
+
+    def _request_translation(
+        self,
+        masked: MaskedText,
+        original: str,
+        system_prompt: str,
+        context: str,
+        match: Optional[FuzzyMatch] = None,
+    ) -> str:
+        """Send one translation request to the provider.
+
+        The masked text is sent and its spans restored afterwards. If the
+        model does not return every placeholder exactly once, the original
+        text is sent again without masking.
+        """
+        translated = self._send(self._build_user_prompt(masked, context, match), system_prompt)
+        if not masked.spans:
+            return translated
+
+        try:
+            return self.masker.unmask(translated, masked)
+        except MaskingError as e:
+            warning(f"{e}; retrying without placeholders")
+            return self._send(PromptBuilder.build_user_prompt(original, context), system_prompt)
+
+    async def _arequest_translation(
+        self,
+        masked: MaskedText,
+        original: str,
+        system_prompt: str,
+        context: str,
+        match: Optional[FuzzyMatch] = None,
+    ) -> str:
+        """Async variant of ``_request_translation``."""
+        translated = await self._asend(
+            self._build_user_prompt(masked, context, match), system_prompt
+        )
+        if not masked.spans:
+            return translated
+
+        try:
+            return self.masker.unmask(translated, masked)
+        except MaskingError as e:
+            warning(f"{e}; retrying without placeholders")
+            return await self._asend(
+                PromptBuilder.build_user_prompt(original, context), system_prompt
             )
 
+    def _send(self, text: str, system_prompt: str) -> str:
+        """Send one request within the concurrency window and report its outcome.
+
+        A slow request may be hedged with a duplicate outside the window.
+        """
+        controller = self.dispatcher.controller
+        with controller.slot():
+            elapsed = start_timer()
+            try:
+                translated = self.hedger.call(
+                    self.provider.model,
+                    estimate_tokens(text),
+                    partial(self.provider.translate, text, system_prompt),
+                )
+            except RateLimitError:
+                controller.record_throttle()
+                raise
+            controller.record_success(elapsed(), estimate_tokens(text))
+        return translated
+
+    async def _asend(self, text: str, system_prompt: str) -> str:
+        """Async variant of ``_send``.
+
+        The window is shared with the sync path, so it caps requests across
+        all files and calls on this translator.
+        """
+        controller = self.dispatcher.controller
+        async with controller.aslot():
+            elapsed = start_timer()
+            try:
+                translated = await self.hedger.acall(
+                    self.provider.model,
+                    estimate_tokens(text),
+                    partial(self.provider.atranslate, text, system_prompt),
+                )
+            except RateLimitError:
+                controller.record_throttle()
+                raise
+            controller.record_success(elapsed(), estimate_tokens(text))
         return translated
 
+    def _build_user_prompt(
+        self, masked: MaskedText, context: str, match: Optional[FuzzyMatch]
+    ) -> str:
+        """Build the user message, or an update request for a fuzzy match.
+
+        Cached segments are stored in masked form, so placeholders in the
+        previous source and translation line up with those in ``masked``.
+        """
+        if not match:
+            return PromptBuilder.build_user_prompt(masked.text, context)
+        return PromptBuilder.build_update_prompt(
+            masked.text, match.source_text, match.target_text, context
+        )
+
     def translate_file(
         self,
         input_path: str,
@@ -242,9 +1064,15 @@ class Translator:
         target_lang: Optional[str] = None,
         dry_run: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        force: bool = False,
     ) -> TranslationResult:
         """Translate a Markdown file.
 
+        If the output was written by an earlier run with the same settings,
+        only the blocks of the source changed since then are translated; the
+        rest are copied from the output as it is now, so edits made to it
+        are kept (see ``_reuse_output``).
+
         Args:
             input_path: Path to input file
             output_path: Path for output file. If None, auto-generated.
@@ -252,13 +1080,94 @@ class Translator:
             target_lang: Target language code
             dry_run: If True, don't actually translate, just analyze
             progress_callback: Callback for progress updates (current, total)
+            force: Translate every block, reusing nothing from the existing output
 
         Returns:
             TranslationResult with statistics
         """
-        import time
+        start_time = time.time()
+        source, target, result = self._start_file(input_path, output_path, source_lang, target_lang)
+
+        try:
+            stat = None if dry_run else Path(input_path).stat()  # Before it is read
+            # Parse document
+            doc = self.parser.parse_file(input_path)
+            result.total_blocks = doc.total_blocks
+            if not force:
+                self._reuse_output(doc, result, source, target)
 
+            if dry_run:
+                self._analyze_document(doc, source, target, result)
+            else:
+                # Actually translate
+                self._ensure_provider()
+                translated_content = self._translate_document(
+                    doc, source, target, progress_callback
+                )
+                self._finish_file(doc, translated_content, result)
+                self._record_build(result, source, target, stat)
+
+            result.success = True
+
+        except Exception as e:
+            result.error = str(e)
+            result.success = False
+
+        result.duration_seconds = time.time() - start_time
+        return result
+
+    async def atranslate_file(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+        dry_run: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        force: bool = False,
+    ) -> TranslationResult:
+        """Translate a Markdown file without blocking the event loop.
+
+        Same arguments and result as ``translate_file``. Requests go through
+        the provider's async client, at most ``concurrency`` at a time.
+        """
         start_time = time.time()
+        source, target, result = self._start_file(input_path, output_path, source_lang, target_lang)
+
+        try:
+            stat = None if dry_run else Path(input_path).stat()
+            doc = self.parser.parse_file(input_path)
+            result.total_blocks = doc.total_blocks
+            if not force:
+                self._reuse_output(doc, result, source, target)
+
+            if dry_run:
+                self._analyze_document(doc, source, target, result)
+            else:
+                self._ensure_provider()
+                translated_content = await self._atranslate_document(
+                    doc, source, target, progress_callback
+                )
+                self._finish_file(doc, translated_content, result)
+                self._record_build(result, source, target, stat)
+
+            result.success = True
+
+        except Exception as e:
+            result.error = str(e)
+            result.success = False
+
+        result.duration_seconds = time.time() - start_time
+        return result
+
+    def _start_file(
+        self,
+        input_path: str,
+        output_path: Optional[str],
+        source_lang: Optional[str],
+        target_lang: Optional[str],
+    ) -> Tuple[str, str, TranslationResult]:
+        """Resolve languages and output path for one file."""
         source = source_lang or self.config.default_source_lang
         target = target_lang or self.config.default_target_lang
 
@@ -272,64 +1181,186 @@ class Translator:
             output_path=output_path,
             success=False,
         )
+        return source, target, result
 
-        try:
-            # Parse document
-            doc = self.parser.parse_file(input_path)
-            result.total_blocks = doc.total_blocks
-
-            if dry_run:
-                # Just count what would be translated
-                for block in doc.blocks:
-                    if block.needs_translation():
-                        for unit in block.units:
-                            if unit.action == TranslationAction.TRANSLATE:
-                                if self.memory:
-                                    cached = self.memory.get(
-                                        unit.content, source, target, unit.context
-                                    )
-                                    if cached:
-                                        result.cached_blocks += 1
-                                    else:
-                                        result.translated_blocks += 1
-                                else:
-                                    result.translated_blocks += 1
-                    else:
-                        result.skipped_blocks += 1
-
-                result.success = True
+    def _analyze_document(
+        self, doc: ParsedDocument, source: str, target: str, result: TranslationResult
+    ):
+        """Count what would be translated (dry run)."""
+        for block in doc.blocks:
+            if block.translated_content is not None:
+                if not block.needs_translation():
+                    result.skipped_blocks += 1
+            elif block.needs_translation():
+                for unit in block.units:
+                    if unit.action == TranslationAction.TRANSLATE:
+                        if self.memory:
+                            _, cached = self._lookup(unit.content, source, target, unit.context)
+                            if cached is not None:
+                                result.cached_blocks += 1
+                            else:
+                                result.translated_blocks += 1
+                        else:
+                            result.translated_blocks += 1
             else:
-                # Actually translate
-                self._ensure_provider()
-                translated_content = self._translate_document(
-                    doc, source, target, progress_callback
-                )
+                result.skipped_blocks += 1
 
-                # Count statistics
-                for block in doc.blocks:
-                    if block.needs_translation():
-                        result.translated_blocks += 1
-                    else:
-                        result.skipped_blocks += 1
+    def _finish_file(self, doc: ParsedDocument, translated_content: str, result: TranslationResult):
+        """Count statistics, write the output and save the cache."""
+        self._write_document(doc, translated_content, result)
+        if self.memory:
+            # Keep the memory bounded on long-lived shared cache directories
+            self.memory.evict_if_grown()
+        self._record_stats(result)
 
-                # Write output
-                output_p = Path(output_path)
-                output_p.parent.mkdir(parents=True, exist_ok=True)
-                output_p.write_text(translated_content, encoding="utf-8")
+    def _write_document(
+        self, doc: ParsedDocument, translated_content: str, result: TranslationResult
+    ):
+        """Count the document's blocks, note which were written and write the output."""
+        for block in doc.blocks:
+            if not block.needs_translation():
+                result.skipped_blocks += 1
+        result.translated_blocks += doc.translatable_blocks - result.reused_blocks
+        result.block_hashes = [
+            (block.block_type, block_hash(block.raw_content))
+            for block in doc.blocks
+            if block.translated_content.rstrip("\n")
+        ]
+
+        output_p = Path(result.output_path)
+        output_p.parent.mkdir(parents=True, exist_ok=True)
+        output_p.write_text(translated_content, encoding="utf-8")
+
+    def _record_stats(self, result: TranslationResult):
+        """Copy the run's cache, concurrency, token and hedging counters into a result."""
+        if self.memory:
+            result.cached_blocks = self.memory.hits
+
+        concurrency = self.dispatcher.controller.get_stats()
+        result.concurrency_window = concurrency["window"]
+        result.throttles = concurrency["throttles"]
+        result.latency_spikes = concurrency["latency_spikes"]
+        if self.provider:
+            usage = self.provider.usage.to_dict()
+            result.input_tokens = usage["input_tokens"]
+            result.cached_input_tokens = usage["cached_tokens"]
+        hedging = self.hedger.stats()
+        result.hedged_requests = hedging["hedged"]
+        result.hedge_wins = hedging["hedge_wins"]
+
+    def _record_build(
+        self,
+        result: TranslationResult,
+        source: str,
+        target: str,
+        stat: os.stat_result,
+    ):
+        """Record a written file in the build manifest and save it."""
+        self.manifest.record(
+            Path(result.source_path),
+            Path(result.output_path),
+            self._fingerprint(source, target),
+            stat,
+            result.block_hashes,
+        )
+        self.manifest.save()
 
-                # Save cache
-                if self.memory:
-                    self.memory.save()
-                    stats = self.memory.get_stats()
-                    result.cached_blocks = stats["hits"]
+    def _reuse_output(
+        self, doc: ParsedDocument, result: TranslationResult, source: str, target: str
+    ):
+        """Fill in the blocks unchanged since the output was written, from that output.
+
+        The source's blocks are diffed against those the build manifest
+        recorded for the output. A block in an unchanged run takes its text
+        from the output file as it is now, reviewer edits included, and
+        needs neither a request nor a cache lookup. If the output no longer
+        splits into the recorded blocks, e.g. a reviewer added a paragraph,
+        nothing is reused.
+        """
+        previous = self.manifest.previous_blocks(
+            Path(result.source_path), Path(result.output_path), self._fingerprint(source, target)
+        )
+        if not previous:
+            return
+        try:
+            existing = self.parser.split_blocks(
+                Path(result.output_path).read_text(encoding="utf-8")
+            )
+        except (OSError, UnicodeDecodeError):
+            return
+        if [block_type for block_type, _ in existing] != [block_type for block_type, _ in previous]:
+            verbose(
+                f"{result.output_path} no longer matches its source block for block; "
+                "translating it in full"
+            )
+            return
 
-                result.success = True
+        current = [(block.block_type, block_hash(block.raw_content)) for block in doc.blocks]
+        matcher = difflib.SequenceMatcher(None, previous, current, autojunk=False)
+        for tag, old_start, _, new_start, new_end in matcher.get_opcodes():
+            if tag != "equal":
+                continue
+            for offset in range(new_end - new_start):
+                block = doc.blocks[new_start + offset]
+                block.translated_content = existing[old_start + offset][1]
+                if block.needs_translation():
+                    result.reused_blocks += 1
+        debug(f"{result.output_path}: reusing {result.reused_blocks} unchanged blocks")
+
+    @staticmethod
+    def _units_to_translate(doc: ParsedDocument) -> List[TranslationUnit]:
+        """Translatable units of the blocks not reused from the existing output."""
+        return [
+            unit
+            for block in doc.blocks
+            if block.translated_content is None
+            for unit in block.units
+            if unit.action == TranslationAction.TRANSLATE
+        ]
+
+    def _prepare_file(
+        self, index: int, result: TranslationResult, source: str, target: str, force: bool
+    ) -> Union["_PendingFile", TranslationResult]:
+        """Parse a file of a directory run and look its units up in the cache.
+
+        Blocks unchanged since the output was written are reused from it
+        unless ``force`` is set. A file the output and cache cover entirely
+        is assembled and written right away. Runs in a parse thread, or in
+        a worker process with ``jobs``.
 
+        Returns:
+            The file with its cached translations filled in, or its final
+            result if it was written or could not be parsed
+        """
+        try:
+            doc = self.parser.parse_file(result.source_path)
+        except Exception as e:
+            result.error = str(e)
+            return result
+        result.total_blocks = doc.total_blocks
+        if not force:
+            self._reuse_output(doc, result, source, target)
+        units = self._units_to_translate(doc)
+        pieces, splits = self._split_oversized(units)
+        translations = [
+            self._lookup(piece.content, source, target, piece.context)[1] for piece in pieces
+        ]
+        pending = _PendingFile(index, doc, units, pieces, splits, result, translations)
+        if None in translations:
+            return pending
+        return self._render_file(pending)
+
+    def _render_file(self, pending: "_PendingFile") -> TranslationResult:
+        """Assemble and write a file whose translations are all filled in."""
+        result = pending.result
+        try:
+            content = self._assemble_document(
+                pending.doc, pending.units, self._join_split(pending.splits, pending.translations)
+            )
+            self._write_document(pending.doc, content, result)
+            result.success = True
         except Exception as e:
             result.error = str(e)
-            result.success = False
-
-        result.duration_seconds = time.time() - start_time
         return result
 
     def _translate_document(
@@ -340,39 +1371,95 @@ class Translator:
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> str:
         """Translate a parsed document and reconstruct Markdown."""
-        translated_blocks = []
-        total_units = len(doc.get_translatable_units())
-        current_unit = 0
+        units = self._units_to_translate(doc)
+        pieces, splits = self._split_oversized(units)
+        translations = self._translate_units(pieces, source_lang, target_lang, progress_callback)
+        return self._assemble_document(doc, units, self._join_split(splits, translations))
+
+    async def _atranslate_document(
+        self,
+        doc: ParsedDocument,
+        source_lang: str,
+        target_lang: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> str:
+        """Async variant of ``_translate_document``."""
+        units = self._units_to_translate(doc)
+        pieces, splits = self._split_oversized(units)
+        translations = await self._atranslate_units(
+            pieces, source_lang, target_lang, progress_callback
+        )
+        return self._assemble_document(doc, units, self._join_split(splits, translations))
+
+    def _split_oversized(
+        self, units: List[TranslationUnit]
+    ) -> Tuple[List[TranslationUnit], List[List[Tuple[str, str]]]]:
+        """Split units too large for one request into pieces.
+
+        Returns:
+            The units to translate, and for each original unit its
+            (piece, separator) pairs
+        """
+        pieces: List[TranslationUnit] = []
+        splits: List[List[Tuple[str, str]]] = []
+        for unit in units:
+            parts = self.packer.split(unit.content)
+            if len(parts) == 1:
+                pieces.append(unit)
+            else:
+                pieces.extend(
+                    TranslationUnit(content=piece, action=unit.action, context=unit.context)
+                    for piece, _ in parts
+                )
+            splits.append(parts)
+        return pieces, splits
+
+    @staticmethod
+    def _join_split(
+        splits: List[List[Tuple[str, str]]], translations: List[str]
+    ) -> List[str]:
+        """Join the translated pieces of split units back together."""
+        joined = []
+        cursor = 0
+        for parts in splits:
+            joined.append(join_pieces(parts, translations[cursor : cursor + len(parts)]))
+            cursor += len(parts)
+        return joined
+
+    def _assemble_document(
+        self, doc: ParsedDocument, units: List[TranslationUnit], translations: List[str]
+    ) -> str:
+        """Reconstruct Markdown from the translations of ``units``.
+
+        Blocks whose ``translated_content`` is already set are kept as they
+        are; it is filled in for the rest.
+        """
+        for unit, translated_text in zip(units, translations):
+            # Wrapped like the source, which was sent with its soft breaks folded
+            unit.translated = relayout(translated_text, unit.content)
 
+        translated_blocks = []
         for block in doc.blocks:
+            if block.translated_content is not None:
+                # Reused from the existing output
+                translated_blocks.append(block.translated_content)
+                continue
+
             if not block.needs_translation():
                 # Keep as-is
+                block.translated_content = block.raw_content
                 translated_blocks.append(block.raw_content)
                 continue
 
-            # Translate each unit in the block
-            translated_units = []
-            for unit in block.units:
-                if unit.action == TranslationAction.TRANSLATE:
-                    translated_text = self.translate_text(
-                        text=unit.content,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        context=unit.context,
-                    )
-                    unit.translated = translated_text
-                    translated_units.append(translated_text)
-
-                    current_unit += 1
-                    if progress_callback:
-                        progress_callback(current_unit, total_units)
-                else:
-                    # Keep original
-                    translated_units.append(unit.content)
+            # Translated units, original content for the rest
+            translated_units = [
+                unit.translated if unit.action == TranslationAction.TRANSLATE else unit.content
+                for unit in block.units
+            ]
 
             # Reconstruct block with translations
-            translated_block = self._reconstruct_block(block, translated_units)
-            translated_blocks.append(translated_block)
+            block.translated_content = self._reconstruct_block(block, translated_units)
+            translated_blocks.append(block.translated_content)
 
         # Join blocks - strip trailing newlines first, then join with double newline
         result_parts = []
@@ -383,10 +1470,139 @@ class Translator:
         
         return "\n\n".join(result_parts) + "\n"
 
+    def _translate_units(
+        self,
+        units: List[TranslationUnit],
+        source_lang: str,
+        target_lang: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[str]:
+        """Translate units, dispatching all cache misses concurrently.
+
+        Cache lookups happen up front. Identical misses are requested once.
+        Results land in an ordered buffer, so the returned list matches
+        ``units`` regardless of completion order. Requests that fail
+        transiently are retried from the dispatcher's delay queue.
+        """
+        report = self._progress_reporter(len(units), progress_callback)
+        results, misses = self._plan_units(units, source_lang, target_lang, report)
+        batches = self._batch_misses(units, misses)
+
+        tasks = [
+            partial(
+                self._translate_batch, [segment for segment, _ in batch], source_lang, target_lang
+            )
+            for batch in batches
+        ]
+
+        def on_done(task_index: int, translations: List[str]):
+            for (_, waiting), translated in zip(batches[task_index], translations):
+                for index in waiting:
+                    results[index] = translated
+                report(len(waiting))
+
+        self.dispatcher.run(tasks, on_done)
+        return results
+
+    async def _atranslate_units(
+        self,
+        units: List[TranslationUnit],
+        source_lang: str,
+        target_lang: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[str]:
+        """Async variant of ``_translate_units``.
+
+        Misses run as concurrent tasks; the concurrency window bounds how many
+        reach the provider at once. Transient failures are retried after a
+        backoff; on any other failure the rest are cancelled.
+        """
+        report = self._progress_reporter(len(units), progress_callback)
+        results, misses = self._plan_units(units, source_lang, target_lang, report)
+
+        batches = self._batch_misses(units, misses)
+
+        tasks = [
+            partial(
+                self._atranslate_batch, [segment for segment, _ in batch], source_lang, target_lang
+            )
+            for batch in batches
+        ]
+
+        def on_done(task_index: int, translations: List[str]):
+            for (_, waiting), translated in zip(batches[task_index], translations):
+                for index in waiting:
+                    results[index] = translated
+                report(len(waiting))
+
+        await self.dispatcher.arun(tasks, on_done)
+        return results
+
+    def _plan_units(
+        self,
+        units: List[TranslationUnit],
+        source_lang: str,
+        target_lang: str,
+        report: Callable[[int], None],
+    ) -> Tuple[List[Optional[str]], List[List[int]]]:
+        """Resolve cache hits and group identical misses.
+
+        Returns:
+            The ordered result buffer with hits filled in, and for each
+            distinct miss the indexes of the units waiting on it
+        """
+        results: List[Optional[str]] = [None] * len(units)
+
+        # Cache misses keyed by request, with the indexes waiting on each
+        requests: Dict[Tuple, List[int]] = {}
+        for index, unit in enumerate(units):
+            masked, cached = self._lookup(unit.content, source_lang, target_lang, unit.context)
+            if cached is not None:
+                results[index] = cached
+                report(1)
+            else:
+                key = (masked.text, tuple(masked.spans), unit.context)
+                requests.setdefault(key, []).append(index)
+
+        return results, list(requests.values())
+
+    def _batch_misses(
+        self, units: List[TranslationUnit], misses: List[List[int]]
+    ) -> List[List[Tuple[Segment, List[int]]]]:
+        """Group distinct misses into requests that fit the model's token budget.
+
+        Returns:
+            Batches of (segment, indexes of the units waiting on it)
+        """
+        pending = []
+        for waiting in misses:
+            unit = units[waiting[0]]
+            segment = Segment(self._canonicalize(unit.content), unit.content, unit.context)
+            pending.append((segment, waiting))
+
+        return self.packer.pack(pending, tokens=lambda item: estimate_tokens(item[0].masked.text))
+
+    @staticmethod
+    def _progress_reporter(
+        total: int, progress_callback: Optional[Callable[[int, int], None]]
+    ) -> Callable[[int], None]:
+        """Return a function that advances progress by a number of units."""
+        completed = 0
+
+        def report(count: int):
+            nonlocal completed
+            completed += count
+            if progress_callback:
+                progress_callback(completed, total)
+
+        return report
+
     def _reconstruct_block(
         self, block: DocumentBlock, translated_texts: List[str]
     ) -> str:
         """Reconstruct a block with translated content."""
+        translated_texts = self._merge_segments(block.units, translated_texts)
+
         if block.block_type == "heading":
             # Reconstruct heading
             prefix = "#" * block.level
@@ -447,6 +1663,25 @@ class Translator:
             # Default: return original
             return block.raw_content
 
+    def _merge_segments(
+        self, units: List[TranslationUnit], translated_texts: List[str]
+    ) -> List[str]:
+        """Join sentence-level units back into one text per original unit."""
+        merged: List[str] = []
+        previous_group = None
+        separator = ""
+
+        for unit, text in zip(units, translated_texts):
+            group = unit.metadata.get("segment_group")
+            if group is not None and group == previous_group:
+                merged[-1] = SentenceSegmenter.join(merged[-1], separator, text)
+            else:
+                merged.append(text)
+            previous_group = group
+            separator = unit.metadata.get("separator", "")
+
+        return merged
+
     def _reconstruct_table(self, raw_content: str, translated_texts: List[str]) -> str:
         """Reconstruct a table with translated cell content."""
         import re
@@ -490,9 +1725,22 @@ class Translator:
         recursive: bool = True,
         dry_run: bool = False,
         show_progress: bool = True,
+        force: bool = False,
     ) -> List[TranslationResult]:
         """Translate all Markdown files in a directory.
 
+        Files go through a pipeline: parsing, cache lookup and request
+        packing run ahead on their own threads while earlier requests are in
+        flight. Requests from all files share the worker pool, a unit that
+        recurs across files is requested once, and each file is written as
+        soon as its last unit is translated. With ``config.jobs`` > 1,
+        parsing, cache lookups, assembly and dry runs use that many worker
+        processes; requests stay in this process.
+
+        Files whose source and settings are unchanged since the run that
+        wrote their output are skipped without being opened (see
+        ``BuildManifest``).
+
         Args:
             input_dir: Input directory path
             output_dir: Output directory path. If None, files are placed alongside originals.
@@ -501,10 +1749,308 @@ class Translator:
             recursive: Whether to process subdirectories
             dry_run: If True, don't actually translate
             show_progress: Show progress bar
+            force: Translate every file, even those that are up to date
+
+        Returns:
+            List of TranslationResult for each file, in file order. Durations
+            run from the start of the directory to the file being written.
+        """
+        source = source_lang or self.config.default_source_lang
+        target = target_lang or self.config.default_target_lang
+        files = self._find_files(input_dir, output_dir, target_lang, recursive)
+        build = _IncrementalBuild(self, files, source, target, force)
+        files = build.todo
+        if dry_run and self.config.jobs > 1:
+            return build.merge(self._analyze_in_processes(files, source, target, force))
+        if dry_run:
+            return build.merge([
+                self.translate_file(
+                    str(file_path), str(out_file), source, target, dry_run=True, force=force
+                )
+                for file_path, out_file in files
+            ])
+        if not files:
+            return build.merge([])
+
+        progress = tqdm(total=len(files), desc="Translating files", disable=not show_progress)
+        try:
+            run = _DirectoryRun(
+                self,
+                files,
+                source,
+                target,
+                build.reporter(self._file_reporter(progress, show_progress)),
+                jobs=self.config.jobs,
+                force=force,
+            )
+            run.run()
+        finally:
+            progress.close()
+
+        # Save cache and manifest at the end
+        if self.memory:
+            self.memory.evict_if_grown()
+        build.save()
+
+        return build.merge(run.results)
+
+    async def atranslate_directory(
+        self,
+        input_dir: str,
+        output_dir: Optional[str] = None,
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+        recursive: bool = True,
+        dry_run: bool = False,
+        show_progress: bool = True,
+        force: bool = False,
+    ) -> List[TranslationResult]:
+        """Translate all Markdown files in a directory without blocking the event loop.
+
+        Same arguments, scheduling and result as ``translate_directory``;
+        requests go through the provider's async client.
+        """
+        source = source_lang or self.config.default_source_lang
+        target = target_lang or self.config.default_target_lang
+        files = self._find_files(input_dir, output_dir, target_lang, recursive)
+        build = _IncrementalBuild(self, files, source, target, force)
+        files = build.todo
+        if dry_run and self.config.jobs > 1:
+            return build.merge(
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._analyze_in_processes, files, source, target, force
+                )
+            )
+        if dry_run:
+            return build.merge([
+                await self.atranslate_file(
+                    str(file_path), str(out_file), source, target, dry_run=True, force=force
+                )
+                for file_path, out_file in files
+            ])
+        if not files:
+            return build.merge([])
+
+        progress = tqdm(total=len(files), desc="Translating files", disable=not show_progress)
+        try:
+            run = _DirectoryRun(
+                self,
+                files,
+                source,
+                target,
+                build.reporter(self._file_reporter(progress, show_progress)),
+                jobs=self.config.jobs,
+                force=force,
+            )
+            await run.arun()
+        finally:
+            progress.close()
+
+        if self.memory:
+            self.memory.evict_if_grown()
+        build.save()
+
+        return build.merge(run.results)
+
+    def _analyze_in_processes(
+        self, files: List[Tuple[Path, Path]], source_lang: str, target_lang: str, force: bool
+    ) -> List[TranslationResult]:
+        """Dry-run files on ``jobs`` worker processes."""
+        with workers.create_pool(self.config, self.memory is not None, self.config.jobs) as pool:
+            return list(
+                pool.map(
+                    workers.analyze_file,
+                    [str(file_path) for file_path, _ in files],
+                    [str(out_file) for _, out_file in files],
+                    [source_lang] * len(files),
+                    [target_lang] * len(files),
+                    [force] * len(files),
+                    chunksize=max(1, len(files) // (4 * self.config.jobs)),
+                )
+            )
+
+    @staticmethod
+    def _file_reporter(progress: tqdm, show_progress: bool) -> Callable[[TranslationResult], None]:
+        """Return a function that advances the progress bar by a finished file."""
+
+        def report(result: TranslationResult):
+            progress.update(1)
+            if show_progress:
+                status = "OK" if result.success else "FAIL"
+                progress.set_postfix({"file": Path(result.source_path).name, "status": status})
+
+        return report
+
+    def submit_batch_job(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None,
+        recursive: bool = True,
+    ) -> List[BatchJob]:
+        """Submit the cache misses of a file or directory as provider batch jobs.
+
+        Nothing is written yet: ``collect_batch_jobs`` caches the results
+        and renders the output files once the jobs have finished.
+
+        Args:
+            input_path: Markdown file or directory
+            output_path: Output file or directory. If None, auto-generated.
+            source_lang: Source language code
+            target_lang: Target language code
+            recursive: Whether to process subdirectories
+
+        Returns:
+            The submitted jobs, empty if every unit is already cached
+        """
+        if not self.memory:
+            raise ValueError("Batch jobs need the translation cache")
+        source = source_lang or self.config.default_source_lang
+        target = target_lang or self.config.default_target_lang
+
+        if Path(input_path).is_dir():
+            files = self._find_files(input_path, output_path, target, recursive)
+        else:
+            _, _, result = self._start_file(input_path, output_path, source, target)
+            files = [(Path(input_path), Path(result.output_path))]
+
+        # Distinct misses across all files, split as for live translation
+        requests: Dict[Tuple[str, str], BatchRequest] = {}
+        for file_path, _ in files:
+            doc = self.parser.parse_file(str(file_path))
+            pieces, _ = self._split_oversized(doc.get_translatable_units())
+            for unit in pieces:
+                masked, cached = self._lookup(unit.content, source, target, unit.context)
+                key = (masked.text, unit.context)
+                if cached is None and key not in requests:
+                    requests[key] = BatchRequest(
+                        custom_id=f"u{len(requests)}",
+                        text=masked.text,
+                        context=unit.context,
+                        prompt=self._build_user_prompt(masked, unit.context, None),
+                    )
+
+        if not requests:
+            info("Every unit is cached; no batch job submitted")
+            return []
+
+        # A batch job runs on one model: the active provider's, even with a pool
+        provider = self._create_provider(self.config.active_provider, self.config.get_model())
+        backend = create_batch_backend(provider)
+        store = BatchJobStore(self.config.cache_dir)
+        system_prompt = self._system_prompt(source, target)
+        pending = list(requests.values())
+        paths = [(str(file_path), str(out_file)) for file_path, out_file in files]
+        jobs: List[BatchJob] = []
+        for start in range(0, len(pending), backend.MAX_REQUESTS):
+            chunk = pending[start : start + backend.MAX_REQUESTS]
+            job_id = backend.submit(chunk, system_prompt)
+            job = BatchJob(
+                job_id=job_id,
+                provider=self.config.active_provider,
+                model=self.config.get_model(),
+                source_lang=source,
+                target_lang=target,
+                requests=chunk,
+                files=paths,
+                group=jobs[0].job_id if jobs else job_id,
+            )
+            store.add(job)
+            jobs.append(job)
+            info(f"Submitted batch job {job_id} with {len(chunk)} requests")
+        return jobs
+
+    def collect_batch_jobs(
+        self, wait: bool = False, poll_interval: float = 60.0
+    ) -> List[TranslationResult]:
+        """Collect finished batch jobs, cache their results and render the files.
+
+        Jobs still running are left for a later call. Files are rendered
+        with the regular file translation, so units whose batch request
+        failed are translated live.
+
+        Args:
+            wait: Keep polling until every job has finished
+            poll_interval: Seconds between polls when waiting
 
         Returns:
-            List of TranslationResult for each file
+            TranslationResult for each rendered file
         """
+        if not self.memory:
+            raise ValueError("Batch jobs need the translation cache")
+        store = BatchJobStore(self.config.cache_dir)
+        backends: Dict[Tuple[str, str], BatchBackend] = {}
+        results: List[TranslationResult] = []
+
+        while True:
+            for job in store.load():
+                key = (job.provider, job.model)
+                if key not in backends:
+                    provider = self._create_provider(job.provider, job.model)
+                    backends[key] = create_batch_backend(provider)
+                backend = backends[key]
+
+                state = backend.status(job.job_id)
+                if state == PENDING:
+                    debug(f"Batch job {job.job_id} is still running")
+                    continue
+                if state == COMPLETED:
+                    self._store_batch_results(job, backend.results(job.job_id))
+                else:
+                    warning(
+                        f"Batch job {job.job_id} failed; its units will be translated live"
+                    )
+                store.remove(job.job_id)
+
+                if not any(other.group == job.group for other in store.load()):
+                    for input_path, output_path in job.files:
+                        results.append(
+                            self.translate_file(
+                                input_path, output_path, job.source_lang, job.target_lang
+                            )
+                        )
+
+            remaining = store.load()
+            if not wait or not remaining:
+                break
+            info(f"Waiting for {len(remaining)} batch job(s)")
+            time.sleep(poll_interval)
+
+        if self.memory:
+            self.memory.evict_if_grown()
+        return results
+
+    def _store_batch_results(self, job: BatchJob, translations: Dict[str, str]):
+        """Cache the translations of a batch job that kept their placeholders."""
+        stored = 0
+        for request in job.requests:
+            translated = translations.get(request.custom_id)
+            if not translated:
+                continue
+            if MaskedText(translated).placeholders != MaskedText(request.text).placeholders:
+                debug(f"Batch result {request.custom_id} lost placeholders; skipping")
+                continue
+            self.memory.set(
+                text=request.text,
+                translation=translated,
+                source_lang=job.source_lang,
+                target_lang=job.target_lang,
+                context=request.context,
+                model=job.model,
+            )
+            stored += 1
+        self.memory.save()
+        info(f"Batch job {job.job_id}: cached {stored} of {len(job.requests)} translations")
+
+    def _find_files(
+        self,
+        input_dir: str,
+        output_dir: Optional[str],
+        target_lang: Optional[str],
+        recursive: bool,
+    ) -> List[Tuple[Path, Path]]:
+        """Find Markdown files and compute their output paths."""
         input_path = Path(input_dir)
         target = target_lang or self.config.default_target_lang
 
@@ -515,34 +2061,600 @@ class Translator:
 
         # Find all Markdown files
         pattern = "**/*.md" if recursive else "*.md"
-        files = list(input_path.glob(pattern))
 
-        results = []
-
-        iterator = tqdm(files, desc="Translating files", disable=not show_progress)
-        for file_path in iterator:
+        files = []
+        for file_path in input_path.glob(pattern):
             # Compute output path
+            out_name = f"{file_path.stem}_{target}{file_path.suffix}"
             if output_path:
                 relative = file_path.relative_to(input_path)
-                out_file = output_path / relative.parent / f"{file_path.stem}_{target}{file_path.suffix}"
+                out_file = output_path / relative.parent / out_name
             else:
-                out_file = file_path.parent / f"{file_path.stem}_{target}{file_path.suffix}"
+                out_file = file_path.parent / out_name
+            files.append((file_path, out_file))
+        return files
 
-            result = self.translate_file(
-                input_path=str(file_path),
-                output_path=str(out_file),
-                source_lang=source_lang,
-                target_lang=target_lang,
-                dry_run=dry_run,
+
+@dataclass
+class _PendingFile:
+    """A file of a directory run, waiting for its units to be translated."""
+
+    index: int  # Position in the run's file list
+    doc: ParsedDocument
+    units: List[TranslationUnit]
+    pieces: List[TranslationUnit]
+    splits: List[List[Tuple[str, str]]]
+    result: TranslationResult
+    translations: List[Optional[str]] = field(default_factory=list)
+    remaining: int = 1  # Pieces not translated yet, plus one until the file is planned
+
+
+# Ends a stage's input queue
+_END = None
+
+
+class _DirectoryRun:
+    """The files of a directory, translated by a pipeline of stages.
+
+    Parse: worker threads parse files and look their units up in the cache,
+    so parsing file N+1 overlaps the requests of file N. A file the cache
+    covers is written there and then. With ``jobs`` > 1 this stage, and
+    assembling files in the write stage, run in worker processes. Plan:
+    the misses of each parsed file are packed into requests as soon as
+    enough are pending. A miss already requested for an earlier file joins
+    that request instead, so a unit that recurs across files is requested
+    once. Translate: the dispatcher runs requests as they are planned.
+    Write: each file is assembled and written as soon as its last piece
+    lands, without waiting for the rest of the directory.
+
+    A request the provider rejects fails only the files waiting on its
+    units; the other requests keep running, as they did when each file was
+    translated on its own. Likewise a file that cannot be parsed, planned
+    or written fails on its own while the other files flow through.
+
+    Queues between stages are bounded, so a slow stage holds back the ones
+    feeding it rather than piling up parsed documents. Throughput and queue
+    depth of each stage are logged at verbose level.
+    """
+
+    PARSE_WORKERS = 4
+    QUEUE_SIZE = 8  # Items per queue between stages
+    POLL_INTERVAL = 0.1  # Seconds between checks for a stopped run when blocked on a queue
+
+    def __init__(
+        self,
+        translator: Translator,
+        files: List[Tuple[Path, Path]],
+        source: str,
+        target: str,
+        on_file: Callable[[TranslationResult], None],
+        jobs: int = 1,
+        force: bool = False,
+    ):
+        """Initialize the run.
+
+        Args:
+            translator: Translator doing the work
+            files: (input, output) paths
+            source: Source language code
+            target: Target language code
+            on_file: Called with each file's result when it is finished
+            jobs: Worker processes for parsing, lookups and assembly (1 = threads only)
+            force: Translate every block, reusing nothing from existing outputs
+        """
+        self.translator = translator
+        self.files = files
+        self.jobs = jobs
+        self.force = force
+        self.processes: Optional[ProcessPoolExecutor] = None
+        self.source = source
+        self.target = target
+        self.on_file = on_file
+        self.started = time.time()
+        self.results = [
+            translator._start_file(str(file_path), str(out_file), source, target)[2]
+            for file_path, out_file in files
+        ]
+        self.batches: List[List[Tuple[Segment, Tuple]]] = []  # (segment, request key) per request
+        # (file, piece) pairs waiting on each request key
+        self._waiting: Dict[Tuple, List[Tuple[_PendingFile, int]]] = {}
+        self._landed: Dict[Tuple, str] = {}  # Translations of finished request keys
+        self._failed: Dict[Tuple, Exception] = {}  # Errors of request keys that failed for good
+        self._backlog: List[Tuple[Segment, Tuple]] = []  # Misses not packed into a request yet
+        self._finished = set()  # Indexes of files done
+        self._error: Optional[Exception] = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._parse_stage = Stage("parse", "files")
+        self._plan_stage = Stage("plan", "files")
+        self._translate_stage = Stage("translate", "requests")
+        self._write_stage = Stage("write", "files")
+
+    def run(self):
+        """Run the pipeline on worker threads."""
+        translator = self.translator
+        parsed: "queue.Queue" = queue.Queue(self.QUEUE_SIZE)
+        requests: "queue.Queue" = queue.Queue(self.QUEUE_SIZE)
+        written: "queue.Queue" = queue.Queue(self.QUEUE_SIZE)
+        monitor = self._monitor(parsed, requests, written)
+
+        def make_task(segments: List[Segment]) -> Callable[[], List[Union[str, Exception]]]:
+            return partial(self._request, segments)
+
+        def plan():
+            try:
+                for _ in self.files:
+                    pending = self._get(parsed)
+                    if self._stopped.is_set():
+                        return
+                    for segments in self._plan_file(pending, more=not parsed.empty()):
+                        self._put(requests, make_task(segments))
+                    self._release(pending, lambda done: self._put(written, done))
+            except Exception as e:
+                self._error = e
+            self._put(requests, _END)
+
+        def write():
+            while True:
+                pending = written.get()
+                if pending is _END:
+                    return
+                self._complete(pending, self._render(pending))
+
+        def on_done(task_index: int, outcomes: List[Union[str, Exception]]):
+            for pending in self._land(task_index, outcomes):
+                self._put(written, pending)
+
+        def on_error(task_index: int, error: Exception):
+            on_done(task_index, [error] * len(self.batches[task_index]))
+
+        self._start_processes()
+        parse_pool = ThreadPoolExecutor(max_workers=self._parsers, thread_name_prefix="parse")
+        planner = threading.Thread(target=plan, name="plan", daemon=True)
+        writers = [
+            threading.Thread(target=write, name=f"write-{number}", daemon=True)
+            for number in range(self.jobs)
+        ]
+        monitor.start()
+        for index in range(len(self.files)):
+            parse_pool.submit(lambda index=index: self._put(parsed, self._parse(index)))
+        planner.start()
+        for writer in writers:
+            writer.start()
+        try:
+            translator.dispatcher.run_queue(requests, on_done, on_error)
+            if self._error:
+                raise self._error
+        except Exception as e:
+            self._stopped.set()
+            self._error = self._error or e
+        finally:
+            planner.join()
+            parse_pool.shutdown(wait=True, cancel_futures=True)
+            for writer in writers:
+                written.put(_END)
+            for writer in writers:
+                writer.join()
+            self._stop_processes()
+            monitor.stop()
+        if self._error:
+            self._fail(self._error)
+
+    async def arun(self):
+        """Run the pipeline on the event loop; parsing runs on worker threads."""
+        translator = self.translator
+        loop = asyncio.get_running_loop()
+        parsed: asyncio.Queue = asyncio.Queue(self.QUEUE_SIZE)
+        requests: asyncio.Queue = asyncio.Queue(self.QUEUE_SIZE)
+        written: asyncio.Queue = asyncio.Queue(self.QUEUE_SIZE)
+        monitor = self._monitor(parsed, requests, written)
+        indexes = iter(range(len(self.files)))
+
+        async def parse(pool: ThreadPoolExecutor):
+            for index in indexes:
+                await parsed.put(await loop.run_in_executor(pool, self._parse, index))
+
+        async def plan():
+            try:
+                for _ in self.files:
+                    pending = await parsed.get()
+                    for segments in self._plan_file(pending, more=not parsed.empty()):
+                        await requests.put(partial(self._arequest, segments))
+                    completed = []
+                    self._release(pending, completed.append)
+                    for done in completed:
+                        await written.put(done)
+            except Exception as e:
+                self._error = e
+            await requests.put(_END)
+
+        async def write():
+            while True:
+                pending = await written.get()
+                if pending is _END:
+                    return
+                if pending.result.error:
+                    result = pending.result
+                elif self.processes:
+                    try:
+                        result = await loop.run_in_executor(
+                            self.processes, workers.render_file, pending
+                        )
+                    except Exception as e:  # E.g. a worker process died
+                        pending.result.error = str(e)
+                        result = pending.result
+                else:
+                    result = translator._render_file(pending)
+                self._complete(pending, result)
+
+        async def on_done(task_index: int, outcomes: List[Union[str, Exception]]):
+            for pending in self._land(task_index, outcomes):
+                await written.put(pending)
+
+        async def on_error(task_index: int, error: Exception):
+            await on_done(task_index, [error] * len(self.batches[task_index]))
+
+        self._start_processes()
+        monitor.start()
+        with ThreadPoolExecutor(max_workers=self._parsers, thread_name_prefix="parse") as pool:
+            stages = [asyncio.ensure_future(parse(pool)) for _ in range(self._parsers)]
+            stages.append(asyncio.ensure_future(plan()))
+            writers = [asyncio.ensure_future(write()) for _ in range(self.jobs)]
+            try:
+                await translator.dispatcher.arun_queue(requests, on_done, on_error)
+                if self._error:
+                    raise self._error
+            except Exception as e:
+                self._error = self._error or e
+            finally:
+                for stage in stages:
+                    stage.cancel()
+                await asyncio.gather(*stages, return_exceptions=True)
+                for _ in writers:
+                    await written.put(_END)
+                await asyncio.gather(*writers)
+                self._stop_processes()
+                monitor.stop()
+        if self._error:
+            self._fail(self._error)
+
+    def _monitor(self, parsed, requests, written) -> PipelineMonitor:
+        """Report on the stages, each with the queue feeding it."""
+        self._plan_stage.queue = parsed
+        self._translate_stage.queue = requests
+        self._write_stage.queue = written
+        stages = [self._parse_stage, self._plan_stage, self._translate_stage, self._write_stage]
+        return PipelineMonitor("Directory pipeline", stages)
+
+    @property
+    def _parsers(self) -> int:
+        """Parse threads; with worker processes, one per process at least."""
+        return max(self.PARSE_WORKERS, self.jobs)
+
+    def _start_processes(self):
+        if self.jobs > 1:
+            translator = self.translator
+            self.processes = workers.create_pool(
+                translator.config, translator.memory is not None, self.jobs
             )
-            results.append(result)
 
-            if show_progress:
-                status = "OK" if result.success else "FAIL"
-                iterator.set_postfix({"file": file_path.name, "status": status})
+    def _stop_processes(self):
+        if self.processes is not None:
+            self.processes.shutdown(wait=True, cancel_futures=True)
+            self.processes = None
 
-        # Save cache at the end
-        if self.memory:
-            self.memory.save()
+    def _parse(self, index: int) -> Optional[_PendingFile]:
+        """Parse stage: parse one file and look it up in the cache.
 
-        return results
+        Returns:
+            The file, or None if it is already done (fully cached, or
+            failed to parse)
+        """
+        translator = self.translator
+        args = (index, self.results[index], self.source, self.target, self.force)
+        try:
+            if self.processes:
+                outcome, lookups = self.processes.submit(workers.prepare_file, *args).result()
+                if translator.memory:
+                    translator.memory.add_hits(*lookups)
+            else:
+                outcome = translator._prepare_file(*args)
+        except Exception as e:  # E.g. a worker process died
+            outcome = self.results[index]
+            outcome.error = str(e)
+        self._parse_stage.add()
+        if isinstance(outcome, _PendingFile):
+            self.results[index] = outcome.result
+            return outcome
+        self.results[index] = outcome
+        if outcome.success:
+            translator._record_stats(outcome)
+            self._write_stage.add()
+        self._done(index)
+        return None
+
+    def _plan_file(self, pending: Optional[_PendingFile], more: bool) -> List[List[Segment]]:
+        """Plan stage: resolve a file's cache hits and queue its misses.
+
+        Args:
+            pending: The parsed file, or None if it failed to parse
+            more: Whether another parsed file is waiting. If so, a partly
+                filled request is held back for its misses to top up.
+
+        Returns:
+            The segments of each request ready to be sent
+        """
+        if pending is not None:
+            try:
+                self._queue_misses(pending)
+            except Exception as e:  # Fail this file; keep planning the others
+                pending.result.error = str(e)
+            self._plan_stage.add()
+
+        batches = self.translator.packer.pack(
+            self._backlog, tokens=lambda item: estimate_tokens(item[0].masked.text)
+        )
+        self._backlog = batches.pop() if more and batches else []
+        if batches and not self.batches:
+            self.translator._ensure_provider()
+        # Index of a request in self.batches is its position in the dispatcher's queue
+        self.batches.extend(batches)
+        return [[segment for segment, _ in batch] for batch in batches]
+
+    def _queue_misses(self, pending: _PendingFile):
+        """Register a file's misses, joining requests already planned for the same key."""
+        translator = self.translator
+        for index, piece in enumerate(pending.pieces):
+            if pending.translations[index] is not None:
+                continue  # Cached, found by the parse stage
+            if self.processes:
+                # Workers read the memory as last saved; check unsaved entries too
+                masked, cached = translator._lookup(
+                    piece.content, self.source, self.target, piece.context
+                )
+                if cached is not None:
+                    pending.translations[index] = cached
+                    continue
+            else:
+                masked = translator._canonicalize(piece.content)
+            key = (masked.text, tuple(masked.spans), piece.context)
+            with self._lock:
+                if key in self._landed:
+                    pending.translations[index] = self._landed[key]
+                    continue
+                if key in self._failed:
+                    pending.result.error = pending.result.error or str(self._failed[key])
+                    continue
+                pending.remaining += 1
+                if key not in self._waiting:
+                    self._waiting[key] = []
+                    self._backlog.append((Segment(masked, piece.content, piece.context), key))
+                self._waiting[key].append((pending, index))
+
+    def _release(self, pending: Optional[_PendingFile], send: Callable[[_PendingFile], None]):
+        """Mark a file as planned; send it on to be written if nothing is missing."""
+        if pending is None:
+            return
+        with self._lock:
+            pending.remaining -= 1
+            complete = not pending.remaining
+        if complete:
+            send(pending)
+
+    def _request(self, segments: List[Segment]) -> List[Union[str, Exception]]:
+        """Translate stage: send one request, isolating the units the provider rejects.
+
+        If a request of several units fails with a non-transient error, each
+        unit is sent on its own, so only the units that fail again fail
+        their files. Transient errors are left to the dispatcher to retry.
+
+        Returns:
+            The translation of each segment, or the error it failed with
+        """
+        translator = self.translator
+        try:
+            return translator._translate_batch(segments, self.source, self.target)
+        except TransientError:
+            raise
+        except Exception as e:
+            if len(segments) == 1:
+                return [e]
+            debug(f"Request of {len(segments)} units failed ({e}); sending them one by one")
+        outcomes: List[Union[str, Exception]] = []
+        for segment in segments:
+            try:
+                outcomes.extend(translator._translate_batch([segment], self.source, self.target))
+            except TransientError:
+                raise
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    async def _arequest(self, segments: List[Segment]) -> List[Union[str, Exception]]:
+        """Async variant of ``_request``."""
+        translator = self.translator
+        try:
+            return await translator._atranslate_batch(segments, self.source, self.target)
+        except TransientError:
+            raise
+        except Exception as e:
+            if len(segments) == 1:
+                return [e]
+            debug(f"Request of {len(segments)} units failed ({e}); sending them one by one")
+        outcomes: List[Union[str, Exception]] = []
+        for segment in segments:
+            try:
+                outcomes.extend(
+                    await translator._atranslate_batch([segment], self.source, self.target)
+                )
+            except TransientError:
+                raise
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def _land(
+        self, task_index: int, outcomes: List[Union[str, Exception]]
+    ) -> List[_PendingFile]:
+        """Translate stage: fill in a finished request.
+
+        A unit that failed fails every file waiting on it; the file is
+        still sent on once nothing else is in flight for it, and the write
+        stage records it as failed.
+
+        Returns:
+            The files it completed
+        """
+        self._translate_stage.add()
+        completed = []
+        with self._lock:
+            for (_, key), outcome in zip(self.batches[task_index], outcomes):
+                if isinstance(outcome, Exception):
+                    self._failed[key] = outcome
+                else:
+                    self._landed[key] = outcome
+                for pending, index in self._waiting.pop(key):
+                    if isinstance(outcome, Exception):
+                        pending.result.error = pending.result.error or str(outcome)
+                    else:
+                        pending.translations[index] = outcome
+                    pending.remaining -= 1
+                    if not pending.remaining:
+                        completed.append(pending)
+        return completed
+
+    def _render(self, pending: _PendingFile) -> TranslationResult:
+        """Write stage: assemble and write a finished file, in a worker process if any."""
+        if pending.result.error:
+            return pending.result  # A unit it needed failed
+        if not self.processes:
+            return self.translator._render_file(pending)
+        try:
+            return self.processes.submit(workers.render_file, pending).result()
+        except Exception as e:  # E.g. a worker process died
+            pending.result.error = str(e)
+            return pending.result
+
+    def _complete(self, pending: _PendingFile, result: TranslationResult):
+        """Record a file written by the write stage."""
+        translator = self.translator
+        if result.success:
+            try:
+                # Persist the new translations the file was waiting on
+                if translator.memory:
+                    translator.memory.save()
+                translator._record_stats(result)
+            except Exception as e:  # Fail this file; keep writing the others
+                result.success = False
+                result.error = str(e)
+        self.results[pending.index] = result
+        self._write_stage.add()
+        self._done(pending.index)
+
+    def _put(self, target: "queue.Queue", item):
+        """Put onto a bounded queue, giving up if the run has stopped."""
+        while not self._stopped.is_set():
+            try:
+                target.put(item, timeout=self.POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, source: "queue.Queue"):
+        """Take from a queue, giving up (None) if the run has stopped."""
+        while not self._stopped.is_set():
+            try:
+                return source.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return None
+
+    def _fail(self, error: Exception):
+        """Mark the files not written yet as failed."""
+        for index, result in enumerate(self.results):
+            if index not in self._finished:
+                result.error = str(error)
+                self._done(index)
+
+    def _done(self, index: int):
+        with self._lock:
+            if index in self._finished:
+                return
+            self._finished.add(index)
+        result = self.results[index]
+        result.duration_seconds = time.time() - self.started
+        self.on_file(result)
+
+
+class _IncrementalBuild:
+    """The files of a directory run, less those whose output is up to date.
+
+    A file is up to date if the build manifest says its output was written
+    from the same source content with the same settings. Files written by
+    this run are recorded once they succeed.
+    """
+
+    def __init__(
+        self,
+        translator: Translator,
+        files: List[Tuple[Path, Path]],
+        source: str,
+        target: str,
+        force: bool,
+    ):
+        """Check every file against the manifest.
+
+        Args:
+            translator: Translator doing the work
+            files: (input, output) paths
+            source: Source language code
+            target: Target language code
+            force: Treat every file as out of date
+        """
+        self.manifest = translator.manifest
+        self.fingerprint = translator._fingerprint(source, target)
+        self.stats = {file_path: file_path.stat() for file_path, _ in files}
+        # Result of each file, filled in for the up-to-date ones
+        self.results: List[Optional[TranslationResult]] = []
+        self.todo: List[Tuple[Path, Path]] = []
+        for file_path, out_file in files:
+            if not force and self.manifest.is_current(
+                file_path, out_file, self.fingerprint, self.stats[file_path]
+            ):
+                self.results.append(
+                    TranslationResult(str(file_path), str(out_file), success=True, up_to_date=True)
+                )
+            else:
+                self.results.append(None)
+                self.todo.append((file_path, out_file))
+        skipped = len(files) - len(self.todo)
+        if skipped:
+            info(f"{skipped} of {len(files)} files up to date; skipping them")
+
+    def reporter(
+        self, on_file: Callable[[TranslationResult], None]
+    ) -> Callable[[TranslationResult], None]:
+        """Wrap a per-file callback so written files are recorded in the manifest."""
+
+        def report(result: TranslationResult):
+            if result.success:
+                source = Path(result.source_path)
+                self.manifest.record(
+                    source,
+                    Path(result.output_path),
+                    self.fingerprint,
+                    self.stats[source],
+                    result.block_hashes,
+                )
+            on_file(result)
+
+        return report
+
+    def merge(self, results: List[TranslationResult]) -> List[TranslationResult]:
+        """Results of every file in order, given those of ``todo``."""
+        done = iter(results)
+        return [result or next(done) for result in self.results]
+
+    def save(self):
+        """Write the manifest."""
+        self.manifest.save()
@@ -0,0 +1,312 @@
+"""Concurrent dispatch of translation requests."""
+
+import asyncio
+import heapq
+import inspect
+import queue
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from docs_translator.logging import debug, warning
+from docs_translator.translator.concurrency import AIMDController
+from docs_translator.translator.providers import TransientError
+
+T = TypeVar("T")
+
+
+class Dispatcher:
+    """Run translation requests on a bounded worker pool.
+
+    Results are written into an ordered buffer, so callers get them back in
+    submission order no matter which request finishes first. The pool is
+    sized for the largest window; ``controller`` decides how many requests
+    are actually in flight.
+
+    A task that fails with a ``TransientError`` (rate limit, timeout, 5xx)
+    goes onto a delay queue and is resubmitted after a jittered backoff, or
+    after the server's ``Retry-After``. Other tasks keep running meanwhile.
+    """
+
+    MAX_ATTEMPTS = 4  # Per task, including the first
+    BACKOFF_BASE = 2.0  # Seconds before the first retry (doubles per attempt)
+    BACKOFF_MAX = 60.0
+    POLL_INTERVAL = 0.05  # Seconds between checks for new tasks in run_queue
+
+    def __init__(self, concurrency: int = 4, max_concurrency: int = 16, adaptive: bool = True):
+        self.controller = AIMDController(
+            initial=concurrency,
+            maximum=max_concurrency if adaptive else concurrency,
+            adaptive=adaptive,
+        )
+        self.concurrency = self.controller.maximum
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Lazy-create the worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="translate"
+            )
+            debug(f"Dispatcher started with {self.concurrency} workers")
+        return self._executor
+
+    def run(
+        self,
+        tasks: List[Callable[[], T]],
+        on_done: Optional[Callable[[int, T], None]] = None,
+    ) -> List[T]:
+        """Run tasks concurrently.
+
+        Args:
+            tasks: Zero-argument callables, one per request
+            on_done: Called in the calling thread as (index, result) when each
+                task completes, in completion order
+
+        Returns:
+            Results in the same order as ``tasks``
+
+        Raises:
+            Exception: The first non-transient exception raised by a task, or
+                a transient one once its retries are used up. Tasks that have
+                not started yet are cancelled.
+        """
+        results: List[Optional[T]] = [None] * len(tasks)
+        if not tasks:
+            return results
+
+        futures = {self.executor.submit(task): (index, 1) for index, task in enumerate(tasks)}
+        delayed: List = []  # Heap of (ready_at, index, attempt)
+        while futures or delayed:
+            # Resubmit retries that are due
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                _, index, attempt = heapq.heappop(delayed)
+                futures[self.executor.submit(tasks[index])] = (index, attempt)
+
+            timeout = max(0.0, delayed[0][0] - now) if delayed else None
+            done, _ = wait(list(futures), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, attempt = futures.pop(future)
+                try:
+                    settled = self._settle(future, index, attempt, delayed)
+                except Exception:
+                    for other in futures:
+                        other.cancel()
+                    raise
+                if settled:
+                    results[index] = future.result()
+                    if on_done:
+                        on_done(index, results[index])
+        return results
+
+    def run_queue(
+        self,
+        tasks: "queue.Queue[Optional[Callable[[], T]]]",
+        on_done: Callable[[int, T], None],
+        on_error: Optional[Callable[[int, Exception], None]] = None,
+    ) -> int:
+        """Run tasks as they arrive on a queue, until a None marks the end.
+
+        Lets a producer stage feed requests while earlier ones are in
+        flight. A task is only taken off the queue while fewer than
+        ``controller.window`` tasks are running or waiting to be retried,
+        so a bounded queue holds back its producer. Retries are handled as
+        in ``run``.
+
+        Args:
+            tasks: Queue of zero-argument callables, closed with None
+            on_done: Called in the calling thread as (index, result), where
+                index is the task's position in the queue
+            on_error: Called in the calling thread as (index, error) for a
+                task that failed for good; the other tasks keep running. If
+                None, the first such failure is raised as in ``run``.
+
+        Returns:
+            The number of tasks run
+        """
+        submitted: List[Callable[[], T]] = []
+        futures: Dict[Future, Tuple[int, int]] = {}
+        delayed: List = []  # Heap of (ready_at, index, attempt)
+        closed = False
+        while not closed or futures or delayed:
+            # Take new tasks while the window has room; wait for one only when
+            # nothing else is pending
+            while not closed and len(futures) + len(delayed) < self.controller.window:
+                try:
+                    idle = not futures and not delayed
+                    task = tasks.get(timeout=self.POLL_INTERVAL) if idle else tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if task is None:
+                    closed = True
+                else:
+                    futures[self.executor.submit(task)] = (len(submitted), 1)
+                    submitted.append(task)
+
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                _, index, attempt = heapq.heappop(delayed)
+                futures[self.executor.submit(submitted[index])] = (index, attempt)
+
+            timeout = max(0.0, delayed[0][0] - now) if delayed else None
+            if not closed and len(futures) + len(delayed) < self.controller.window:
+                timeout = min(timeout or self.POLL_INTERVAL, self.POLL_INTERVAL)
+            if not futures:
+                if delayed:
+                    time.sleep(timeout)
+                continue
+            done, _ = wait(list(futures), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, attempt = futures.pop(future)
+                try:
+                    settled = self._settle(future, index, attempt, delayed)
+                except Exception as error:
+                    if on_error is None:
+                        for other in futures:
+                            other.cancel()
+                        raise
+                    on_error(index, error)
+                    continue
+                if settled:
+                    on_done(index, future.result())
+        return len(submitted)
+
+    def _settle(
+        self,
+        future: Future,
+        index: int,
+        attempt: int,
+        delayed: List,
+    ) -> bool:
+        """Handle a finished future: True if it succeeded, False if queued for a retry.
+
+        Raises:
+            Exception: The task's error, once it may not be retried
+        """
+        error = future.exception()
+        if error is None:
+            return True
+        if self._should_retry(error, attempt):
+            delay = self._retry_delay(error, attempt)
+            heapq.heappush(delayed, (time.monotonic() + delay, index, attempt + 1))
+            return False
+        raise error
+
+    async def arun(
+        self,
+        tasks: List[Callable[[], Awaitable[T]]],
+        on_done: Optional[Callable[[int, T], None]] = None,
+    ) -> List[T]:
+        """Async variant of ``run``.
+
+        Tasks are coroutine functions. A task waiting to be retried sleeps on
+        the event loop without holding a request slot.
+        """
+        results: List[Optional[T]] = [None] * len(tasks)
+
+        async def run_task(index: int):
+            results[index] = await self._arun_task(tasks[index])
+            if on_done:
+                on_done(index, results[index])
+
+        running = [asyncio.ensure_future(run_task(index)) for index in range(len(tasks))]
+        try:
+            await asyncio.gather(*running)
+        except BaseException:
+            for task in running:
+                task.cancel()
+            raise
+        return results
+
+    async def arun_queue(
+        self,
+        tasks: "asyncio.Queue[Optional[Callable[[], Awaitable[T]]]]",
+        on_done: Callable[[int, T], Any],
+        on_error: Optional[Callable[[int, Exception], Any]] = None,
+    ) -> int:
+        """Async variant of ``run_queue``.
+
+        ``on_done`` and ``on_error`` may be coroutine functions; a task
+        counts as finished once they have returned, which lets a full
+        downstream queue hold back the producer. As in ``run_queue``, at
+        most ``controller.window`` tasks are taken off the queue at a time.
+        """
+
+        async def run_task(index: int, task: Callable[[], Awaitable[T]]):
+            try:
+                result = await self._arun_task(task)
+            except Exception as error:
+                if on_error is None:
+                    raise
+                outcome = on_error(index, error)
+            else:
+                outcome = on_done(index, result)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+        running = set()
+        count = 0
+        next_task: Optional[asyncio.Future] = None  # Waiting for the next task, if there is room
+        try:
+            while True:
+                if next_task is None and len(running) < self.controller.window:
+                    next_task = asyncio.ensure_future(tasks.get())
+                waiting = running | {next_task} if next_task else running
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done - {next_task}:
+                    running.discard(finished)
+                    finished.result()  # Raise the first failure
+                if next_task is not None and next_task.done():
+                    task = next_task.result()
+                    next_task = None
+                    if task is None:
+                        break
+                    running.add(asyncio.ensure_future(run_task(count, task)))
+                    count += 1
+            await asyncio.gather(*running)
+        except BaseException:
+            if next_task is not None:
+                next_task.cancel()
+            for task in running:
+                task.cancel()
+            raise
+        return count
+
+    async def _arun_task(self, task: Callable[[], Awaitable[T]]) -> T:
+        """Run one task, sleeping on the event loop between retries."""
+        attempt = 1
+        while True:
+            try:
+                return await task()
+            except Exception as error:
+                if not self._should_retry(error, attempt):
+                    raise
+                await asyncio.sleep(self._retry_delay(error, attempt))
+                attempt += 1
+
+    def _should_retry(self, error: BaseException, attempt: int) -> bool:
+        return isinstance(error, TransientError) and attempt < self.MAX_ATTEMPTS
+
+    def _retry_delay(self, error: TransientError, attempt: int) -> float:
+        """Backoff before the next attempt.
+
+        Honours the server's Retry-After if given. Otherwise uses exponential
+        backoff with equal jitter, so that requests throttled together do
+        not retry together.
+        """
+        if error.retry_after is not None:
+            delay = error.retry_after + random.uniform(0, 1)
+        else:
+            backoff = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** (attempt - 1))
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+        warning(f"{error}; retrying in {delay:.1f}s (attempt {attempt + 1}/{self.MAX_ATTEMPTS})")
+        return delay
+
+    def shutdown(self):
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
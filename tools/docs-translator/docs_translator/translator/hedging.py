@@ -0,0 +1,229 @@
+"""Hedged requests: duplicate a slow request and keep the first response."""
+
+import asyncio
+import contextvars
+import math
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from docs_translator.config.manager import HedgeSettings
+from docs_translator.logging import debug
+from docs_translator.translator.concurrency import AIMDController
+from docs_translator.translator.ratelimit import start_timer
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Recent latencies of one model's requests, normalised by request size."""
+
+    WINDOW = 200  # Samples kept
+
+    def __init__(self):
+        self._samples: Deque[float] = deque(maxlen=self.WINDOW)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @staticmethod
+    def _scale(tokens: int) -> float:
+        # Same size model as the concurrency controller uses for latency spikes
+        return 1 + tokens / AIMDController.LATENCY_TOKENS
+
+    def record(self, latency: float, tokens: int):
+        """Add the latency of a request of ``tokens`` tokens."""
+        with self._lock:
+            self._samples.append(latency / self._scale(tokens))
+
+    def quantile(self, q: float, tokens: int) -> float:
+        """Latency quantile ``q``, scaled to a request of ``tokens`` tokens."""
+        with self._lock:
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)
+        return ordered[max(0, index)] * self._scale(tokens)
+
+
+class Hedger:
+    """Send a second copy of a request that takes longer than usual.
+
+    If a request has not returned after the model's ``quantile`` latency
+    (p95 by default, scaled to the request's size), a duplicate is sent and
+    whichever response arrives first is used. The other is cancelled; in
+    the sync path its thread cannot be interrupted, so it runs to the end
+    and its response is dropped. Latencies are those of the provider call
+    alone; time spent waiting for a rate limiter is left out.
+
+    Duplicates are capped at ``max_extra`` of all requests, so hedging
+    spends at most that share on top of the normal cost.
+    """
+
+    def __init__(self, settings: HedgeSettings, max_workers: int = 16):
+        """Initialize hedger.
+
+        Args:
+            settings: Hedging settings
+            max_workers: Threads for the sync path (requests and their duplicates)
+        """
+        self.settings = settings
+        self.max_workers = max_workers
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0  # Duplicates that returned first
+        self._latency: Dict[str, LatencyTracker] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Lazy-create the worker pool for the sync path."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="hedge"
+                )
+            return self._executor
+
+    def _tracker(self, model: str) -> LatencyTracker:
+        with self._lock:
+            return self._latency.setdefault(model, LatencyTracker())
+
+    def _start(self, model: str, tokens: int) -> Optional[float]:
+        """Count a request; return how long to wait before hedging it, or None."""
+        with self._lock:
+            self.requests += 1
+        if not self.settings.enabled:
+            return None
+        tracker = self._tracker(model)
+        if len(tracker) < self.settings.min_samples:
+            return None
+        return tracker.quantile(self.settings.quantile, tokens)
+
+    def _claim_hedge(self) -> bool:
+        """Take one duplicate out of the budget, if any is left."""
+        with self._lock:
+            if self.hedged + 1 > self.settings.max_extra * self.requests:
+                return False
+            self.hedged += 1
+            return True
+
+    def _won(self, is_hedge: bool):
+        if is_hedge:
+            with self._lock:
+                self.hedge_wins += 1
+
+    @staticmethod
+    def _adopt(outcome: Tuple[T, contextvars.Context]) -> T:
+        """Take over the context variables set by the winning attempt (e.g. the served model)."""
+        value, context = outcome
+        for var, var_value in context.items():
+            var.set(var_value)
+        return value
+
+    def call(self, model: str, tokens: int, fn: Callable[[], T]) -> T:
+        """Run a request, hedging it if it is slow.
+
+        Args:
+            model: Model the request goes to; latencies are tracked per model
+            tokens: Estimated request size in tokens
+            fn: The request
+
+        Returns:
+            The first successful response
+
+        Raises:
+            Exception: The error of the original request if every attempt failed
+        """
+        tracker = self._tracker(model)
+        delay = self._start(model, tokens)
+        if delay is None:
+            elapsed = start_timer()
+            value = fn()
+            tracker.record(elapsed(), tokens)
+            return value
+
+        def submit() -> Future:
+            def attempt():
+                elapsed = start_timer()
+                value = fn()
+                tracker.record(elapsed(), tokens)
+                return value, contextvars.copy_context()
+
+            return self.executor.submit(contextvars.copy_context().run, attempt)
+
+        primary = submit()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._claim_hedge():
+            return self._adopt(primary.result())
+
+        debug(f"Request to {model} slower than {delay:.1f}s; sending a duplicate")
+        hedge = submit()
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    self._won(future is hedge)
+                    return self._adopt(future.result())
+        return self._adopt(primary.result())  # Both failed: raise the original error
+
+    async def acall(self, model: str, tokens: int, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of ``call``. The losing attempt is cancelled."""
+        tracker = self._tracker(model)
+        delay = self._start(model, tokens)
+        if delay is None:
+            elapsed = start_timer()
+            value = await fn()
+            tracker.record(elapsed(), tokens)
+            return value
+
+        async def attempt():
+            elapsed = start_timer()
+            try:
+                value = await fn()
+            except asyncio.CancelledError:
+                # Record how long it had taken, so cancelled slow requests still count
+                tracker.record(elapsed(), tokens)
+                raise
+            tracker.record(elapsed(), tokens)
+            return value, contextvars.copy_context()
+
+        primary = asyncio.ensure_future(attempt())
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self._claim_hedge():
+            return self._adopt(await primary)
+
+        debug(f"Request to {model} slower than {delay:.1f}s; sending a duplicate")
+        hedge = asyncio.ensure_future(attempt())
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._won(task is hedge)
+                        return self._adopt(task.result())
+            return self._adopt(primary.result())  # Both failed: raise the original error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        """Request, duplicate and duplicate-won counts."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+            }
+
+    def shutdown(self):
+        """Stop the worker pool without waiting for abandoned requests."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,195 @@
+"""Incremental builds: remember which outputs are up to date.
+
+The manifest records, per output file, the source file it was built from
+(size, modification time and content hash) and a fingerprint of the
+settings that shape a translation. A later run skips a file whose source
+and settings are unchanged and whose output still exists, make-style,
+from a ``stat`` alone. It is kept next to the translation memory.
+
+It also lists the source blocks each output was written from, so a
+source that did change can be diffed block by block against them.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from docs_translator.logging import debug, warning
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def block_hash(raw_content: str) -> str:
+    """Short hash of a source block's Markdown."""
+    return hashlib.sha256(raw_content.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ManifestEntry:
+    """How one output file was built."""
+
+    source_path: str
+    source_hash: str
+    size: int
+    mtime_ns: int
+    fingerprint: str  # Settings the output was translated with
+    # "type:hash" of each source block written to the output, space-separated;
+    # one string rather than a list keeps the manifest quick to load
+    blocks: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "source_path": self.source_path,
+            "source_hash": self.source_hash,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "fingerprint": self.fingerprint,
+            "blocks": self.blocks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ManifestEntry":
+        """Create from dictionary."""
+        return cls(
+            source_path=data["source_path"],
+            source_hash=data["source_hash"],
+            size=data["size"],
+            mtime_ns=data["mtime_ns"],
+            fingerprint=data["fingerprint"],
+            blocks=data.get("blocks", ""),
+        )
+
+
+class BuildManifest:
+    """Up-to-date outputs of earlier directory runs, in a JSON file."""
+
+    FILENAME = "build_manifest.json"
+
+    def __init__(self, cache_dir: str = ".translation_cache"):
+        self.path = Path(cache_dir) / self.FILENAME
+        self.entries: Dict[str, ManifestEntry] = {}  # By absolute output path
+        self._changed = False
+        self._lock = threading.Lock()
+        self._cwd = os.getcwd()  # Keys are absolute paths; resolved once, not per file
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.entries = {
+                output: ManifestEntry.from_dict(entry)
+                for output, entry in data.get("files", {}).items()
+            }
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            warning(f"Ignoring unreadable build manifest {self.path}: {e}")
+            self.entries = {}
+
+    def _key(self, path: Path) -> str:
+        return os.path.normpath(os.path.join(self._cwd, path))
+
+    def is_current(
+        self, source: Path, output: Path, fingerprint: str, stat: os.stat_result
+    ) -> bool:
+        """Whether ``output`` was built from ``source`` as it is now, with the same settings.
+
+        Decided from ``stat`` (the source's) when its size and modification
+        time match. A source that was touched but has the same size is
+        hashed, and its new time recorded if the content is unchanged.
+        """
+        entry = self.entries.get(self._key(output))
+        if (
+            entry is None
+            or entry.fingerprint != fingerprint
+            or entry.source_path != self._key(source)
+            or entry.size != stat.st_size
+            or not output.exists()
+        ):
+            return False
+        if entry.mtime_ns == stat.st_mtime_ns:
+            return True
+        if file_hash(source) != entry.source_hash:
+            return False
+        with self._lock:
+            entry.mtime_ns = stat.st_mtime_ns
+            self._changed = True
+        return True
+
+    def previous_blocks(
+        self, source: Path, output: Path, fingerprint: str
+    ) -> List[Tuple[str, str]]:
+        """Blocks of ``source`` that ``output`` was last written from.
+
+        Empty unless it was written from the same source path with the same
+        settings, so its blocks can be reused.
+        """
+        entry = self.entries.get(self._key(output))
+        if (
+            entry is None
+            or entry.fingerprint != fingerprint
+            or entry.source_path != self._key(source)
+        ):
+            return []
+        return [tuple(block.split(":", 1)) for block in entry.blocks.split()]
+
+    def record(
+        self,
+        source: Path,
+        output: Path,
+        fingerprint: str,
+        stat: os.stat_result,
+        blocks: Optional[List[Tuple[str, str]]] = None,
+    ):
+        """Record that ``output`` was built from ``source``, as it was at ``stat``.
+
+        Nothing is recorded if the source changed while it was being
+        translated, so the next run picks the change up.
+
+        Args:
+            source: Source file
+            output: Output file written from it
+            fingerprint: Settings it was translated with
+            stat: The source's ``stat`` before it was read
+            blocks: (block type, block hash) of each source block written
+        """
+        try:
+            current = source.stat()
+            unchanged = (current.st_size, current.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+            source_hash = file_hash(source) if unchanged else ""
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            debug(f"{source} changed during the run; not marking it up to date")
+            return
+        entry = ManifestEntry(
+            source_path=self._key(source),
+            source_hash=source_hash,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            fingerprint=fingerprint,
+            blocks=" ".join(f"{block_type}:{digest}" for block_type, digest in blocks or []),
+        )
+        with self._lock:
+            self.entries[self._key(output)] = entry
+            self._changed = True
+
+    def save(self):
+        """Write the manifest if anything changed."""
+        with self._lock:
+            if not self._changed:
+                return
+            data = {"files": {output: entry.to_dict() for output, entry in self.entries.items()}}
+            self._changed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,164 @@
+"""Placeholder masking of spans that must reach the output unchanged."""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from docs_translator.parser.markdown_parser import MarkdownParser
+from docs_translator.translator.providers import TranslationError
+
+
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n\s*")
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"(?:`[^`]*`|\S)+")  # Code spans may contain spaces
+
+
+def canonicalize(text: str) -> str:
+    """Normalise whitespace for use as a cache key.
+
+    Trailing spaces and soft line breaks collapse to single spaces, so a
+    paragraph re-wrapped at a different column gives the same key. Blank
+    lines, hard breaks (a backslash, or two or more spaces, at the end of
+    a line; the latter normalised to two) and line breaks between
+    pipe-table rows are kept, since they carry structure.
+    """
+    paragraphs = []
+    for paragraph in _PARAGRAPH_BREAK.split(text.strip()):
+        result = ""
+        hard_break = False  # The previous line ended in two or more spaces
+        for raw_line in paragraph.split("\n"):
+            line = _WHITESPACE.sub(" ", raw_line).strip()
+            if not result:
+                result = line
+            elif hard_break:
+                result += "  \n" + line
+            elif result.endswith(("\\", "|")) or line.startswith("|"):
+                result += "\n" + line
+            else:
+                result += " " + line
+            hard_break = raw_line.endswith("  ")
+        paragraphs.append(result)
+    return "\n\n".join(paragraphs)
+
+
+def _soft_break(line: str, next_line: str) -> bool:
+    """Whether the break between two lines of a paragraph is a soft one."""
+    hard = line.endswith("  ") or line.rstrip().endswith(("\\", "|"))
+    return not hard and not next_line.startswith("|")
+
+
+def _wrap(line: str, width: int) -> List[str]:
+    """Wrap a line at spaces, never inside an inline code span."""
+    lines: List[str] = []
+    current = ""
+    for word in _WORD.findall(line):
+        if current and len(current) + 1 + len(word) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    return lines + [current]
+
+
+def relayout(translation: str, source: str) -> str:
+    """Wrap a translation the way its source was wrapped.
+
+    Undoes the folding of soft line breaks in ``canonicalize`` for output:
+    if the source's paragraphs were wrapped, lines of the translation
+    longer than the longest wrapped source line are wrapped to that width.
+    Hard breaks, table rows and blank lines are kept.
+    """
+    width = 0
+    for paragraph in _PARAGRAPH_BREAK.split(source.strip()):
+        lines = paragraph.split("\n")
+        for line, next_line in zip(lines, lines[1:]):
+            if _soft_break(line, next_line.strip()):
+                width = max(width, len(line.strip()))
+    if not width:
+        return translation
+
+    wrapped = []
+    for line in translation.split("\n"):
+        body = line.rstrip()
+        if len(body) <= width or body.startswith("|"):
+            wrapped.append(line)
+            continue
+        pieces = _wrap(body, width)
+        pieces[-1] += line[len(body) :]  # Trailing spaces of a hard break
+        wrapped.extend(pieces)
+    return "\n".join(wrapped)
+
+
+class MaskingError(TranslationError):
+    """Placeholders were lost, duplicated or invented by the model."""
+
+    pass
+
+
+@dataclass
+class MaskedText:
+    """Text with protected spans replaced by numbered placeholders."""
+
+    text: str
+    spans: List[str] = field(default_factory=list)  # Placeholder N -> spans[N - 1]
+
+    @property
+    def placeholders(self) -> Counter:
+        """Placeholder occurrences in the masked text."""
+        return Counter(PlaceholderMasker.PLACEHOLDER_PATTERN.findall(self.text))
+
+
+class PlaceholderMasker:
+    """Replace inline code, URLs, requirement IDs and preserve terms with placeholders.
+
+    The spans never reach the provider, so they cost no tokens and cannot
+    be mangled. Identical spans share one placeholder.
+    """
+
+    PLACEHOLDER = "⟦{}⟧"
+    PLACEHOLDER_PATTERN = re.compile(r"⟦(\d+)⟧")
+
+    def __init__(self, preserve_terms: Optional[List[str]] = None):
+        patterns = [MarkdownParser.INLINE_CODE_PATTERN, MarkdownParser.URL_PATTERN]
+        # Longest terms first so "API Gateway Service" wins over "API Gateway"
+        for term in sorted(preserve_terms or [], key=len, reverse=True):
+            patterns.append(rf"(?<!\w){re.escape(term)}(?!\w)")
+        patterns.extend(MarkdownParser.REQUIREMENT_PATTERNS)
+        self._pattern = re.compile("|".join(f"(?:{p})" for p in patterns))
+
+    def mask(self, text: str, spans: Optional[List[str]] = None) -> MaskedText:
+        """Mask protected spans.
+
+        Args:
+            text: Text to mask
+            spans: Span table to extend, so several texts can share placeholders
+
+        Returns:
+            MaskedText with the placeholder table
+        """
+        spans = spans if spans is not None else []
+
+        def replace(match: re.Match) -> str:
+            span = match.group(0)
+            if span not in spans:
+                spans.append(span)
+            return self.PLACEHOLDER.format(spans.index(span) + 1)
+
+        return MaskedText(self._pattern.sub(replace, text), spans)
+
+    def unmask(self, translated: str, masked: MaskedText) -> str:
+        """Restore spans in a translation of ``masked.text``.
+
+        Raises:
+            MaskingError: If the translation does not contain exactly the
+                placeholders of the masked source
+        """
+        found = Counter(self.PLACEHOLDER_PATTERN.findall(translated))
+        if found != masked.placeholders:
+            raise MaskingError(
+                f"Placeholder mismatch: expected {dict(masked.placeholders)}, got {dict(found)}"
+            )
+        return self.PLACEHOLDER_PATTERN.sub(
+            lambda m: masked.spans[int(m.group(1)) - 1], translated
+        )
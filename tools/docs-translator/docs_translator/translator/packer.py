@@ -0,0 +1,184 @@
+"""Token-budget packing of translation requests."""
+
+import math
+import re
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from docs_translator.config.models import ModelRegistry
+from docs_translator.logging import debug, warning
+from docs_translator.parser.segmenter import SentenceSegmenter
+
+T = TypeVar("T")
+
+# Scripts where one character is roughly one token
+_WIDE_CHAR = re.compile(
+    r"[\u0e00-\u0e7f\u3000-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without a tokenizer.
+
+    ASCII averages about four characters per token, other Latin-script text
+    (e.g. Vietnamese with diacritics) about two, and CJK, Thai and Hangul
+    about one. The estimate errs on the high side.
+    """
+    wide = len(_WIDE_CHAR.findall(text))
+    non_ascii = sum(1 for char in text if ord(char) > 127) - wide
+    ascii_chars = len(text) - wide - non_ascii
+    return math.ceil(ascii_chars / 4 + non_ascii / 2 + wide)
+
+
+class RequestPacker:
+    """Size requests to the model's context window and output cap.
+
+    A request's input is the prompt plus its segments; its output is
+    estimated from the input at ``OUTPUT_RATIO``. Requests are filled until
+    either would exceed ``SAFETY`` of the model's limits.
+    """
+
+    SAFETY = 0.8  # Fraction of the context window and output cap to fill
+    OUTPUT_RATIO = 1.5  # Output tokens per input token (translations expand)
+    PROMPT_TOKENS = 1000  # System prompt, preserve terms and batch instructions
+    SEGMENT_TOKENS = 15  # JSON wrapper (id, context, quoting) per batched segment
+    DEFAULT_CONTEXT_WINDOW = 32000  # For models missing from the registry
+
+    # Safe boundaries for splitting oversized units, coarsest first
+    SPLIT_PATTERNS = [
+        re.compile(r"\n[ \t]*\n\s*"),  # Paragraphs
+        re.compile(r"\n"),  # Lines, e.g. table rows
+        None,  # Sentences
+        re.compile(r"\s+"),  # Words
+    ]
+
+    def __init__(self, context_window: int, max_output_tokens: int, max_segments: int = 1):
+        """Initialize packer.
+
+        Args:
+            context_window: Model context window in tokens
+            max_output_tokens: Output cap per request (``max_tokens``)
+            max_segments: Maximum segments per request
+        """
+        self.max_segments = max(1, max_segments)
+        self.output_budget = int(max_output_tokens * self.SAFETY)
+        self.total_budget = int(context_window * self.SAFETY) - self.PROMPT_TOKENS
+        self._segmenter = SentenceSegmenter()
+
+    @classmethod
+    def for_model(
+        cls, model_id: str, max_output_tokens: int, max_segments: int = 1
+    ) -> "RequestPacker":
+        """Create a packer from the model's registry entry."""
+        info = ModelRegistry.get_model_info(model_id)
+        context_window = info.context_window if info else cls.DEFAULT_CONTEXT_WINDOW
+        return cls(context_window, max_output_tokens, max_segments)
+
+    def fits(self, input_tokens: int) -> bool:
+        """Check if a request with this many segment tokens stays within budget."""
+        output_tokens = math.ceil(input_tokens * self.OUTPUT_RATIO)
+        return (
+            output_tokens <= self.output_budget
+            and input_tokens + output_tokens <= self.total_budget
+        )
+
+    def pack(self, items: List[T], tokens: Callable[[T], int]) -> List[List[T]]:
+        """Greedily group consecutive items into requests.
+
+        Args:
+            items: Items in document order
+            tokens: Estimated source tokens of an item
+
+        Returns:
+            Requests in document order. An item that does not fit on its own
+            gets a request of its own.
+        """
+        batches: List[List[T]] = []
+        current: List[T] = []
+        used = 0
+        for item in items:
+            size = tokens(item) + (self.SEGMENT_TOKENS if self.max_segments > 1 else 0)
+            if current and (len(current) >= self.max_segments or not self.fits(used + size)):
+                batches.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def split(self, text: str) -> List[Tuple[str, str]]:
+        """Split a text too large for one request at safe boundaries.
+
+        Paragraph breaks are tried first, then line breaks (table rows),
+        sentences and finally whitespace. Adjacent pieces are merged back
+        while they fit.
+
+        Returns:
+            List of (piece, separator) pairs. Concatenating every piece
+            followed by its separator reproduces ``text``.
+        """
+        pieces = self._split(text, 0)
+        if len(pieces) > 1:
+            debug(
+                f"Split oversized unit ({estimate_tokens(text)} tokens) into {len(pieces)} pieces"
+            )
+        return pieces
+
+    def _split(self, text: str, level: int) -> List[Tuple[str, str]]:
+        if self.fits(estimate_tokens(text)):
+            return [(text, "")]
+        if level == len(self.SPLIT_PATTERNS):
+            warning(
+                f"Unit of {estimate_tokens(text)} tokens has no safe split point; sending as is"
+            )
+            return [(text, "")]
+
+        result: List[Tuple[str, str]] = []
+        for piece, separator in self._merge(self._split_at(text, level)):
+            sub_pieces = self._split(piece, level + 1)
+            # The last sub-piece is followed by this piece's separator
+            sub_pieces[-1] = (sub_pieces[-1][0], sub_pieces[-1][1] + separator)
+            result.extend(sub_pieces)
+        return result
+
+    def _split_at(self, text: str, level: int) -> List[Tuple[str, str]]:
+        """Split at one boundary level, keeping the separators."""
+        pattern = self.SPLIT_PATTERNS[level]
+        if pattern is None:
+            return self._segmenter.split(text)
+
+        parts: List[Tuple[str, str]] = []
+        cursor = 0
+        for match in pattern.finditer(text):
+            piece = text[cursor : match.start()]
+            if piece:
+                parts.append((piece, match.group(0)))
+            elif parts:
+                parts[-1] = (parts[-1][0], parts[-1][1] + match.group(0))
+            cursor = match.end()
+        if cursor < len(text) or not parts:
+            parts.append((text[cursor:], ""))
+        return parts
+
+    def _merge(self, parts: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Merge adjacent pieces back together while they fit in one request."""
+        merged: List[Tuple[str, str]] = []
+        for piece, separator in parts:
+            if merged:
+                previous, previous_separator = merged[-1]
+                combined = previous + previous_separator + piece
+                if self.fits(estimate_tokens(combined)):
+                    merged[-1] = (combined, separator)
+                    continue
+            merged.append((piece, separator))
+        return merged
+
+
+def join_pieces(pieces: List[Tuple[str, str]], translations: List[str]) -> str:
+    """Join translated pieces of a split unit, adapting separators to the target script."""
+    text: Optional[str] = None
+    separator = ""
+    for (_, piece_separator), translated in zip(pieces, translations):
+        text = translated if text is None else SentenceSegmenter.join(text, separator, translated)
+        separator = piece_separator
+    return text or ""
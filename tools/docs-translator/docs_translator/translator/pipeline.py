@@ -0,0 +1,93 @@
+"""Throughput and queue depth reporting for staged pipelines."""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from docs_translator.logging import verbose
+
+
+class Stage:
+    """One stage of a pipeline: items done, and the queue feeding it."""
+
+    def __init__(self, name: str, unit: str, queue: Optional[Any] = None):
+        """Initialize stage.
+
+        Args:
+            name: Stage name for the logs
+            unit: What an item is, e.g. "files"
+            queue: Input queue (``queue.Queue`` or ``asyncio.Queue``), if any
+        """
+        self.name = name
+        self.unit = unit
+        self.queue = queue
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self, count: int = 1):
+        """Count finished items."""
+        with self._lock:
+            self.count += count
+
+    def depth(self) -> str:
+        """Queue depth as "size/capacity" (empty if the stage has no queue)."""
+        if self.queue is None:
+            return ""
+        capacity = self.queue.maxsize or "inf"
+        return f"{self.queue.qsize()}/{capacity}"
+
+
+class PipelineMonitor:
+    """Log each stage's throughput and queue depth at a fixed interval.
+
+    Runs on its own thread, so a stalled stage still shows up in the logs.
+    """
+
+    INTERVAL = 2.0  # Seconds between reports
+
+    def __init__(self, name: str, stages: List[Stage]):
+        self.name = name
+        self.stages = stages
+        self._started = time.monotonic()
+        self._last: Dict[str, int] = {}
+        self._last_time = self._started
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start reporting."""
+        self._started = self._last_time = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="pipeline-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop reporting and log the totals."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        totals = ", ".join(
+            f"{stage.name} {stage.count} {stage.unit} ({stage.count / elapsed:.1f}/s)"
+            for stage in self.stages
+        )
+        verbose(f"{self.name} done in {elapsed:.1f}s: {totals}")
+
+    def _run(self):
+        while not self._stop.wait(self.INTERVAL):
+            self.report()
+
+    def report(self):
+        """Log throughput since the last report and current queue depths."""
+        now = time.monotonic()
+        elapsed = max(now - self._last_time, 1e-9)
+        parts = []
+        for stage in self.stages:
+            count = stage.count
+            rate = (count - self._last.get(stage.name, 0)) / elapsed
+            self._last[stage.name] = count
+            depth = stage.depth()
+            queued = f", queue {depth}" if depth else ""
+            parts.append(f"{stage.name} {count} {stage.unit} ({rate:.1f}/s{queued})")
+        self._last_time = now
+        verbose(f"{self.name}: " + "; ".join(parts))
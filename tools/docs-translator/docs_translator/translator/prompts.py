@@ -1,10 +1,19 @@
 """System prompts for translation."""
 
-from typing import List
+import json
+from typing import Dict, List, Optional
 
 
 class PromptBuilder:
-    """Build system prompts for translation."""
+    """Build system prompts for translation.
+
+    The system prompt depends only on the languages, style and preserve
+    terms, so it is identical for every request of a run and can be served
+    from the provider's prompt cache. It therefore carries everything that
+    does not vary: the rules, the full list of preserve terms and the
+    instructions for batch and update requests. Anything that varies per
+    unit, such as its context, goes into the user prompt.
+    """
 
     LANGUAGE_NAMES = {
         "vi": "Vietnamese",
@@ -33,6 +42,7 @@ RULES:
    - URLs and file paths
    - Image paths and links
    - Service names, entity names in tables (Account, User, Farmer, etc.)
+   - Placeholders like ⟦1⟧, ⟦2⟧: copy each one exactly once, unchanged, where it belongs
 5. ALWAYS translate these common words:
    - "Description" -> appropriate translation in target language
    - "Active" -> appropriate translation (e.g., "Hoạt động" in Vietnamese)
@@ -41,7 +51,8 @@ RULES:
 6. Use formal, technical tone
 7. Maintain sentence structure as close to original as possible
 8. Keep all Markdown formatting intact (**, *, #, etc.)
-9. Context: This is a {context} in technical documentation
+9. A "Context:" line or field tells you where the text appears in the technical
+   documentation (heading, table cell, ...). Use it, but never translate or output it
 
 CRITICAL: Only output the translated text. Do not add explanations or notes."""
 
@@ -59,6 +70,7 @@ RULES:
    - URLs and file paths
    - Image paths and links
    - Service names, entity names in tables (Account, User, Farmer, etc.)
+   - Placeholders like ⟦1⟧, ⟦2⟧: copy each one exactly once, unchanged, where it belongs
 5. ALWAYS translate these common words:
    - "Description" -> appropriate translation in target language
    - "Active" -> appropriate translation (e.g., "Hoạt động" in Vietnamese)
@@ -67,10 +79,28 @@ RULES:
 6. Use conversational but professional tone
 7. Prioritize readability and flow over literal accuracy
 8. Keep all Markdown formatting intact (**, *, #, etc.)
-9. Context: This is a {context} in user-facing documentation
+9. A "Context:" line or field tells you where the text appears in the user-facing
+   documentation (heading, table cell, ...). Use it, but never translate or output it
 
 CRITICAL: Only output the translated text. Do not add explanations or notes."""
 
+    # Shared by both styles; the user prompts of batch and update requests
+    # only name their format, so these instructions stay in the cached prefix
+    REQUEST_FORMATS = """
+
+REQUEST FORMATS:
+A. Plain text, optionally after a "Context:" line: output only its translation.
+B. A message starting with "Translate the \"text\" of every segment" holds a JSON array
+   of objects {{"id": ..., "context": ..., "text": ...}}. Translate each "text";
+   "context" tells you where the segment appears in the document, do not translate it.
+   Respond with only a JSON array of objects {{"id": ..., "text": ...}}: one per segment,
+   with the same ids, in the same order. Do not merge, split or skip segments.
+C. A message with PREVIOUS SOURCE, PREVIOUS TRANSLATION and NEW SOURCE sections revises
+   an existing translation: the new source is an edited version of the previous one.
+   Update the previous translation so it matches the new source. Change only what the
+   edits require and keep the rest of the previous translation word for word.
+   Output only the updated translation."""
+
     @classmethod
     def build_system_prompt(
         cls,
@@ -78,7 +108,6 @@ CRITICAL: Only output the translated text. Do not add explanations or notes."""
         target_lang: str,
         preserve_terms: List[str],
         style: str = "literal",
-        context: str = "paragraph",
     ) -> str:
         """Build system prompt for translation.
 
@@ -87,21 +116,19 @@ CRITICAL: Only output the translated text. Do not add explanations or notes."""
             target_lang: Target language code (e.g., 'en')
             preserve_terms: List of terms to never translate
             style: Translation style ('literal' or 'natural')
-            context: Context type ('heading', 'paragraph', 'table_cell', etc.)
 
         Returns:
             Formatted system prompt
         """
         template = cls.LITERAL_TEMPLATE if style == "literal" else cls.NATURAL_TEMPLATE
+        template += cls.REQUEST_FORMATS
 
         source_name = cls.LANGUAGE_NAMES.get(source_lang, source_lang)
         target_name = cls.LANGUAGE_NAMES.get(target_lang, target_lang)
 
-        # Format preserve terms
+        # Format preserve terms; all of them, as they are part of the cached prefix
         if preserve_terms:
-            terms_str = ", ".join(f'"{term}"' for term in preserve_terms[:20])
-            if len(preserve_terms) > 20:
-                terms_str += f", ... ({len(preserve_terms) - 20} more)"
+            terms_str = ", ".join(f'"{term}"' for term in preserve_terms)
         else:
             terms_str = "(none specified)"
 
@@ -109,35 +136,71 @@ CRITICAL: Only output the translated text. Do not add explanations or notes."""
             source_lang=source_name,
             target_lang=target_name,
             preserve_terms=terms_str,
-            context=context,
         )
 
     @classmethod
-    def build_user_prompt(cls, text: str) -> str:
+    def build_user_prompt(cls, text: str, context: Optional[str] = None) -> str:
         """Build user prompt (the text to translate).
 
         Args:
             text: Text to translate
+            context: Context type ('heading', 'paragraph', 'table_cell', etc.)
 
         Returns:
             User prompt
         """
-        return text
+        if not context:
+            return text
+        return f"Context: {context}\n\n{text}"
 
     @classmethod
-    def build_batch_prompt(cls, texts: List[str], separator: str = "\n---SEPARATOR---\n") -> str:
+    def build_update_prompt(
+        cls,
+        text: str,
+        previous_source: str,
+        previous_translation: str,
+        context: Optional[str] = None,
+    ) -> str:
+        """Build user prompt that revises an existing translation.
+
+        Used when translation memory holds a near-identical segment: the
+        model only has to carry the source edits over to the translation.
+
+        Args:
+            text: New source text
+            previous_source: Similar source text found in translation memory
+            previous_translation: Cached translation of ``previous_source``
+            context: Context type of the text
+
+        Returns:
+            User prompt
+        """
+        prompt = f"""Update the previous translation (request format C).
+
+PREVIOUS SOURCE:
+{previous_source}
+
+PREVIOUS TRANSLATION:
+{previous_translation}
+
+NEW SOURCE:
+{text}"""
+        return f"Context: {context}\n\n{prompt}" if context else prompt
+
+    @classmethod
+    def build_batch_prompt(cls, segments: List[Dict[str, object]]) -> str:
         """Build prompt for batch translation.
 
+        Segments travel as a JSON array with stable IDs, so the response can
+        be matched back to them even if the model reorders or drops one.
+
         Args:
-            texts: List of texts to translate
-            separator: Separator between texts
+            segments: Objects with "id", "context" and "text" keys
 
         Returns:
             Combined prompt with instructions
         """
-        combined = separator.join(texts)
-        instruction = f"""Translate each section below. Sections are separated by "{separator.strip()}".
-Keep the separators in your response exactly as they appear.
+        payload = json.dumps(segments, ensure_ascii=False, indent=1)
+        return f"""Translate the "text" of every segment in the JSON array below (request format B).
 
-{combined}"""
-        return instruction
+{payload}"""
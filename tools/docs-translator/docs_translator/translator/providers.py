@@ -1,19 +1,22 @@
 """AI Provider implementations."""
 
+import asyncio
+import datetime
+import math
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
 
-from tenacity import (
-    retry, 
-    stop_after_attempt, 
-    wait_exponential, 
-    retry_if_exception_type,
-    before_sleep_log,
-)
-
-from docs_translator.logging import get_logger, debug, warning, error
-
-logger = get_logger()
+from docs_translator.config.manager import HttpSettings
+from docs_translator.logging import debug, error, verbose, warning
+from docs_translator.translator.packer import RequestPacker, estimate_tokens
+from docs_translator.translator.ratelimit import RateLimiter
+from docs_translator.translator.transport import get_async_http_client, get_http_client, get_timeout
 
 
 class TranslationError(Exception):
@@ -22,12 +25,91 @@ class TranslationError(Exception):
     pass
 
 
-class RateLimitError(TranslationError):
+class TransientError(TranslationError):
+    """Temporary failure (timeout, connection error, 5xx); worth retrying."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # Seconds the server asked us to wait
+
+
+class RateLimitError(TransientError):
     """API rate limit exceeded."""
 
     pass
 
 
+@dataclass
+class TokenUsage:
+    """Token counts reported by a provider, totalled over its requests."""
+
+    requests: int = 0
+    input_tokens: int = 0  # All prompt tokens, cached or not
+    cached_tokens: int = 0  # Prompt tokens read from the provider's cache
+    cache_write_tokens: int = 0  # Prompt tokens written to the cache (Claude)
+    output_tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, input_tokens: int = 0, cached: int = 0, cache_write: int = 0, output: int = 0):
+        """Record the usage of one response."""
+        with self._lock:
+            self.requests += 1
+            self.input_tokens += input_tokens
+            self.cached_tokens += cached
+            self.cache_write_tokens += cache_write
+            self.output_tokens += output
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "input_tokens": self.input_tokens,
+                "cached_tokens": self.cached_tokens,
+                "cache_write_tokens": self.cache_write_tokens,
+                "output_tokens": self.output_tokens,
+            }
+
+
+def _status_code(e: Exception) -> Optional[int]:
+    """HTTP status of an SDK exception, if it carries one."""
+    for value in (
+        getattr(e, "status_code", None),  # openai, anthropic
+        getattr(e, "code", None),  # google.api_core
+        getattr(getattr(e, "response", None), "status_code", None),
+    ):
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def _retry_after(e: Exception) -> Optional[float]:
+    """Seconds from a Retry-After (or retry-after-ms) response header."""
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_transient(e: Exception) -> bool:
+    """Timeouts and dropped connections, across SDKs."""
+    if isinstance(e, (TimeoutError, ConnectionError)):
+        return True
+    name = type(e).__name__.lower()
+    return any(word in name for word in ("timeout", "deadline", "connection", "unavailable"))
+
+
 class BaseProvider(ABC):
     """Abstract base class for AI providers."""
 
@@ -37,12 +119,26 @@ class BaseProvider(ABC):
         model: str,
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        rate_limiter: Optional[RateLimiter] = None,
+        http: Optional[HttpSettings] = None,
+        prompt_caching: bool = True,
+        cache_ttl: int = 300,
+        base_url: Optional[str] = None,
     ):
         self.api_key = api_key
+        self.base_url = base_url
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.rate_limiter = rate_limiter
+        self.http = http or HttpSettings()
+        self.prompt_caching = prompt_caching
+        self.cache_ttl = cache_ttl
+        self.usage = TokenUsage()
+        self._cache_skip_logged = False
         self._client = None
+        self._async_client = None
+        self._async_client_loop = None
         debug(f"Initialized {self.__class__.__name__} with model: {model}")
 
     @abstractmethod
@@ -50,6 +146,10 @@ class BaseProvider(ABC):
         """Initialize the API client."""
         pass
 
+    def _init_async_client(self):
+        """Initialize the async API client."""
+        raise NotImplementedError(f"{self.__class__.__name__} has no async client")
+
     @abstractmethod
     def translate(self, text: str, system_prompt: str) -> str:
         """Translate text using the AI model.
@@ -63,6 +163,103 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def atranslate(self, text: str, system_prompt: str) -> str:
+        """Translate text without blocking the event loop.
+
+        Providers without a native async client fall back to running
+        ``translate`` in a worker thread.
+
+        Args:
+            text: Text to translate
+            system_prompt: System instruction for translation
+
+        Returns:
+            Translated text
+        """
+        return await asyncio.to_thread(self.translate, text, system_prompt)
+
+    NAME = "Provider"  # Label used in error messages
+    CACHE_MIN_TOKENS = 0  # Smallest system prompt the provider caches
+    # Patterns of rate limit messages, for errors that carry no HTTP status
+    RATE_LIMIT_MARKERS: Tuple[str, ...] = (
+        r"\brate[- ]limit",
+        r"\b429\b",
+        r"\btoo many requests\b",
+    )
+
+    def _convert_error(self, e: Exception) -> TranslationError:
+        """Map an SDK exception to a translation error.
+
+        Rate limits (429), server errors (5xx), timeouts and connection
+        errors become ``TransientError``s, which the dispatcher retries.
+        The message is only searched for ``RATE_LIMIT_MARKERS`` when the
+        error has no status; a known status always decides.
+        """
+        if isinstance(e, TranslationError):
+            return e
+        status = _status_code(e)
+        if status == 429 or (status is None and self._is_rate_limit_message(str(e))):
+            warning(f"{self.NAME} rate limit hit: {e}")
+            return RateLimitError(f"{self.NAME} rate limit: {e}", _retry_after(e))
+        if (status is not None and status >= 500) or _is_transient(e):
+            warning(f"{self.NAME} transient error: {e}")
+            return TransientError(f"{self.NAME} error: {e}", _retry_after(e))
+        error(f"{self.NAME} error: {e}")
+        return TranslationError(f"{self.NAME} error: {e}")
+
+    def _is_rate_limit_message(self, message: str) -> bool:
+        """Whether an error message reads as a rate limit (whole words only)."""
+        return any(
+            re.search(marker, message, re.IGNORECASE) for marker in self.RATE_LIMIT_MARKERS
+        )
+
+    def _record_usage(self, response):
+        """Add the token counts of a response to ``usage``."""
+        pass
+
+    def _cache_min_tokens(self) -> int:
+        return self.CACHE_MIN_TOKENS
+
+    def _should_cache(self, system_prompt: str) -> bool:
+        """Whether to ask the provider to cache the system prompt.
+
+        Providers ignore prompts below their minimum cacheable size. The
+        built-in rules and request formats come to about 550 tokens; the
+        preserve terms, all listed in the system prompt, make up the rest.
+        """
+        if not self.prompt_caching:
+            return False
+        tokens = estimate_tokens(system_prompt)
+        if tokens >= self._cache_min_tokens():
+            return True
+        if not self._cache_skip_logged:
+            self._cache_skip_logged = True
+            verbose(
+                f"{self.NAME}: system prompt (~{tokens} tokens) is below the "
+                f"{self._cache_min_tokens()}-token caching minimum; sending it uncached"
+            )
+        return False
+
+    def _request_tokens(self, text: str, system_prompt: str) -> int:
+        """Estimate the tokens a request counts against the TPM limit."""
+        output_tokens = math.ceil(estimate_tokens(text) * RequestPacker.OUTPUT_RATIO)
+        input_tokens = estimate_tokens(system_prompt) + estimate_tokens(text)
+        return input_tokens + min(output_tokens, self.max_tokens)
+
+    def _throttle(self, text: str, system_prompt: str):
+        """Wait for the rate limiter to admit one request."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire(self._request_tokens(text, system_prompt))
+
+    def wait_time(self, tokens: int) -> float:
+        """Seconds until the rate limiter would admit a request of ``tokens`` tokens."""
+        return self.rate_limiter.wait_time(tokens) if self.rate_limiter else 0.0
+
+    async def _athrottle(self, text: str, system_prompt: str):
+        """Async variant of ``_throttle``."""
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire(self._request_tokens(text, system_prompt))
+
     @property
     def client(self):
         """Lazy-load the client."""
@@ -70,155 +267,425 @@ class BaseProvider(ABC):
             self._init_client()
         return self._client
 
+    @property
+    def async_client(self):
+        """Lazy-load the async client (one per event loop, as its connections are)."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._init_async_client()
+            self._async_client_loop = loop
+        return self._async_client
+
+
+# (API key, endpoint) the google-generativeai module is configured with
+_genai_config: Optional[Tuple[str, Optional[str]]] = None
+_genai_lock = threading.Lock()
+
 
 class GeminiProvider(BaseProvider):
     """Google Gemini provider."""
 
+    NAME = "Gemini"
+    RATE_LIMIT_MARKERS = BaseProvider.RATE_LIMIT_MARKERS + (
+        r"\bquota\b",
+        r"\bresource[_ ]exhausted\b",
+    )
+    MODEL_CACHE_SIZE = 16  # GenerativeModel objects kept per provider
+    CACHE_MIN_TOKENS = 1024  # Smallest system prompt a cached content entry accepts
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._models: "OrderedDict[Tuple, Tuple[object, Optional[float]]]" = OrderedDict()
+        self._models_lock = threading.Lock()
+        self._building: Dict[Tuple, threading.Event] = {}  # Models being built, by key
+        self._caching_available = True
+        self._clients = None  # Per-key clients, for a key other than the module-wide one
+
     def _init_client(self):
         """Initialize Gemini client."""
+        global _genai_config
         try:
             import google.generativeai as genai
 
-            genai.configure(api_key=self.api_key)
+            options: Dict[str, Any] = {"api_key": self.api_key}
+            if self.base_url:
+                options.update(transport="rest", client_options={"api_endpoint": self.base_url})
+
+            # The module-wide configuration holds a single key. The first
+            # provider sets it and uses it through the public API; providers
+            # with other keys get clients of their own and skip context
+            # caching, which only uses the module-wide configuration
+            with _genai_lock:
+                if _genai_config is None:
+                    genai.configure(**options)
+                    _genai_config = (self.api_key, self.base_url)
+                if _genai_config != (self.api_key, self.base_url):
+                    self._clients = self._create_key_clients(options)
+                    self._caching_available = False
             self._genai = genai
+            self._client = genai
             debug("Gemini client initialized")
         except ImportError:
             raise ImportError("google-generativeai package not installed. Run: pip install google-generativeai")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type((RateLimitError, ConnectionError)),
-        before_sleep=before_sleep_log(logger, 30),  # WARNING level
-        reraise=True,
-    )
-    def translate(self, text: str, system_prompt: str) -> str:
-        """Translate using Gemini."""
+    @staticmethod
+    def _create_key_clients(options: Dict[str, Any]):
+        """Clients configured with a key other than the module-wide one.
+
+        google-generativeai has no public way to give a model its own key,
+        so this uses its internal ``_ClientManager``, and ``_bind_clients``
+        sets the model's client attributes. Both are present in the 0.7 and
+        0.8 releases pyproject pins; the package is no longer developed.
+        """
+        try:
+            from google.generativeai.client import _ClientManager
+        except ImportError as e:
+            raise TranslationError(
+                "Several Gemini API keys need google-generativeai 0.7 or 0.8 "
+                "(pip install 'google-generativeai>=0.7,<0.9'); or use a single key"
+            ) from e
+        clients = _ClientManager()
+        clients.configure(**options)
+        return clients
+
+    def _bind_clients(self, model):
+        """Send the model's requests with this provider's key."""
+        if self._clients is None:
+            return model  # The module-wide key
+        if not (hasattr(model, "_client") and hasattr(model, "_async_client")):
+            raise TranslationError(
+                "This google-generativeai version cannot bind a model to its own API key; "
+                "install 'google-generativeai>=0.7,<0.9' or use a single Gemini key"
+            )
+        model._client = self._clients.get_default_client("generative")
+        model._async_client = self._clients.get_default_client("generative_async")
+        return model
+
+    def _get_model(self, system_prompt: str):
+        """Get the model bound to the system instruction.
+
+        Models are cached per (model, system prompt, generation config).
+        With prompt caching, the system instruction is stored as cached
+        content on the server, and the model is rebuilt when it expires.
+        A model is built outside the lock, since creating cached content is
+        a network call; other threads needing the same model wait for it,
+        so the content is created once, and the rest carry on.
+        """
         _ = self.client  # Ensure client is initialized
 
+        key = (self.model, system_prompt, self.temperature, self.max_tokens)
+        while True:
+            with self._models_lock:
+                entry = self._models.get(key)
+                if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+                    self._models.move_to_end(key)
+                    return entry[0]
+                building = self._building.get(key)
+                if building is None:
+                    building = self._building[key] = threading.Event()
+                    break
+            # Check again once the other thread is done; build it here if it failed
+            building.wait()
+
         try:
-            # Ensure model name has correct format
-            model_name = self.model
-            if not model_name.startswith("models/"):
-                model_name = f"models/{model_name}"
-            
-            # Create model with system instruction
+            model, expires_at = self._build_model(system_prompt)
+            with self._models_lock:
+                self._models[key] = (model, expires_at)
+                while len(self._models) > self.MODEL_CACHE_SIZE:
+                    self._models.popitem(last=False)
+        finally:
+            with self._models_lock:
+                del self._building[key]
+            building.set()
+        return model
+
+    def _build_model(self, system_prompt: str) -> Tuple[object, Optional[float]]:
+        """Build a model for the system instruction.
+
+        Returns:
+            The model, and the monotonic time it must be rebuilt by (None
+            if it does not expire)
+        """
+        # Ensure model name has correct format
+        model_name = self.model
+        if not model_name.startswith("models/"):
+            model_name = f"models/{model_name}"
+
+        generation_config = {
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_tokens,
+        }
+        model = self._build_cached_model(model_name, system_prompt, generation_config)
+        expires_at = None
+        if model is not None:
+            # Leave a margin so no request goes out against an expired cache
+            expires_at = time.monotonic() + self.cache_ttl * 0.9
+        else:
             model = self._genai.GenerativeModel(
                 model_name=model_name,
                 system_instruction=system_prompt,
-                generation_config={
-                    "temperature": self.temperature,
-                    "max_output_tokens": self.max_tokens,
-                },
+                generation_config=generation_config,
             )
+        return self._bind_clients(model), expires_at
 
-            response = model.generate_content(text)
+    def _build_cached_model(self, model_name: str, system_prompt: str, generation_config: dict):
+        """Create a model on top of cached content holding the system instruction.
 
-            if not response.text:
-                raise TranslationError("Empty response from Gemini")
+        Returns:
+            The model, or None if caching is off, the prompt is below the
+            minimum cacheable size, or the model does not support caching
+        """
+        if not self._caching_available or not self._should_cache(system_prompt):
+            return None
+        try:
+            from google.generativeai import caching
+
+            cached_content = caching.CachedContent.create(
+                model=model_name,
+                system_instruction=system_prompt,
+                ttl=datetime.timedelta(seconds=self.cache_ttl),
+            )
+            debug(f"Gemini cached content created: {cached_content.name}")
+            return self._genai.GenerativeModel.from_cached_content(
+                cached_content=cached_content, generation_config=generation_config
+            )
+        except Exception as e:
+            debug(f"Gemini context caching unavailable, sending the full prompt: {e}")
+            self._caching_available = False
+            return None
 
-            return response.text.strip()
+    @property
+    def _request_options(self) -> dict:
+        return {"timeout": self.http.read_timeout}
 
+    def translate(self, text: str, system_prompt: str) -> str:
+        """Translate using Gemini."""
+        self._throttle(text, system_prompt)
+        try:
+            response = self._get_model(system_prompt).generate_content(
+                text, request_options=self._request_options
+            )
+            self._record_usage(response)
+            return self._extract_text(response)
         except Exception as e:
-            error_str = str(e).lower()
-            if "quota" in error_str or "rate" in error_str or "429" in error_str:
-                warning(f"Gemini rate limit hit, will retry: {e}")
-                raise RateLimitError(f"Gemini rate limit: {e}")
-            error(f"Gemini error: {e}")
-            raise TranslationError(f"Gemini error: {e}")
+            raise self._convert_error(e)
+
+    async def atranslate(self, text: str, system_prompt: str) -> str:
+        """Translate using Gemini's async API."""
+        await self._athrottle(text, system_prompt)
+        try:
+            response = await self._get_model(system_prompt).generate_content_async(
+                text, request_options=self._request_options
+            )
+            self._record_usage(response)
+            return self._extract_text(response)
+        except Exception as e:
+            raise self._convert_error(e)
+
+    def _record_usage(self, response):
+        # Also counts implicit cache hits on models that cache automatically
+        metadata = getattr(response, "usage_metadata", None)
+        if metadata:
+            self.usage.add(
+                input_tokens=getattr(metadata, "prompt_token_count", 0) or 0,
+                cached=getattr(metadata, "cached_content_token_count", 0) or 0,
+                output=getattr(metadata, "candidates_token_count", 0) or 0,
+            )
+
+    @staticmethod
+    def _extract_text(response) -> str:
+        if not response.text:
+            raise TranslationError("Empty response from Gemini")
+        return response.text.strip()
 
 
 class OpenAIProvider(BaseProvider):
     """OpenAI provider."""
 
+    NAME = "OpenAI"
+
     def _init_client(self):
         """Initialize OpenAI client."""
         try:
-            from openai import OpenAI
-
-            self._client = OpenAI(api_key=self.api_key)
+            from openai import DefaultHttpxClient, OpenAI
+
+            self._client = OpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,  # Retries are scheduled by the dispatcher
+                timeout=get_timeout(self.http, DefaultHttpxClient),
+                http_client=get_http_client(self.http, DefaultHttpxClient),
+            )
             debug("OpenAI client initialized")
         except ImportError:
             raise ImportError("openai package not installed. Run: pip install openai")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type((RateLimitError, ConnectionError)),
-        before_sleep=before_sleep_log(logger, 30),
-        reraise=True,
-    )
-    def translate(self, text: str, system_prompt: str) -> str:
-        """Translate using OpenAI."""
+    def _init_async_client(self):
+        """Initialize async OpenAI client."""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text},
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,  # Retries are scheduled by the dispatcher
+                timeout=get_timeout(self.http, DefaultAsyncHttpxClient),
+                http_client=get_async_http_client(self.http, DefaultAsyncHttpxClient),
             )
+            debug("Async OpenAI client initialized")
+        except ImportError:
+            raise ImportError("openai package not installed. Run: pip install openai")
 
-            if not response.choices:
-                raise TranslationError("Empty response from OpenAI")
+    def _request(self, text: str, system_prompt: str) -> dict:
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
 
-            return response.choices[0].message.content.strip()
+    def translate(self, text: str, system_prompt: str) -> str:
+        """Translate using OpenAI."""
+        self._throttle(text, system_prompt)
+        try:
+            response = self.client.chat.completions.create(**self._request(text, system_prompt))
+            self._record_usage(response)
+            return self._extract_text(response)
+        except Exception as e:
+            raise self._convert_error(e)
 
+    async def atranslate(self, text: str, system_prompt: str) -> str:
+        """Translate using the async OpenAI client."""
+        await self._athrottle(text, system_prompt)
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._request(text, system_prompt)
+            )
+            self._record_usage(response)
+            return self._extract_text(response)
         except Exception as e:
-            error_str = str(e).lower()
-            if "rate" in error_str or "429" in error_str:
-                warning(f"OpenAI rate limit hit, will retry: {e}")
-                raise RateLimitError(f"OpenAI rate limit: {e}")
-            error(f"OpenAI error: {e}")
-            raise TranslationError(f"OpenAI error: {e}")
+            raise self._convert_error(e)
+
+    def _record_usage(self, response):
+        # OpenAI caches prompt prefixes automatically; the system prompt
+        # comes first so it forms that prefix
+        usage = getattr(response, "usage", None)
+        if usage:
+            details = getattr(usage, "prompt_tokens_details", None)
+            self.usage.add(
+                input_tokens=usage.prompt_tokens or 0,
+                cached=getattr(details, "cached_tokens", 0) or 0,
+                output=usage.completion_tokens or 0,
+            )
+
+    @staticmethod
+    def _extract_text(response) -> str:
+        if not response.choices:
+            raise TranslationError("Empty response from OpenAI")
+        return response.choices[0].message.content.strip()
 
 
 class ClaudeProvider(BaseProvider):
     """Anthropic Claude provider."""
 
+    NAME = "Claude"
+    CACHE_MIN_TOKENS = 1024  # cache_control has no effect on shorter prompts
+    HAIKU_CACHE_MIN_TOKENS = 2048
+
+    def _cache_min_tokens(self) -> int:
+        return self.HAIKU_CACHE_MIN_TOKENS if "haiku" in self.model else self.CACHE_MIN_TOKENS
+
     def _init_client(self):
         """Initialize Claude client."""
         try:
             import anthropic
 
-            self._client = anthropic.Anthropic(api_key=self.api_key)
+            self._client = anthropic.Anthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,  # Retries are scheduled by the dispatcher
+                timeout=get_timeout(self.http, anthropic.DefaultHttpxClient),
+                http_client=get_http_client(self.http, anthropic.DefaultHttpxClient),
+            )
             debug("Claude client initialized")
         except ImportError:
             raise ImportError("anthropic package not installed. Run: pip install anthropic")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type((RateLimitError, ConnectionError)),
-        before_sleep=before_sleep_log(logger, 30),
-        reraise=True,
-    )
-    def translate(self, text: str, system_prompt: str) -> str:
-        """Translate using Claude."""
+    def _init_async_client(self):
+        """Initialize async Claude client."""
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": text},
-                ],
+            import anthropic
+
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                max_retries=0,  # Retries are scheduled by the dispatcher
+                timeout=get_timeout(self.http, anthropic.DefaultAsyncHttpxClient),
+                http_client=get_async_http_client(self.http, anthropic.DefaultAsyncHttpxClient),
             )
+            debug("Async Claude client initialized")
+        except ImportError:
+            raise ImportError("anthropic package not installed. Run: pip install anthropic")
 
-            if not response.content:
-                raise TranslationError("Empty response from Claude")
+    def _request(self, text: str, system_prompt: str) -> dict:
+        system = system_prompt
+        if self._should_cache(system_prompt):
+            # Mark the system prompt as a cache breakpoint
+            system = [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+        return dict(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            system=system,
+            messages=[
+                {"role": "user", "content": text},
+            ],
+        )
 
-            return response.content[0].text.strip()
+    def translate(self, text: str, system_prompt: str) -> str:
+        """Translate using Claude."""
+        self._throttle(text, system_prompt)
+        try:
+            response = self.client.messages.create(**self._request(text, system_prompt))
+            self._record_usage(response)
+            return self._extract_text(response)
+        except Exception as e:
+            raise self._convert_error(e)
 
+    async def atranslate(self, text: str, system_prompt: str) -> str:
+        """Translate using the async Claude client."""
+        await self._athrottle(text, system_prompt)
+        try:
+            response = await self.async_client.messages.create(
+                **self._request(text, system_prompt)
+            )
+            self._record_usage(response)
+            return self._extract_text(response)
         except Exception as e:
-            error_str = str(e).lower()
-            if "rate" in error_str or "429" in error_str:
-                warning(f"Claude rate limit hit, will retry: {e}")
-                raise RateLimitError(f"Claude rate limit: {e}")
-            error(f"Claude error: {e}")
-            raise TranslationError(f"Claude error: {e}")
+            raise self._convert_error(e)
+
+    def _record_usage(self, response):
+        # input_tokens excludes the tokens read from or written to the cache
+        usage = getattr(response, "usage", None)
+        if usage:
+            cached = getattr(usage, "cache_read_input_tokens", 0) or 0
+            cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+            self.usage.add(
+                input_tokens=(usage.input_tokens or 0) + cached + cache_write,
+                cached=cached,
+                cache_write=cache_write,
+                output=usage.output_tokens or 0,
+            )
+
+    @staticmethod
+    def _extract_text(response) -> str:
+        if not response.content:
+            raise TranslationError("Empty response from Claude")
+        return response.content[0].text.strip()
 
 
 def create_provider(
@@ -227,6 +694,11 @@ def create_provider(
     model: str,
     temperature: float = 0.3,
     max_tokens: int = 4096,
+    rate_limiter: Optional[RateLimiter] = None,
+    http: Optional[HttpSettings] = None,
+    prompt_caching: bool = True,
+    cache_ttl: int = 300,
+    base_url: Optional[str] = None,
 ) -> BaseProvider:
     """Factory function to create the appropriate provider.
 
@@ -236,6 +708,11 @@ def create_provider(
         model: Model ID to use
         temperature: Generation temperature
         max_tokens: Maximum tokens for response
+        rate_limiter: Shared RPM/TPM limiter for this provider and model
+        http: Connection pool and timeout settings
+        prompt_caching: Ask the provider to cache the system prompt
+        cache_ttl: Lifetime of Gemini cached content, in seconds
+        base_url: API endpoint override, e.g. a proxy or a local test server
 
     Returns:
         Appropriate provider instance
@@ -254,4 +731,9 @@ def create_provider(
         model=model,
         temperature=temperature,
         max_tokens=max_tokens,
+        rate_limiter=rate_limiter,
+        http=http,
+        prompt_caching=prompt_caching,
+        cache_ttl=cache_ttl,
+        base_url=base_url,
     )
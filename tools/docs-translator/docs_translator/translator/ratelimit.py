@@ -0,0 +1,148 @@
+"""Client-side request and token rate limiting."""
+
+import asyncio
+import hashlib
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional, Tuple
+
+from docs_translator.logging import debug
+
+# Seconds this thread or task has waited in ``RateLimiter.acquire`` since
+# the last ``start_timer``
+_waited: ContextVar[float] = ContextVar("rate_limit_waited", default=0.0)
+
+
+def start_timer() -> Callable[[], float]:
+    """Start timing a request.
+
+    Returns:
+        A function giving the seconds elapsed since, minus the time this
+        thread or task spent waiting for a rate limiter, so latency
+        measurements cover only the provider call
+    """
+    _waited.set(0.0)
+    start = time.monotonic()
+    return lambda: max(0.0, time.monotonic() - start - _waited.get())
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of rejections.
+
+    Every caller takes its tokens immediately, driving the level negative
+    if needed, and is told how long to wait until the bucket has refilled
+    past zero. Callers are thus admitted in arrival order at exactly the
+    refill rate, with no retry loop and no burst at each window boundary.
+    """
+
+    BURST_SECONDS = 5.0  # Capacity, as seconds of refill
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * self.BURST_SECONDS)
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` tokens and return the seconds to wait before using them."""
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+        self._level -= amount
+        return max(0.0, -self._level / self.rate)
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds a reservation of ``amount`` would wait, without taking it."""
+        level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        return max(0.0, (amount - level) / self.rate)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for one provider and model.
+
+    Thread-safe; the sync and async entry points share the same buckets.
+    """
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        """Initialize limiter.
+
+        Args:
+            rpm: Requests per minute (0 = unlimited)
+            tpm: Tokens per minute, input plus expected output (0 = unlimited)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = TokenBucket(rpm) if rpm else None
+        self._tokens = TokenBucket(tpm) if tpm else None
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve capacity for one request.
+
+        Returns:
+            Seconds to wait before sending it
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self._requests:
+                delay = max(delay, self._requests.reserve(1, now))
+            if self._tokens and tokens:
+                delay = max(delay, self._tokens.reserve(tokens, now))
+        if delay > 0:
+            debug(f"Rate limit: delaying request by {delay:.2f}s")
+        return delay
+
+    def wait_time(self, tokens: int = 0) -> float:
+        """Seconds a request of ``tokens`` tokens would wait if sent now."""
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self._requests:
+                delay = max(delay, self._requests.wait_time(1, now))
+            if self._tokens and tokens:
+                delay = max(delay, self._tokens.wait_time(tokens, now))
+        return delay
+
+    def acquire(self, tokens: int = 0):
+        """Block until a request of ``tokens`` tokens may be sent."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            _waited.set(_waited.get() + delay)
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: int = 0):
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            _waited.set(_waited.get() + delay)
+            await asyncio.sleep(delay)
+
+
+_limiters: Dict[Tuple[str, str, str], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    provider: str, model: str, rpm: int, tpm: int, api_key: Optional[str] = None
+) -> Optional[RateLimiter]:
+    """Get the shared limiter for a provider, model and API key.
+
+    Every translator in the process that talks to the same model draws from
+    the same quota, so they share one limiter. Each API key has a quota of
+    its own.
+
+    Returns:
+        The limiter, or None if both limits are 0 (unlimited)
+    """
+    if not rpm and not tpm:
+        return None
+    key_id = hashlib.sha256(api_key.encode()).hexdigest()[:12] if api_key else ""
+    key = (provider, model, key_id)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None or (limiter.rpm, limiter.tpm) != (rpm, tpm):
+            limiter = RateLimiter(rpm, tpm)
+            _limiters[key] = limiter
+            debug(f"Rate limiter for {provider}/{model}: {rpm} RPM, {tpm} TPM")
+        return limiter
@@ -0,0 +1,550 @@
+"""Storage backends for the translation memory."""
+
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from docs_translator.logging import debug, info, warning
+
+
+@dataclass
+class TranslationMemoryEntry:
+    """Entry in translation memory."""
+
+    source_hash: str
+    source_text: str
+    target_text: str
+    source_lang: str
+    target_lang: str
+    context: str
+    timestamp: str
+    model: str
+    hits: int = 0
+    last_hit: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TranslationMemoryEntry":
+        """Create from dictionary, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def usage(self) -> "EntryUsage":
+        """Lightweight view used by eviction policies."""
+        return EntryUsage(
+            key=self.source_hash,
+            model=self.model,
+            timestamp=self.timestamp,
+            last_hit=self.last_hit,
+            hits=self.hits,
+            size=len(self.source_text.encode("utf-8")) + len(self.target_text.encode("utf-8")),
+        )
+
+
+class EntryUsage(NamedTuple):
+    """Eviction-relevant metadata of a stored entry."""
+
+    key: str
+    model: str
+    timestamp: str
+    last_hit: Optional[str]
+    hits: int
+    size: int  # Bytes of source + target text
+
+
+# Buffered hit statistics: key -> (hit count increment, last hit timestamp)
+HitUpdates = Dict[str, Tuple[int, str]]
+
+
+class MemoryBackend(ABC):
+    """Abstract base class for translation memory storage."""
+
+    # If True, TranslationMemory hands every set() straight to put_many()
+    # instead of buffering entries until save().
+    write_through = False
+
+    # Suffixes of the files the backend keeps in the cache directory
+    FILE_SUFFIXES: Tuple[str, ...] = ()
+
+    def __init__(self, cache_dir: Path, read_only: bool = False):
+        """Open the backend.
+
+        Args:
+            cache_dir: Directory holding the memory files
+            read_only: Only look entries up, for worker processes that share
+                the memory with a writing process
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.read_only = read_only
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[TranslationMemoryEntry]:
+        """Look up a single entry by hash."""
+        pass
+
+    @abstractmethod
+    def put_many(self, entries: Iterable[TranslationMemoryEntry]):
+        """Insert or replace entries in one write."""
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored entries."""
+        pass
+
+    @abstractmethod
+    def iter_entries(self) -> Iterator[TranslationMemoryEntry]:
+        """Iterate over all stored entries."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete entries by hash. Returns the number removed."""
+        pass
+
+    def iter_usage(self) -> Iterator[EntryUsage]:
+        """Iterate over eviction metadata without loading full entries."""
+        for entry in self.iter_entries():
+            yield entry.usage()
+
+    def record_hits(self, updates: HitUpdates):
+        """Apply buffered hit counts and last-hit timestamps."""
+        entries = []
+        for key, (count, last_hit) in updates.items():
+            entry = self.get(key)
+            if entry:
+                entry.hits += count
+                entry.last_hit = last_hit
+                entries.append(entry)
+        self.put_many(entries)
+
+    def flush(self):
+        """Block until all accepted writes are durable."""
+        pass
+
+    def close(self):
+        """Release any resources held by the backend."""
+        pass
+
+
+class JSONBackend(MemoryBackend):
+    """Single JSON file holding the whole memory (legacy format).
+
+    Every write rewrites the full file, so this is only suitable for small
+    memories. Kept for portability and as the migration source for SQLite.
+    """
+
+    FILE_NAME = "translation_memory.json"
+    FILE_SUFFIXES = (".json",)
+
+    def __init__(self, cache_dir: Path, read_only: bool = False):
+        super().__init__(cache_dir, read_only)
+        self.cache_file = self.cache_dir / self.FILE_NAME
+        self.memory: Dict[str, TranslationMemoryEntry] = load_json_memory(self.cache_file)
+
+    def get(self, key: str) -> Optional[TranslationMemoryEntry]:
+        return self.memory.get(key)
+
+    def put_many(self, entries: Iterable[TranslationMemoryEntry]):
+        for entry in entries:
+            self.memory[entry.source_hash] = entry
+        write_json_memory(self.cache_file, self.memory)
+
+    def count(self) -> int:
+        return len(self.memory)
+
+    def iter_entries(self) -> Iterator[TranslationMemoryEntry]:
+        return iter(list(self.memory.values()))
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        removed = sum(1 for key in keys if self.memory.pop(key, None) is not None)
+        if removed:
+            write_json_memory(self.cache_file, self.memory)
+        return removed
+
+
+class SQLiteBackend(MemoryBackend):
+    """SQLite database in WAL mode with indexed point lookups.
+
+    Startup cost is independent of memory size and writes are batched
+    into a single transaction per ``put_many`` call. An existing JSON
+    memory in the same cache directory is imported on first open.
+    """
+
+    FILE_NAME = "translation_memory.db"
+    FILE_SUFFIXES = (".db", ".db-wal", ".db-shm")
+
+    COLUMNS = (
+        "source_hash",
+        "source_text",
+        "target_text",
+        "source_lang",
+        "target_lang",
+        "context",
+        "timestamp",
+        "model",
+        "hits",
+        "last_hit",
+    )
+
+    def __init__(self, cache_dir: Path, read_only: bool = False):
+        super().__init__(cache_dir, read_only)
+        self.db_file = self.cache_dir / self.FILE_NAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if not read_only:
+            self._create_schema()
+            self._migrate_json()
+
+    def _create_schema(self):
+        """Create tables if they do not exist yet."""
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    source_hash TEXT PRIMARY KEY,
+                    source_text TEXT NOT NULL,
+                    target_text TEXT NOT NULL,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    context TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    last_hit TEXT
+                )
+                """
+            )
+            # Databases created before hit tracking lack these columns
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+            if "hits" not in existing:
+                self._conn.execute(
+                    "ALTER TABLE entries ADD COLUMN hits INTEGER NOT NULL DEFAULT 0"
+                )
+            if "last_hit" not in existing:
+                self._conn.execute("ALTER TABLE entries ADD COLUMN last_hit TEXT")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _migrate_json(self):
+        """Import a legacy JSON memory once, on first open."""
+        json_file = self.cache_dir / JSONBackend.FILE_NAME
+        if not json_file.exists() or self._get_meta("json_migrated"):
+            return
+
+        entries = load_json_memory(json_file)
+        with self._lock, self._conn:
+            self._insert(entries.values())
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (str(len(entries)),),
+            )
+        info(f"Migrated {len(entries)} entries from {json_file.name} to {self.db_file.name}")
+
+    def _insert(self, entries: Iterable[TranslationMemoryEntry]):
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO entries ({', '.join(self.COLUMNS)}) VALUES ({placeholders})",
+            (tuple(getattr(e, c) for c in self.COLUMNS) for e in entries),
+        )
+
+    def get(self, key: str) -> Optional[TranslationMemoryEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM entries WHERE source_hash = ?", (key,)
+            ).fetchone()
+        return TranslationMemoryEntry(*row) if row else None
+
+    def put_many(self, entries: Iterable[TranslationMemoryEntry]):
+        entries = list(entries)
+        if not entries:
+            return
+        with self._lock, self._conn:
+            self._insert(entries)
+        debug(f"Wrote {len(entries)} entries to {self.db_file.name}")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def iter_entries(self) -> Iterator[TranslationMemoryEntry]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM entries").fetchall()
+        for row in rows:
+            yield TranslationMemoryEntry(*row)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        keys = [(key,) for key in keys]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM entries WHERE source_hash = ?", keys)
+            return self._conn.total_changes - before
+
+    def iter_usage(self) -> Iterator[EntryUsage]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source_hash, model, timestamp, last_hit, hits, "
+                "length(CAST(source_text AS BLOB)) + length(CAST(target_text AS BLOB)) "
+                "FROM entries"
+            ).fetchall()
+        for row in rows:
+            yield EntryUsage(*row)
+
+    def record_hits(self, updates: HitUpdates):
+        if not updates:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE entries SET hits = hits + ?, last_hit = ? WHERE source_hash = ?",
+                ((count, last_hit, key) for key, (count, last_hit) in updates.items()),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class JournalBackend(MemoryBackend):
+    """Append-only JSONL journal on top of a periodically compacted snapshot.
+
+    Each ``put_many`` call enqueues one journal record per entry; a
+    background thread appends them in batches and fsyncs, so a crash loses
+    at most the batch in flight. When the writer has been idle for a while,
+    and again at exit, the journal is folded into the snapshot and
+    truncated. On load the snapshot is read and the journal replayed on top.
+    """
+
+    write_through = True
+
+    SNAPSHOT_NAME = "translation_memory.snapshot.json"
+    JOURNAL_NAME = "translation_memory.journal.jsonl"
+    FILE_SUFFIXES = (".json", ".jsonl")
+
+    BATCH_SIZE = 100  # Records per journal append
+    FLUSH_INTERVAL = 1.0  # Seconds before a partial batch is written
+    IDLE_COMPACT_SECONDS = 30.0  # Idle time before compacting into the snapshot
+
+    _STOP = object()
+
+    def __init__(self, cache_dir: Path, read_only: bool = False):
+        super().__init__(cache_dir, read_only)
+        self.snapshot_file = self.cache_dir / self.SNAPSHOT_NAME
+        self.journal_file = self.cache_dir / self.JOURNAL_NAME
+        self._lock = threading.Lock()
+        self.memory: Dict[str, TranslationMemoryEntry] = load_json_memory(self.snapshot_file)
+        self._journal_records = self._replay()
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = read_only  # A reader neither appends nor compacts
+        if read_only:
+            return
+        self._writer = threading.Thread(
+            target=self._run, name="tm-journal-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _replay(self) -> int:
+        """Apply journal records written since the last snapshot."""
+        if not self.journal_file.exists():
+            return 0
+        replayed = 0
+        with open(self.journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    if "deleted" in record:
+                        self.memory.pop(record["deleted"], None)
+                    else:
+                        entry = TranslationMemoryEntry.from_dict(record)
+                        self.memory[entry.source_hash] = entry
+                except (json.JSONDecodeError, TypeError):
+                    # Torn write from a crash; everything before it is intact
+                    warning(f"Skipping corrupt record in {self.journal_file.name}")
+                    continue
+                replayed += 1
+
+        # Terminate a torn last line so the next append starts on a fresh one
+        if self.read_only:
+            return replayed
+        with open(self.journal_file, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+        if replayed:
+            debug(f"Replayed {replayed} journal records")
+        return replayed
+
+    def get(self, key: str) -> Optional[TranslationMemoryEntry]:
+        with self._lock:
+            return self.memory.get(key)
+
+    def put_many(self, entries: Iterable[TranslationMemoryEntry]):
+        with self._lock:
+            for entry in entries:
+                self.memory[entry.source_hash] = entry
+                self._queue.put(entry)
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self.memory)
+
+    def iter_entries(self) -> Iterator[TranslationMemoryEntry]:
+        with self._lock:
+            return iter(list(self.memory.values()))
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self.memory.pop(key, None) is not None:
+                    self._queue.put({"deleted": key})
+                    removed += 1
+        return removed
+
+    def flush(self):
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._writer.join()
+
+    def _run(self):
+        """Writer thread: batch journal appends, compact when idle."""
+        batch: list = []
+        last_activity = time.monotonic()
+
+        while True:
+            try:
+                item = self._queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                break
+
+            if isinstance(item, (TranslationMemoryEntry, dict)):
+                batch.append(item)
+                last_activity = time.monotonic()
+                if len(batch) < self.BATCH_SIZE:
+                    continue
+
+            if batch:
+                self._append(batch)
+                batch = []
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif (
+                item is None
+                and self._journal_records
+                and time.monotonic() - last_activity >= self.IDLE_COMPACT_SECONDS
+            ):
+                self._compact()
+
+        if batch:
+            self._append(batch)
+        self._compact()
+
+    def _append(self, batch: list):
+        """Append one batch of records (entries or tombstones) and fsync."""
+        lines = "".join(
+            json.dumps(r if isinstance(r, dict) else r.__dict__, ensure_ascii=False) + "\n"
+            for r in batch
+        )
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_records += len(batch)
+        debug(f"Journaled {len(batch)} entries")
+
+    def _compact(self):
+        """Fold the journal into a fresh snapshot and truncate it."""
+        if not self._journal_records:
+            return
+        with self._lock:
+            memory = dict(self.memory)
+        write_json_memory(self.snapshot_file, memory)
+        self.journal_file.unlink(missing_ok=True)
+        debug(f"Compacted {self._journal_records} journal records into snapshot")
+        self._journal_records = 0
+
+
+def load_json_memory(path: Path) -> Dict[str, TranslationMemoryEntry]:
+    """Read a legacy ``translation_memory.json`` file."""
+    memory: Dict[str, TranslationMemoryEntry] = {}
+    if not path.exists():
+        return memory
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        for key, entry_data in data.get("memory", {}).items():
+            memory[key] = TranslationMemoryEntry.from_dict(entry_data)
+    except (json.JSONDecodeError, TypeError) as e:
+        warning(f"Ignoring unreadable translation memory {path}: {e}")
+        return {}
+    return memory
+
+
+def write_json_memory(path: Path, memory: Dict[str, TranslationMemoryEntry]):
+    """Atomically write a memory dict in the ``translation_memory.json`` format."""
+    data = {
+        "version": "1.0",
+        "memory": {key: entry.__dict__ for key, entry in memory.items()},
+        "stats": {"total_entries": len(memory)},
+    }
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+BACKENDS = {
+    "json": JSONBackend,
+    "sqlite": SQLiteBackend,
+    "journal": JournalBackend,
+}
+
+
+def create_backend(backend_name: str, cache_dir: str, read_only: bool = False) -> MemoryBackend:
+    """Factory function to create a translation memory backend.
+
+    Args:
+        backend_name: 'sqlite', 'journal' or 'json'
+        cache_dir: Directory holding the memory files
+        read_only: Open for lookups only
+
+    Returns:
+        Appropriate backend instance
+    """
+    if backend_name not in BACKENDS:
+        raise ValueError(
+            f"Unknown cache backend: {backend_name}. Choose from: {list(BACKENDS.keys())}"
+        )
+    return BACKENDS[backend_name](Path(cache_dir), read_only)
@@ -0,0 +1,118 @@
+"""Shared keep-alive HTTP transport for provider SDKs."""
+
+import asyncio
+import dataclasses
+import importlib
+import importlib.util
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+from docs_translator.config.manager import HttpSettings
+from docs_translator.logging import debug
+
+_clients: Dict[Tuple, Any] = {}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def _httpx_module(client_class: Optional[type]):
+    """The httpx package a client class is built on.
+
+    SDKs ship ``DefaultHttpxClient`` classes that subclass the client of
+    whichever httpx package they depend on (``httpx`` or ``httpx2``), and
+    reject clients from the other one.
+    """
+    if client_class is not None:
+        for cls in client_class.__mro__:
+            package = cls.__module__.partition(".")[0]
+            if package.startswith("httpx"):
+                return importlib.import_module(package)
+    return importlib.import_module("httpx")
+
+
+def _use_http2(settings: HttpSettings) -> bool:
+    """HTTP/2 needs the optional ``h2`` package."""
+    if settings.http2 and importlib.util.find_spec("h2") is None:
+        debug("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+        return False
+    return settings.http2
+
+
+def get_timeout(settings: HttpSettings, client_class: Optional[type] = None):
+    """Per-request timeout, passed to the SDKs so it overrides their defaults."""
+    httpx = _httpx_module(client_class)
+    return httpx.Timeout(settings.read_timeout, connect=settings.connect_timeout)
+
+
+def _client_options(settings: HttpSettings, client_class: Optional[type]) -> Dict[str, Any]:
+    httpx = _httpx_module(client_class)
+    return dict(
+        http2=_use_http2(settings),
+        timeout=get_timeout(settings, client_class),
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+    )
+
+
+def get_http_client(settings: HttpSettings, client_class: Optional[type] = None):
+    """Get the process-wide pooled HTTP client for these settings.
+
+    Every provider instance shares it, so connections stay open across
+    units and files instead of each SDK client keeping its own pool.
+
+    Args:
+        settings: Pool and timeout settings
+        client_class: The SDK's ``DefaultHttpxClient``, or None for a plain
+            ``httpx.Client``
+    """
+    key = (client_class, dataclasses.astuple(settings))
+    with _lock:
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            if client_class is None:
+                client_class = _httpx_module(None).Client
+            client = client_class(**_client_options(settings, client_class))
+            _clients[key] = client
+            debug(
+                f"HTTP transport: pool of {settings.max_connections}, "
+                f"http2={_use_http2(settings)}"
+            )
+        return client
+
+
+def get_async_http_client(settings: HttpSettings, client_class: Optional[type] = None):
+    """Get the pooled async HTTP client for these settings and the running loop.
+
+    Async connections are bound to the event loop that opened them, so
+    there is one client per loop.
+
+    Args:
+        settings: Pool and timeout settings
+        client_class: The SDK's ``DefaultAsyncHttpxClient``, or None for a
+            plain ``httpx.AsyncClient``
+    """
+    loop = asyncio.get_running_loop()
+    key = (client_class, dataclasses.astuple(settings))
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            if client_class is None:
+                client_class = _httpx_module(None).AsyncClient
+            client = client_class(**_client_options(settings, client_class))
+            clients[key] = client
+        return client
+
+
+def close_http_clients():
+    """Close the shared sync clients (e.g. at process exit)."""
+    with _lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
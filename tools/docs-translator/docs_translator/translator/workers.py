@@ -0,0 +1,89 @@
+"""Worker processes for the CPU-bound parts of a directory run.
+
+Parsing, cache lookups and Markdown reconstruction are pure Python and hold
+the GIL, so on large trees they are spread over processes. Each worker
+keeps its own ``Translator`` with a read-only view of the translation
+memory; API requests stay in the main process.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+from docs_translator.config.manager import TranslatorConfig
+from docs_translator.translator.storage import HitUpdates
+
+if TYPE_CHECKING:
+    from docs_translator.translator.core import TranslationResult, Translator, _PendingFile
+
+# The worker's translator, set up once per process by _init
+_translator: Optional["Translator"] = None
+
+
+def create_pool(config: TranslatorConfig, use_cache: bool, jobs: int) -> ProcessPoolExecutor:
+    """Start ``jobs`` worker processes.
+
+    Workers are spawned rather than forked: the main process runs
+    threads (dispatcher, journal writer) that a fork would copy mid-flight.
+
+    Args:
+        config: Configuration of the main translator
+        use_cache: Whether workers look units up in the translation memory
+        jobs: Number of processes
+    """
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init,
+        initargs=(config, use_cache),
+    )
+
+
+def _init(config: TranslatorConfig, use_cache: bool):
+    global _translator
+    from docs_translator.translator.core import TranslationMemory, Translator
+
+    _translator = Translator(config, use_cache=False)
+    if use_cache:
+        _translator.memory = TranslationMemory(
+            config.cache_dir,
+            backend=config.cache_backend,
+            policy=config.cache_eviction,
+            read_only=True,
+        )
+
+
+def _take_hits() -> Tuple[int, int, HitUpdates]:
+    if _translator.memory is None:
+        return 0, 0, {}
+    return _translator.memory.take_hits()
+
+
+def prepare_file(
+    index: int, result: "TranslationResult", source: str, target: str, force: bool
+) -> Tuple[Union["_PendingFile", "TranslationResult"], Tuple[int, int, HitUpdates]]:
+    """Parse a file and look it up in the existing output and the cache, writing it if covered.
+
+    Returns:
+        What ``Translator._prepare_file`` returns, and the cache lookups made
+    """
+    outcome = _translator._prepare_file(index, result, source, target, force)
+    return outcome, _take_hits()
+
+
+def render_file(pending: "_PendingFile") -> "TranslationResult":
+    """Assemble and write a file whose translations are all filled in."""
+    return _translator._render_file(pending)
+
+
+def analyze_file(
+    input_path: str,
+    output_path: str,
+    source: Optional[str],
+    target: Optional[str],
+    force: bool,
+) -> "TranslationResult":
+    """Dry-run one file."""
+    return _translator.translate_file(
+        input_path, output_path, source, target, dry_run=True, force=force
+    )
@@ -0,0 +1,74 @@
+"""Shared fixtures: a translator wired to an in-process fake provider."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pytest
+
+from docs_translator.config.manager import TranslatorConfig
+from docs_translator.translator.core import Translator
+from docs_translator.translator.providers import BaseProvider, TranslationError
+
+
+class FakeProvider(BaseProvider):
+    """Provider that "translates" by wrapping text in ``EN<...>``.
+
+    A text containing one of ``reject`` fails with a non-transient error.
+    Every request is recorded in ``calls``.
+    """
+
+    NAME = "Fake"
+
+    def __init__(self, reject: Optional[List[str]] = None):
+        super().__init__(api_key="test", model="fake-model")
+        self.reject = reject or []
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def _init_client(self):
+        pass
+
+    def translate(self, text: str, system_prompt: str) -> str:
+        with self._lock:
+            self.calls.append(text)
+        if any(marker in text for marker in self.reject):
+            raise TranslationError(f"{self.NAME} API error: 400 bad request")
+        if text.startswith("Context: "):
+            text = text.split("\n\n", 1)[1]
+        if text.lstrip().startswith("Translate the \"text\" of every segment"):
+            segments = json.loads(text[text.index("\n[") + 1 :])
+            return json.dumps([{"id": s["id"], "text": f"EN<{s['text']}>"} for s in segments])
+        return f"EN<{text}>"
+
+
+@pytest.fixture
+def make_translator(tmp_path: Path) -> Callable[..., Translator]:
+    """Build a translator whose cache lives under ``tmp_path``.
+
+    Keyword arguments override ``TranslatorConfig`` fields; ``provider``
+    replaces the default ``FakeProvider``.
+    """
+    translators: List[Translator] = []
+
+    def make(provider: Optional[BaseProvider] = None, **overrides) -> Translator:
+        config = TranslatorConfig(cache_dir=str(tmp_path / "cache"), **overrides)
+        translator = Translator(config)
+        translator.provider = provider or FakeProvider()
+        translators.append(translator)
+        return translator
+
+    yield make
+    for translator in translators:
+        translator.dispatcher.shutdown()
+        if translator.memory:
+            translator.memory.backend.close()
+
+
+def write_docs(directory: Path, count: int, body: Callable[[int], str]) -> Path:
+    """Write ``count`` Markdown files named f00.md, f01.md, ... and return the directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        (directory / f"f{index:02d}.md").write_text(body(index), encoding="utf-8")
+    return directory
@@ -0,0 +1,158 @@
+"""Tests for batch jobs against a local stand-in for the providers' batch APIs."""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+from conftest import FakeProvider
+from docs_translator.cli.main import cli
+from docs_translator.translator.batchjob import BatchJobStore
+
+SOURCE = "# Tiêu đề\n\nĐoạn một.\n\nĐoạn hai.\n"
+
+
+def translate(prompt: str) -> str:
+    return "EN<" + prompt.split("\n\n", 1)[-1] + ">"
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Answers the OpenAI and Gemini batch endpoints; every job has expired.
+
+    Only the first request of a job finished before it expired.
+    """
+
+    jobs = {}  # Job ID -> list of (custom ID, user prompt)
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body, content_type="application/json"):
+        data = body.encode("utf-8") if isinstance(body, str) else json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("content-type", content_type)
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _openai_batch(self, job_id):
+        return {
+            "id": job_id,
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": f"in-{job_id}",
+            "completion_window": "24h",
+            "status": "expired",
+            "created_at": 0,
+            "output_file_id": f"out-{job_id}",
+        }
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["content-length"])).decode("utf-8", "replace")
+        job_id = f"job{len(self.jobs)}"
+        if self.path == "/v1/files":
+            lines = [json.loads(line) for line in body.splitlines() if '"custom_id"' in line]
+            self.jobs[job_id] = [
+                (line["custom_id"], line["body"]["messages"][-1]["content"]) for line in lines
+            ]
+            self._reply(
+                {
+                    "id": job_id,
+                    "object": "file",
+                    "bytes": 0,
+                    "created_at": 0,
+                    "filename": "requests.jsonl",
+                    "purpose": "batch",
+                }
+            )
+        elif self.path == "/v1/batches":
+            self._reply(self._openai_batch(json.loads(body)["input_file_id"]))
+        elif self.path.endswith(":batchGenerateContent"):
+            requests = json.loads(body)["batch"]["input_config"]["requests"]["requests"]
+            self.jobs[f"batches/{job_id}"] = [
+                (item["metadata"]["key"], item["request"]["contents"][0]["parts"][0]["text"])
+                for item in requests
+            ]
+            self._reply({"name": f"batches/{job_id}"})
+
+    def do_GET(self):
+        if self.path.startswith("/v1/batches/"):
+            self._reply(self._openai_batch(self.path.rsplit("/", 1)[1]))
+        elif match := re.fullmatch(r"/v1/files/out-(\w+)/content", self.path):
+            custom_id, prompt = self.jobs[match.group(1)][0]
+            choices = [{"message": {"content": translate(prompt)}}]
+            response = {"status_code": 200, "body": {"choices": choices}}
+            self._reply(json.dumps({"custom_id": custom_id, "response": response}), "text/plain")
+        elif match := re.fullmatch(r"/v1beta/(batches/\w+)", self.path):
+            key, prompt = self.jobs[match.group(1)][0]
+            candidates = [{"content": {"parts": [{"text": translate(prompt)}]}}]
+            inlined = [{"metadata": {"key": key}, "response": {"candidates": candidates}}]
+            self._reply(
+                {
+                    "name": match.group(1),
+                    "metadata": {"state": "BATCH_STATE_EXPIRED"},
+                    "response": {"inlinedResponses": {"inlinedResponses": inlined}},
+                }
+            )
+
+
+@pytest.fixture
+def stand_in():
+    StandIn.jobs = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.mark.parametrize("provider_name, path", [("openai", "/v1"), ("gemini", "")])
+def test_expired_job_keeps_what_finished_in_time(
+    tmp_path, make_translator, monkeypatch, stand_in, provider_name, path
+):
+    for variable in ("OPENAI_API_KEY", "GOOGLE_API_KEY", "GEMINI_API_KEY"):
+        monkeypatch.setenv(variable, "test")
+    source = tmp_path / "doc.md"
+    source.write_text(SOURCE, encoding="utf-8")
+    live = FakeProvider()
+    translator = make_translator(provider=live)
+    translator.config.switch_provider(provider_name)
+    translator.config.get_active_provider().base_url = stand_in + path
+
+    jobs = translator.submit_batch_job(str(source), str(tmp_path / "doc_en.md"), "vi", "en")
+    assert [len(job.requests) for job in jobs] == [3]
+
+    results = translator.collect_batch_jobs()
+
+    assert [result.success for result in results] == [True]
+    assert (tmp_path / "doc_en.md").read_text(encoding="utf-8") == (
+        "# EN<Tiêu đề>\n\nEN<Đoạn một.>\n\nEN<Đoạn hai.>\n"
+    )
+    # The first request came back before expiry; the other two went live
+    assert len(live.calls) == 2 and not any("Tiêu đề" in call for call in live.calls)
+    assert BatchJobStore(translator.config.cache_dir).load() == []
+
+
+def test_clearing_the_cache_keeps_uncollected_jobs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache_dir = tmp_path / ".translation_cache"
+    (cache_dir / "nested").mkdir(parents=True)
+    (cache_dir / "translation_memory.db").write_bytes(b"")
+    (cache_dir / "build_manifest.json").write_text("{}", encoding="utf-8")
+    job = {
+        "job_id": "job0",
+        "provider": "openai",
+        "model": "gpt-4o-mini",
+        "source_lang": "vi",
+        "target_lang": "en",
+    }
+    (cache_dir / BatchJobStore.FILENAME).write_text(json.dumps({"jobs": [job]}), encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["config", "cache", "--clear"])
+
+    assert result.exit_code == 0, result.output
+    assert "Kept 1 batch job" in result.output
+    assert sorted(path.name for path in cache_dir.iterdir()) == [BatchJobStore.FILENAME]
+    assert [job.job_id for job in BatchJobStore(str(cache_dir)).load()] == ["job0"]
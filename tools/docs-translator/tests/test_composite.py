@@ -0,0 +1,62 @@
+"""Tests for failover and circuit breaking across pool members."""
+
+import pytest
+
+from conftest import FakeProvider
+from docs_translator.translator.composite import CircuitBreaker, CompositeProvider
+from docs_translator.translator.providers import TransientError, TranslationError
+
+
+class Down(FakeProvider):
+    """Every request fails with a server error."""
+
+    def translate(self, text: str, system_prompt: str) -> str:
+        self.calls.append(text)
+        raise TransientError("Fake API error: 503 unavailable")
+
+
+def pool(*members):
+    composite = CompositeProvider([(member, 1.0) for member in members])
+    # Fixed order: the first member, then the second
+    composite._order = lambda tokens: list(composite.entries)
+    return composite
+
+
+def test_server_errors_fail_over_and_open_the_breaker():
+    down, up = Down(), FakeProvider()
+    composite = pool(down, up)
+
+    for number in range(CircuitBreaker.FAILURE_THRESHOLD):
+        assert composite.translate(f"Đoạn {number}", "") == f"EN<Đoạn {number}>"
+
+    assert composite.entries[0].breaker.is_open
+    composite.translate("Đoạn tiếp", "")
+    assert len(down.calls) == CircuitBreaker.FAILURE_THRESHOLD
+
+
+def test_rejected_request_is_raised_without_failover():
+    first, second = FakeProvider(reject=["BROKEN"]), FakeProvider()
+    composite = pool(first, second)
+
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD + 1):
+        with pytest.raises(TranslationError, match="400") as raised:
+            composite.translate("Đoạn BROKEN", "")
+        assert not isinstance(raised.value, TransientError)
+
+    assert second.calls == []
+    assert not composite.entries[0].breaker.is_open
+    assert composite.translate("Đoạn", "") == "EN<Đoạn>"
+
+
+def test_rejected_probe_closes_the_breaker():
+    member = FakeProvider(reject=["BROKEN"])
+    composite = pool(member)
+    breaker = composite.entries[0].breaker
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        breaker.record_failure()
+    breaker._opened_at -= breaker.COOLDOWN  # Cooldown over: the next request probes
+
+    with pytest.raises(TranslationError):
+        composite.translate("Đoạn BROKEN", "")
+
+    assert not breaker.is_open and breaker.allow()
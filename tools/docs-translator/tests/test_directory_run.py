@@ -0,0 +1,166 @@
+"""Tests for directory runs through the staged pipeline."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from conftest import FakeProvider, write_docs
+from docs_translator.translator.core import _DirectoryRun
+
+BATCH = 'Translate the "text" of every segment'
+
+
+def body(index: int) -> str:
+    broken = " BROKEN" if index == 5 else ""
+    return f"# Tiêu đề {index}\n\nĐoạn thứ nhất {index}.{broken}\n\nĐoạn thứ hai {index}.\n"
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_rejected_unit_fails_only_its_file(tmp_path, make_translator, use_async):
+    docs = write_docs(tmp_path / "docs", 22, body)
+    provider = FakeProvider(reject=["BROKEN"])
+    translator = make_translator(provider=provider)
+
+    if use_async:
+        run = translator.atranslate_directory(str(docs), str(tmp_path / "out"), "vi", "en")
+        results = asyncio.run(run)
+    else:
+        results = translator.translate_directory(
+            str(docs), str(tmp_path / "out"), "vi", "en", show_progress=False
+        )
+
+    failed = [result for result in results if not result.success]
+    assert [result.source_path for result in failed] == [str(docs / "f05.md")]
+    assert "400 bad request" in failed[0].error
+    written = sorted(path.name for path in (tmp_path / "out").iterdir())
+    assert len(written) == 21 and "f05_en.md" not in written
+    assert "EN<Đoạn thứ hai 7.>" in (tmp_path / "out" / "f07_en.md").read_text(encoding="utf-8")
+
+
+def test_rejected_batch_is_retried_unit_by_unit(tmp_path, make_translator):
+    docs = write_docs(tmp_path / "docs", 3, body)
+    (docs / "f05.md").write_text(body(5), encoding="utf-8")
+    provider = FakeProvider(reject=["BROKEN"])
+    translator = make_translator(provider=provider, batch_size=8, fuzzy_threshold=0)
+
+    results = translator.translate_directory(
+        str(docs), str(tmp_path / "out"), "vi", "en", show_progress=False
+    )
+
+    failed = [result.source_path for result in results if not result.success]
+    assert failed == [str(docs / "f05.md")]
+    # The units sharing a request with the broken one were sent on their own
+    rejected = next(call for call in provider.calls if "BROKEN" in call and BATCH in call)
+    segments = json.loads(rejected[rejected.index("\n[") + 1 :])
+    assert len(segments) > 1
+    for segment in segments:
+        assert f"Context: {segment['context']}\n\n{segment['text']}" in provider.calls
+    assert (tmp_path / "out" / "f02_en.md").exists()
+
+
+def break_parse(docs, out, monkeypatch):
+    (docs / "f03.md").unlink()
+    (docs / "f03.md").mkdir()  # Matches the glob, but cannot be read
+
+
+def break_plan(docs, out, monkeypatch):
+    queue_misses = _DirectoryRun._queue_misses
+
+    def failing(self, pending):
+        if pending.result.source_path.endswith("f03.md"):
+            raise RuntimeError("planning failed")
+        queue_misses(self, pending)
+
+    monkeypatch.setattr(_DirectoryRun, "_queue_misses", failing)
+
+
+def break_write(docs, out, monkeypatch):
+    (out / "f03_en.md").mkdir(parents=True)  # The output path is taken
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+@pytest.mark.parametrize("breaker", [break_parse, break_plan, break_write])
+def test_broken_file_does_not_stop_the_others(
+    tmp_path, make_translator, monkeypatch, breaker, use_async
+):
+    docs = write_docs(tmp_path / "docs", 12, lambda index: f"# Tệp {index}\n\nĐoạn {index}.\n")
+    out = tmp_path / "out"
+    breaker(docs, out, monkeypatch)
+    translator = make_translator()
+
+    if use_async:
+        results = asyncio.run(translator.atranslate_directory(str(docs), str(out), "vi", "en"))
+    else:
+        results = translator.translate_directory(
+            str(docs), str(out), "vi", "en", show_progress=False
+        )
+
+    failed = [result.source_path for result in results if not result.success]
+    assert failed == [str(docs / "f03.md")]
+    for index in range(12):
+        if index != 3:
+            assert (out / f"f{index:02d}_en.md").read_text(encoding="utf-8").startswith("# EN<")
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_unit_shared_across_files_is_requested_once(tmp_path, make_translator, use_async):
+    shared = "Đoạn chung cho mọi tệp."
+    docs = write_docs(
+        tmp_path / "docs", 10, lambda index: f"# Tệp {index}\n\n{shared}\n\nĐoạn riêng {index}.\n"
+    )
+    provider = FakeProvider()
+    translator = make_translator(provider=provider)
+
+    if use_async:
+        run = translator.atranslate_directory(str(docs), str(tmp_path / "out"), "vi", "en")
+        results = asyncio.run(run)
+    else:
+        results = translator.translate_directory(
+            str(docs), str(tmp_path / "out"), "vi", "en", show_progress=False
+        )
+
+    assert all(result.success for result in results)
+    assert provider.calls.count(f"Context: paragraph\n\n{shared}") == 1
+    assert len(provider.calls) == 10 * 2 + 1
+    for index in range(10):
+        output = (tmp_path / "out" / f"f{index:02d}_en.md").read_text(encoding="utf-8")
+        assert f"EN<{shared}>" in output
+
+
+class WaitsForOutput(FakeProvider):
+    """Holds the request for "FIRST" until another file's output is on disk."""
+
+    def __init__(self, output: Path):
+        super().__init__()
+        self.output = output
+        self.written_meanwhile = False
+
+    def translate(self, text: str, system_prompt: str) -> str:
+        if "FIRST" in text:
+            deadline = time.monotonic() + 5
+            while not self.output.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.written_meanwhile = self.output.exists()
+        return super().translate(text, system_prompt)
+
+
+def test_files_are_written_while_earlier_requests_are_in_flight(tmp_path, make_translator):
+    docs = write_docs(tmp_path / "docs", 6, lambda index: f"# Tệp {index}\n\nĐoạn {index}.\n")
+    (docs / "f00.md").write_text("# Tệp 0\n\nĐoạn FIRST.\n", encoding="utf-8")
+    out = tmp_path / "out"
+    provider = WaitsForOutput(out / "f05_en.md")
+    translator = make_translator(provider=provider)
+
+    results = translator.translate_directory(
+        str(docs), str(out), "vi", "en", show_progress=False
+    )
+
+    assert all(result.success for result in results)
+    # The last file went through every stage while the first one's request was held
+    assert provider.written_meanwhile
+    # Durations run from the start of the directory to the file being written
+    durations = {Path(result.source_path).name: result.duration_seconds for result in results}
+    assert durations["f05.md"] < durations["f00.md"]
@@ -0,0 +1,87 @@
+"""Tests for retries and the concurrency window in the dispatcher and batch requests."""
+
+import json
+import time
+
+from conftest import FakeProvider
+from docs_translator.translator.dispatcher import Dispatcher
+from docs_translator.translator.providers import RateLimitError, TransientError
+
+BATCH = 'Translate the "text" of every segment'
+
+
+class FlakyFollowUp(FakeProvider):
+    """Leaves the last segment out of batch responses; its follow-up fails once."""
+
+    def __init__(self):
+        super().__init__()
+        self.failed = False
+
+    def translate(self, text: str, system_prompt: str) -> str:
+        response = super().translate(text, system_prompt)
+        if text.startswith(BATCH):
+            return json.dumps(json.loads(response)[:-1])
+        if not self.failed:
+            self.failed = True
+            raise TransientError("Fake API error: 503 unavailable")
+        return response
+
+
+def test_follow_up_retry_keeps_batch_translations(tmp_path, make_translator):
+    source = tmp_path / "doc.md"
+    source.write_text("Một.\n\nHai.\n\nBa.\n", encoding="utf-8")
+    provider = FlakyFollowUp()
+    translator = make_translator(provider=provider, batch_size=8)
+    translator.dispatcher.BACKOFF_BASE = 0.01
+
+    result = translator.translate_file(str(source), str(tmp_path / "doc_en.md"), "vi", "en")
+
+    assert result.success
+    output = (tmp_path / "doc_en.md").read_text(encoding="utf-8")
+    assert output == "EN<Một.>\n\nEN<Hai.>\n\nEN<Ba.>\n"
+    # One batch request, then the follow-up for "Ba." twice
+    assert [call.startswith(BATCH) for call in provider.calls] == [True, False, False]
+
+
+def test_retry_does_not_hold_up_other_tasks():
+    dispatcher = Dispatcher(concurrency=1, adaptive=False)
+    dispatcher.BACKOFF_BASE = 0.4
+    attempts = []
+
+    def flaky():
+        attempts.append("flaky")
+        if len(attempts) == 1:
+            raise TransientError("Fake API error: 503 unavailable")
+        return "flaky"
+
+    finished = []
+    start = time.monotonic()
+    results = dispatcher.run(
+        [flaky, lambda: "steady"], on_done=lambda index, result: finished.append(result)
+    )
+    dispatcher.shutdown()
+
+    assert results == ["flaky", "steady"]
+    # The second task ran while the first waited for its retry
+    assert finished == ["steady", "flaky"]
+    assert time.monotonic() - start >= 0.2
+
+
+class LimitedOnce(FakeProvider):
+    def translate(self, text: str, system_prompt: str) -> str:
+        if not self.calls:
+            self.calls.append(text)
+            raise RateLimitError("Fake rate limit: 429")
+        return super().translate(text, system_prompt)
+
+
+def test_rate_limits_are_reported_with_the_window(tmp_path, make_translator):
+    source = tmp_path / "doc.md"
+    source.write_text("Một.\n", encoding="utf-8")
+    translator = make_translator(provider=LimitedOnce(), concurrency=4)
+    translator.dispatcher.BACKOFF_BASE = 0.01
+
+    result = translator.translate_file(str(source), str(tmp_path / "doc_en.md"), "vi", "en")
+
+    assert result.success
+    assert (result.concurrency_window, result.throttles, result.latency_spikes) == (2, 1, 0)
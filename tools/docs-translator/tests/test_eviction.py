@@ -0,0 +1,89 @@
+"""Tests for bounding the translation memory with an eviction policy."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from docs_translator.config.manager import EvictionPolicy
+from docs_translator.translator.core import TranslationMemory
+from docs_translator.translator.storage import TranslationMemoryEntry
+
+
+def stored(memory: TranslationMemory, key: str, days_old: float = 0, **usage):
+    """Put an entry straight into the backend with the given age and usage."""
+    timestamp = (datetime.now() - timedelta(days=days_old)).isoformat()
+    memory.backend.put_many([
+        TranslationMemoryEntry(
+            source_hash=key,
+            source_text=f"source {key}",
+            target_text=f"target {key}",
+            source_lang="vi",
+            target_lang="en",
+            context="paragraph",
+            timestamp=timestamp,
+            model=usage.pop("model", "fake-model"),
+            **usage,
+        )
+    ])
+
+
+def keys(memory: TranslationMemory):
+    return sorted(entry.source_hash for entry in memory.backend.iter_entries())
+
+
+@pytest.fixture(params=["sqlite", "journal"])
+def memory(tmp_path, request):
+    memory = TranslationMemory(str(tmp_path), backend=request.param)
+    yield memory
+    memory.backend.close()
+
+
+def test_lru_evicts_least_recently_hit(memory):
+    stored(memory, "never-hit", days_old=3)
+    stored(memory, "hit-long-ago", days_old=5, hits=9, last_hit="2024-01-01T00:00:00")
+    stored(memory, "hit-recently", days_old=5, hits=1, last_hit=datetime.now().isoformat())
+    stored(memory, "new", days_old=0)
+
+    assert memory.evict(EvictionPolicy(max_entries=2)) == 2
+    assert keys(memory) == ["hit-recently", "new"]
+
+
+def test_lfu_evicts_fewest_hits(memory):
+    stored(memory, "cold", hits=0)
+    stored(memory, "warm", hits=3, last_hit="2024-01-01T00:00:00")
+    stored(memory, "hot", hits=7, last_hit="2024-01-01T00:00:00")
+
+    assert memory.evict(EvictionPolicy(max_entries=2, strategy="lfu")) == 1
+    assert keys(memory) == ["hot", "warm"]
+
+
+def test_ttl_and_model_evictions_apply_before_size_bounds(memory):
+    stored(memory, "expired", days_old=40, hits=50, last_hit=datetime.now().isoformat())
+    stored(memory, "retired-model", model="old-model")
+    stored(memory, "fresh")
+
+    policy = EvictionPolicy(ttl_days=30, evict_models=["old-model"], max_entries=5)
+    assert memory.evict(policy) == 2
+    assert keys(memory) == ["fresh"]
+
+
+def test_max_bytes_keeps_the_hottest_entries_within_budget(memory):
+    for number in range(4):
+        stored(memory, f"k{number}", hits=number, last_hit=f"2024-01-0{number + 1}T00:00:00")
+    entry_size = len("source k0") + len("target k0")
+
+    assert memory.evict(EvictionPolicy(max_bytes=2 * entry_size)) == 2
+    assert keys(memory) == ["k2", "k3"]
+
+
+def test_eviction_runs_only_after_the_memory_grew(memory):
+    memory.policy = EvictionPolicy(max_entries=1)
+    stored(memory, "old", days_old=1)
+    stored(memory, "older", days_old=2)
+    assert memory.evict_if_grown() == 0  # Nothing was added through this memory
+    assert keys(memory) == ["old", "older"]
+
+    memory.set("Đoạn mới", "New paragraph", "vi", "en", "paragraph", "fake-model")
+    assert memory.evict_if_grown() == 2
+    assert memory.backend.count() == 1
+    assert memory.evict_if_grown() == 0
@@ -0,0 +1,49 @@
+"""Tests for the latency samples that decide when to hedge a request."""
+
+import asyncio
+import time
+
+import pytest
+
+from docs_translator.config.manager import HedgeSettings
+from docs_translator.translator.hedging import Hedger
+from docs_translator.translator.ratelimit import RateLimiter
+
+
+@pytest.fixture
+def limiter():
+    limiter = RateLimiter(rpm=600)  # One request per 0.1s once the burst is spent
+    for _ in range(int(limiter._requests.capacity)):
+        limiter.reserve()
+    return limiter
+
+
+def test_rate_limiter_wait_is_not_latency(limiter):
+    hedger = Hedger(HedgeSettings())
+
+    def request():
+        limiter.acquire()
+        time.sleep(0.01)
+        return "ok"
+
+    start = time.monotonic()
+    for _ in range(3):
+        assert hedger.call("fake-model", 0, request) == "ok"
+
+    assert time.monotonic() - start > 0.25
+    assert hedger._tracker("fake-model").quantile(1.0, 0) < 0.05
+
+
+def test_async_rate_limiter_wait_is_not_latency(limiter):
+    hedger = Hedger(HedgeSettings())
+
+    async def request():
+        await limiter.aacquire()
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(hedger.acall("fake-model", 0, request) for _ in range(3)))
+
+    assert asyncio.run(run()) == ["ok"] * 3
+    assert hedger._tracker("fake-model").quantile(1.0, 0) < 0.05
@@ -0,0 +1,81 @@
+"""Tests for skipping up-to-date files with the build manifest."""
+
+import os
+
+import pytest
+
+from conftest import FakeProvider, write_docs
+
+
+def body(index: int) -> str:
+    return f"# Tệp {index}\n\nĐoạn {index}.\n"
+
+
+@pytest.fixture
+def run(tmp_path, make_translator):
+    """Translate the docs directory with a fresh translator, as a new process would."""
+    docs = write_docs(tmp_path / "docs", 3, body)
+
+    def run(**overrides):
+        provider = FakeProvider()
+        translator = make_translator(provider=provider, **overrides)
+        results = translator.translate_directory(
+            str(docs), str(tmp_path / "out"), "vi", "en", show_progress=False
+        )
+        assert all(result.success for result in results)
+        skipped = sorted(
+            os.path.basename(result.source_path) for result in results if result.up_to_date
+        )
+        return skipped, provider
+
+    run.docs = docs
+    return run
+
+
+def test_second_run_skips_unchanged_files(run):
+    skipped, provider = run()
+    assert skipped == [] and len(provider.calls) == 6
+
+    skipped, provider = run()
+    assert skipped == ["f00.md", "f01.md", "f02.md"]
+    assert provider.calls == []
+
+
+def test_touched_file_with_same_content_is_skipped(run):
+    run()
+    path = run.docs / "f01.md"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    skipped, _ = run()
+    assert skipped == ["f00.md", "f01.md", "f02.md"]
+
+
+def test_edited_source_and_missing_output_are_rebuilt(run, tmp_path):
+    run()
+    (run.docs / "f01.md").write_text(body(1) + "\nĐoạn mới.\n", encoding="utf-8")
+    (tmp_path / "out" / "f02_en.md").unlink()
+
+    skipped, provider = run()
+    assert skipped == ["f00.md"]
+    assert provider.calls == ["Context: paragraph\n\nĐoạn mới."]
+    assert (tmp_path / "out" / "f02_en.md").exists()
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"temperature": 0.9},
+        {"batch_size": 4},
+        {"translation_style": "natural"},
+        {"preserve_terms": ["Tệp"]},
+        {"masking": False},
+    ],
+)
+def test_settings_change_rebuilds_every_file(run, change):
+    run()
+    skipped, _ = run(**change)
+    assert skipped == []
+    # And the new settings are recorded in turn
+    skipped, _ = run(**change)
+    assert len(skipped) == 3
@@ -0,0 +1,73 @@
+"""Tests for whitespace canonicalisation of cache keys and request text."""
+
+from conftest import FakeProvider
+from docs_translator.translator.masking import canonicalize, relayout
+
+
+def test_soft_breaks_collapse():
+    assert canonicalize("wrapped\nat a  different\ncolumn") == "wrapped at a different column"
+
+
+def test_two_space_hard_breaks_are_kept():
+    text = "Địa chỉ: 12 Lê Lợi  \nQuận 1  \nTP HCM"
+    assert canonicalize(text) == text
+
+
+def test_longer_trailing_spaces_normalise_to_two():
+    assert canonicalize("a    \nb") == "a  \nb"
+
+
+def test_backslash_breaks_and_table_rows_are_kept():
+    assert canonicalize("a\\\nb") == "a\\\nb"
+    assert canonicalize("| a |\n| b |") == "| a |\n| b |"
+
+
+def test_relayout_wraps_to_the_longest_wrapped_source_line():
+    source = "một hai ba\nbốn năm sáu bảy\ntám"
+    translation = "one two three four five six seven eight"
+    assert relayout(translation, source) == "one two three\nfour five six\nseven eight"
+
+
+def test_relayout_leaves_unwrapped_sources_and_structure_alone():
+    long_line = "word " * 30
+    assert relayout(long_line, "một dòng") == long_line
+    translation = "first line is long enough  \nsecond\n| table | row that is long |"
+    assert relayout(translation, "ab cd\nef") == (
+        "first\nline\nis\nlong\nenough  \nsecond\n| table | row that is long |"
+    )
+
+
+def test_relayout_never_breaks_inside_code_spans():
+    assert relayout("run `make all now` today", "abcdef\nab") == "run\n`make all now`\ntoday"
+
+
+def test_wrapped_paragraph_is_sent_folded_and_written_wrapped(tmp_path, make_translator):
+    source = tmp_path / "doc.md"
+    source.write_text("Dòng thứ nhất được\nngắt ở cột hẹp.\n", encoding="utf-8")
+    provider = FakeProvider()
+    translator = make_translator(provider=provider)
+
+    translator.translate_file(str(source), str(tmp_path / "doc_en.md"), "vi", "en")
+
+    assert provider.calls == ["Context: paragraph\n\nDòng thứ nhất được ngắt ở cột hẹp."]
+    output = (tmp_path / "doc_en.md").read_text(encoding="utf-8")
+    assert output == "EN<Dòng thứ nhất\nđược ngắt ở cột\nhẹp.>\n"
+
+
+def test_entry_keyed_by_raw_text_is_migrated(make_translator):
+    text = "Chạy `make  build`\nrồi kiểm tra."
+    translator = make_translator(provider=FakeProvider())
+    memory = translator.memory
+    # As stored before keys were masked and canonical
+    memory.set(text, "Run `make  build`\nthen check.", "vi", "en", "paragraph", "old-model")
+
+    assert translator.translate_text(text, "vi", "en") == "Run `make  build`\nthen check."
+    assert translator.provider.calls == []
+    assert (memory.hits, memory.misses) == (1, 0)
+
+    masked = translator._canonicalize(text)
+    assert memory.get(masked.text, "vi", "en", "paragraph") == "Run ⟦1⟧ then check."
+    # Now found under the current key, with other code in the span
+    edited = "Chạy `make test` rồi kiểm tra."
+    assert translator.translate_text(edited, "vi", "en") == "Run `make test` then check."
+    assert translator.provider.calls == []
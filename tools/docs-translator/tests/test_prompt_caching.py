@@ -0,0 +1,67 @@
+"""Tests for keeping the stable part of every request in the cached system prompt."""
+
+import threading
+import time
+
+from docs_translator.translator.prompts import PromptBuilder
+from docs_translator.translator.providers import ClaudeProvider, GeminiProvider
+
+TERMS = [f"Term{number}" for number in range(200)]
+
+
+def test_batch_and_update_instructions_live_in_the_system_prompt():
+    system_prompt = PromptBuilder.build_system_prompt("vi", "en", [])
+    batch = PromptBuilder.build_batch_prompt([{"id": 1, "context": "heading", "text": "Tệp"}])
+    update = PromptBuilder.build_update_prompt("Mới", "Cũ", "Old", "paragraph")
+
+    assert "Do not merge, split or skip segments" in system_prompt
+    assert "keep the rest of the previous translation word for word" in system_prompt
+    assert "Do not merge" not in batch and "word for word" not in update
+
+
+def test_every_preserve_term_is_listed():
+    system_prompt = PromptBuilder.build_system_prompt("vi", "en", TERMS)
+    assert all(f'"{term}"' in system_prompt for term in TERMS)
+
+
+def test_claude_marks_the_system_prompt_once_it_reaches_the_minimum():
+    claude = ClaudeProvider(api_key="test", model="claude-sonnet-4")
+
+    short = claude._request("Tệp", PromptBuilder.build_system_prompt("vi", "en", []))
+    assert isinstance(short["system"], str)
+
+    long = claude._request("Tệp", PromptBuilder.build_system_prompt("vi", "en", TERMS))
+    assert long["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_gemini_builds_each_model_once_without_holding_up_the_others():
+    gemini = GeminiProvider(api_key="test", model="gemini-1.5-flash")
+    gemini._client = object()
+    builds = []
+    first_started = threading.Event()
+
+    def build_model(system_prompt):
+        builds.append(system_prompt)
+        if system_prompt == "first":
+            first_started.set()
+            time.sleep(0.3)  # Creating the cached content
+        return f"model for {system_prompt}", None
+
+    gemini._build_model = build_model
+    models = []
+    threads = [
+        threading.Thread(target=lambda: models.append(gemini._get_model("first")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    first_started.wait()
+
+    started = time.monotonic()
+    assert gemini._get_model("second") == "model for second"
+    assert time.monotonic() - started < 0.2
+    for thread in threads:
+        thread.join()
+
+    assert models == ["model for first"] * 4
+    assert sorted(builds) == ["first", "second"]
@@ -0,0 +1,75 @@
+"""Tests for mapping provider SDK errors to translation errors."""
+
+import pytest
+
+from docs_translator.translator.providers import (
+    GeminiProvider,
+    OpenAIProvider,
+    RateLimitError,
+    TransientError,
+    TranslationError,
+)
+
+
+class StatusError(Exception):
+    """SDK-style exception carrying an HTTP status."""
+
+    def __init__(self, message: str, status_code=None, code=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+
+
+@pytest.fixture
+def gemini():
+    return GeminiProvider(api_key="test", model="gemini-1.5-flash")
+
+
+@pytest.fixture
+def openai():
+    return OpenAIProvider(api_key="test", model="gpt-4o-mini")
+
+
+def test_gemini_invalid_key_is_not_a_rate_limit(gemini):
+    e = StatusError(
+        "400 POST https://generativelanguage.googleapis.com/v1beta/models/"
+        "gemini-1.5-flash:generateContent: API key not valid. Please pass a valid API key.",
+        code=400,
+    )
+    converted = gemini._convert_error(e)
+    assert not isinstance(converted, TransientError)
+    assert isinstance(converted, TranslationError)
+
+
+def test_openai_bad_request_mentioning_accurate_is_not_a_rate_limit(openai):
+    e = StatusError("Error code: 400 - 'Please give an accurate value for max_tokens'", 400)
+    converted = openai._convert_error(e)
+    assert not isinstance(converted, TransientError)
+
+
+def test_status_429_is_a_rate_limit(openai):
+    assert isinstance(openai._convert_error(StatusError("Too busy", 429)), RateLimitError)
+
+
+def test_known_status_overrides_message(gemini):
+    e = StatusError("Quota exceeded for rate limit metric", code=400)
+    assert not isinstance(gemini._convert_error(e), TransientError)
+
+
+@pytest.mark.parametrize(
+    "message",
+    ["Rate limit reached for requests", "HTTP 429 received", "Resource exhausted: quota"],
+)
+def test_rate_limit_message_without_status(gemini, message):
+    assert isinstance(gemini._convert_error(Exception(message)), RateLimitError)
+
+
+def test_message_without_status_needs_whole_words(openai):
+    converted = openai._convert_error(Exception("could not generate an accurate answer"))
+    assert not isinstance(converted, TransientError)
+
+
+def test_server_error_is_transient(openai):
+    converted = openai._convert_error(StatusError("Internal server error", 500))
+    assert isinstance(converted, TransientError)
+    assert not isinstance(converted, RateLimitError)
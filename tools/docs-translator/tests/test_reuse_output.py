@@ -0,0 +1,91 @@
+"""Tests for keeping the unchanged blocks of an existing output, reviewer edits included."""
+
+import asyncio
+
+import pytest
+
+from conftest import FakeProvider
+
+SOURCE = "# Tiêu đề\n\nĐoạn một.\n\nĐoạn hai.\n"
+
+
+@pytest.fixture
+def paths(tmp_path):
+    source = tmp_path / "docs" / "doc.md"
+    source.parent.mkdir()
+    source.write_text(SOURCE, encoding="utf-8")
+    return source, tmp_path / "out" / "doc_en.md"
+
+
+def translate(make_translator, source, output, use_directory=False, **kwargs):
+    provider = FakeProvider()
+    translator = make_translator(provider=provider)
+    if use_directory:
+        results = translator.translate_directory(
+            str(source.parent), str(output.parent), "vi", "en", show_progress=False, **kwargs
+        )
+        result = results[0]
+    else:
+        result = translator.translate_file(str(source), str(output), "vi", "en", **kwargs)
+    assert result.success
+    return result, provider
+
+
+def edit_and_change(source, output):
+    """A reviewer rewords the first paragraph; the author rewrites the second."""
+    edited = output.read_text(encoding="utf-8").replace("EN<Đoạn một.>", "Paragraph one.")
+    output.write_text(edited, encoding="utf-8")
+    source.write_text(SOURCE.replace("Đoạn hai.", "Đoạn hai, sửa lại."), encoding="utf-8")
+
+
+@pytest.mark.parametrize("use_directory", [False, True])
+def test_reviewer_edit_survives_a_change_elsewhere(make_translator, paths, use_directory):
+    source, output = paths
+    translate(make_translator, source, output, use_directory)
+    edit_and_change(source, output)
+
+    result, provider = translate(make_translator, source, output, use_directory)
+
+    assert output.read_text(encoding="utf-8") == (
+        "# EN<Tiêu đề>\n\nParagraph one.\n\nEN<Đoạn hai, sửa lại.>\n"
+    )
+    assert provider.calls == ["Context: paragraph\n\nĐoạn hai, sửa lại."]
+    assert result.reused_blocks == 2
+
+
+def test_async_run_keeps_the_edit_too(make_translator, paths):
+    source, output = paths
+    translate(make_translator, source, output)
+    edit_and_change(source, output)
+
+    translator = make_translator(provider=FakeProvider())
+    result = asyncio.run(translator.atranslate_file(str(source), str(output), "vi", "en"))
+
+    assert result.success
+    assert "Paragraph one." in output.read_text(encoding="utf-8")
+
+
+def test_force_translates_every_block(make_translator, paths):
+    source, output = paths
+    translate(make_translator, source, output)
+    edit_and_change(source, output)
+
+    result, _ = translate(make_translator, source, output, force=True)
+
+    assert "EN<Đoạn một.>" in output.read_text(encoding="utf-8")
+    assert result.reused_blocks == 0
+
+
+def test_output_with_a_different_layout_is_translated_in_full(make_translator, paths):
+    source, output = paths
+    translate(make_translator, source, output)
+    edit_and_change(source, output)
+    with output.open("a", encoding="utf-8") as stream:
+        stream.write("\nA paragraph the reviewer added.\n")
+
+    result, _ = translate(make_translator, source, output)
+
+    assert result.reused_blocks == 0
+    assert output.read_text(encoding="utf-8") == (
+        "# EN<Tiêu đề>\n\nEN<Đoạn một.>\n\nEN<Đoạn hai, sửa lại.>\n"
+    )
@@ -0,0 +1,127 @@
+"""Tests for the translation memory storage backends."""
+
+import json
+
+import pytest
+
+from docs_translator.translator.storage import (
+    BACKENDS,
+    JSONBackend,
+    JournalBackend,
+    SQLiteBackend,
+    TranslationMemoryEntry,
+    create_backend,
+)
+
+
+def entry(number: int, **overrides) -> TranslationMemoryEntry:
+    fields = dict(
+        source_hash=f"hash-{number}",
+        source_text=f"Đoạn {number}",
+        target_text=f"Paragraph {number}",
+        source_lang="vi",
+        target_lang="en",
+        context="paragraph",
+        timestamp=f"2024-01-01T00:00:{number:02d}",
+        model="fake-model",
+    )
+    fields.update(overrides)
+    return TranslationMemoryEntry(**fields)
+
+
+@pytest.mark.parametrize("name", sorted(BACKENDS))
+def test_round_trip_survives_reopening(tmp_path, name):
+    backend = create_backend(name, str(tmp_path))
+    backend.put_many([entry(1), entry(2), entry(3)])
+    backend.put_many([entry(2, target_text="Second paragraph")])
+    assert backend.delete_many(["hash-3", "missing"]) == 1
+    backend.record_hits({"hash-1": (2, "2024-02-01T00:00:00")})
+    backend.flush()
+    backend.close()
+
+    reopened = create_backend(name, str(tmp_path))
+    try:
+        assert reopened.count() == 2
+        assert reopened.get("hash-2").target_text == "Second paragraph"
+        assert reopened.get("hash-3") is None
+        first = reopened.get("hash-1")
+        assert (first.hits, first.last_hit) == (2, "2024-02-01T00:00:00")
+        assert sorted(e.source_hash for e in reopened.iter_entries()) == ["hash-1", "hash-2"]
+        sizes = {usage.key: usage.size for usage in reopened.iter_usage()}
+        assert sizes["hash-1"] == len("Đoạn 1".encode("utf-8")) + len("Paragraph 1")
+    finally:
+        reopened.close()
+
+
+def test_sqlite_imports_a_json_memory_once(tmp_path):
+    legacy = JSONBackend(tmp_path)
+    legacy.put_many([entry(1), entry(2)])
+
+    backend = SQLiteBackend(tmp_path)
+    assert backend.count() == 2
+    backend.delete_many(["hash-1"])
+    backend.close()
+
+    # The JSON file is still there, but is not imported a second time
+    reopened = SQLiteBackend(tmp_path)
+    assert reopened.count() == 1
+    reopened.close()
+
+
+def test_sqlite_reader_sees_committed_writes(tmp_path):
+    writer = SQLiteBackend(tmp_path)
+    writer.put_many([entry(1)])
+    reader = SQLiteBackend(tmp_path, read_only=True)
+    try:
+        assert reader.get("hash-1").target_text == "Paragraph 1"
+        writer.put_many([entry(2)])
+        assert reader.get("hash-2") is not None
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_journal_replays_after_a_crash(tmp_path):
+    live, crashed = tmp_path / "live", tmp_path / "crashed"
+    journal = JournalBackend(live)
+    journal.put_many([entry(1), entry(2)])
+    journal.delete_many(["hash-1"])
+    journal.put_many([entry(3)])
+    journal.flush()
+
+    # The state a crash would leave: appended records, no snapshot, a torn last line
+    crashed.mkdir()
+    records = (live / JournalBackend.JOURNAL_NAME).read_text(encoding="utf-8")
+    assert not (live / JournalBackend.SNAPSHOT_NAME).exists()
+    (crashed / JournalBackend.JOURNAL_NAME).write_text(
+        records + '{"source_hash": "hash-4", "source_te', encoding="utf-8"
+    )
+    journal.close()
+
+    recovered = JournalBackend(crashed)
+    try:
+        assert sorted(e.source_hash for e in recovered.iter_entries()) == ["hash-2", "hash-3"]
+        # New records start on a line of their own after the torn one
+        recovered.put_many([entry(5)])
+        recovered.flush()
+        lines = (crashed / JournalBackend.JOURNAL_NAME).read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[-1])["source_hash"] == "hash-5"
+    finally:
+        recovered.close()
+
+
+def test_journal_compacts_into_the_snapshot_on_close(tmp_path):
+    journal = JournalBackend(tmp_path)
+    journal.put_many([entry(1), entry(2)])
+    journal.delete_many(["hash-2"])
+    journal.close()
+
+    assert not (tmp_path / JournalBackend.JOURNAL_NAME).exists()
+    snapshot = json.loads((tmp_path / JournalBackend.SNAPSHOT_NAME).read_text(encoding="utf-8"))
+    assert list(snapshot["memory"]) == ["hash-1"]
+
+    reopened = JournalBackend(tmp_path)
+    try:
+        assert reopened.count() == 1 and reopened.get("hash-1").target_text == "Paragraph 1"
+    finally:
+        reopened.close()